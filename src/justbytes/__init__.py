@@ -56,6 +56,34 @@ Contents:
 * Configuration classes:
    - StrConfig: :class:`._config.StrConfig`
 
+* Formatters:
+   - Formatter: :class:`._formatter.Formatter`
+   - format_many: :func:`._parallel.format_many`
+
+* Display implementations:
+   - NativeString: :class:`._display.NativeString`
+
+* Caching:
+   - FormatCache: :class:`._cache.FormatCache`
+
+* Interning:
+   - InternTable: :class:`._intern.InternTable`
+
+* Address ranges:
+   - BestFitAllocator: :class:`._allocator.BestFitAllocator`
+   - BuddyAllocator: :class:`._allocator.BuddyAllocator`
+   - SegregatedFitAllocator: :class:`._allocator.SegregatedFitAllocator`
+   - AllocatorStats: :class:`._allocator.AllocatorStats`
+   - ChunkBitmap: :class:`._bitmap.ChunkBitmap`
+   - ExtentMap: :class:`._extent_map.ExtentMap`
+   - ExtentSet: :class:`._extents.ExtentSet`
+   - IntervalTree: :class:`._intervals.IntervalTree`
+
+* Streaming:
+   - ColumnParser: :class:`._stream.ColumnParser`
+   - read_ranges: :func:`._async.read_ranges`
+   - write_ranges: :func:`._async.write_ranges`
+
 * Exception classes:
    - RangeError: :class:`._errors.RangeError`
    - RangeValueError: :class:`._errors.RangeValueError`
@@ -63,6 +91,12 @@ Contents:
 * Range classes:
    - Range: :class:`._size.Range`
    - AI: :class:`._sizes.AI`
+   - RangeArray: :class:`._array.RangeArray`
+   - RangeAccumulator: :class:`._accumulator.RangeAccumulator`
+   - RangeStats: :class:`._stats.RangeStats`
+   - QuantileSketch: :class:`._sketch.QuantileSketch`
+   - RangeHistogram: :class:`._histogram.RangeHistogram`
+   - RangeTopK: :class:`._topk.RangeTopK`
 
 All parts of the public interface of justbytes must be imported directly
 from the top-level justbytes module, as::
@@ -80,6 +114,29 @@ from the top-level justbytes module, as::
 # pylint: disable=invalid-name
 # pylint: disable=wrong-import-position
 
+# ACCUMULATION
+from ._accumulator import RangeAccumulator
+
+# ALLOCATION
+from ._allocator import (
+    AllocatorStats,
+    BestFitAllocator,
+    BuddyAllocator,
+    SegregatedFitAllocator,
+)
+
+# ARRAYS
+from ._array import RangeArray
+
+# ASYNCIO
+from ._async import read_ranges, write_ranges
+
+# BITMAPS
+from ._bitmap import ChunkBitmap
+
+# CACHING
+from ._cache import FormatCache
+
 # CONFIGURATION
 from ._config import (
     BaseConfig,
@@ -98,13 +155,49 @@ from ._constants import BinaryUnits as _BinaryUnits
 from ._constants import DecimalUnits as _DecimalUnits
 from ._constants import RoundingMethods as _RoundingMethods
 
+# DISPLAY
+from ._display import NativeString
+
 # EXCEPTIONS
 from ._errors import RangeError, RangeValueError
 
+# EXTENT MAPS
+from ._extent_map import ExtentMap
+
+# EXTENTS
+from ._extents import ExtentSet
+
+# FORMATTING
+from ._formatter import Formatter
+
+# HISTOGRAMS
+from ._histogram import RangeHistogram
+
+# INTERNING
+from ._intern import InternTable
+
+# INTERVALS
+from ._intervals import IntervalTree
+
+# PARALLEL FORMATTING
+from ._parallel import format_many
+
 # SIZE
 from ._size import Range
 from ._sizes import AI
 
+# SKETCHES
+from ._sketch import QuantileSketch
+
+# STATISTICS
+from ._stats import RangeStats
+
+# STREAMING
+from ._stream import ColumnParser
+
+# TOP K
+from ._topk import RangeTopK
+
 # VERSION
 from .version import __version__
 
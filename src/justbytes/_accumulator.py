@@ -0,0 +1,124 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""RangeAccumulator class, for summing many values."""
+
+# pylint: disable=protected-access
+
+from fractions import Fraction
+
+from ._array import RangeArray
+from ._errors import RangeNonsensicalBinOpError
+from ._size import Range
+
+
+class RangeAccumulator:
+    """
+    A mutable running total of Range values.
+
+    The total is held as an int number of bytes and a separate fractional
+    remainder, which is used only if a fractional value is added. Adding
+    an integral value allocates no objects other than the resulting int.
+    A Range is constructed only when the total is requested.
+    """
+
+    __slots__ = ("_remainder", "_whole")
+
+    def __init__(self, values=()):
+        """
+        Initializer.
+
+        :param values: initial values to add
+        :type values: iterable of Range, int, or RangeArray
+        :raises RangeNonsensicalBinOpError: if a value is of another type
+        """
+        self._whole = 0
+        self._remainder = 0
+        self.update(values)
+
+    def __repr__(self):
+        return f"RangeAccumulator({self.total()!r})"
+
+    def add(self, value):
+        """
+        Add a value to the total.
+
+        :param value: the value, an int is a number of bytes
+        :type value: Range, int, or RangeArray
+        :raises RangeNonsensicalBinOpError: if value is of another type
+        """
+        if isinstance(value, Range):
+            magnitude = value._magnitude
+            if type(magnitude) is int:
+                self._whole += magnitude
+            else:
+                self._remainder += magnitude
+        elif isinstance(value, int):
+            self._whole += value
+        elif isinstance(value, RangeArray):
+            if value._denominators is None:
+                self._whole += sum(value._numerators)
+            else:
+                self._remainder += sum(
+                    map(Fraction, value._numerators, value._denominators)
+                )
+        else:
+            raise RangeNonsensicalBinOpError("+", value)
+
+    def __iadd__(self, other):
+        self.add(other)
+        return self
+
+    def update(self, values):
+        """
+        Add every value in ``values`` to the total.
+
+        :param values: the values
+        :type values: iterable of Range, int, or RangeArray
+        :raises RangeNonsensicalBinOpError: if a value is of another type
+        """
+        whole = 0
+        try:
+            for value in values:
+                if type(value) is Range:
+                    magnitude = value._magnitude
+                    if type(magnitude) is int:
+                        whole += magnitude
+                        continue
+                elif type(value) is int:
+                    whole += value
+                    continue
+                self.add(value)
+        finally:
+            self._whole += whole
+
+    def total(self):
+        """
+        The total of all values added.
+
+        :returns: the total
+        :rtype: Range
+        :raises RangeFractionalResultError: if fractional and strict
+        """
+        return Range._from_magnitude(self._whole + self._remainder)
+
+    def clear(self):
+        """
+        Reset the total to 0.
+        """
+        self._whole = 0
+        self._remainder = 0
@@ -0,0 +1,722 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Allocators, which hand out extents of an address space.
+
+Every allocator manages a single arena, a contiguous extent of byte
+addresses, and supports the same operations: allocate, which reserves an
+extent of at least the requested size, optionally aligned, and returns its
+start address, and free, which releases an extent by its start address.
+Allocators differ in their policy for choosing a free extent:
+
+* BestFitAllocator keeps free extents in a size-ordered index and chooses
+  the smallest one which can satisfy the request.
+* SegregatedFitAllocator keeps free extents in lists segregated by
+  power-of-two size class and chooses from the smallest class whose every
+  member can satisfy the request.
+* BuddyAllocator splits the arena into blocks whose sizes are powers of
+  two, coalescing a freed block with its buddy when both are free.
+
+Freed extents are coalesced with adjacent free extents immediately, by
+means of tables of free extents keyed by their start and end addresses.
+"""
+
+# pylint: disable=protected-access
+
+import heapq
+import itertools
+from collections import namedtuple
+
+from ._constants import B
+from ._errors import RangeValueError
+from ._extents import _address
+from ._size import Range
+
+# The greatest number of free extents examined for a request which only
+# some of them can satisfy
+_MAX_PROBES = 32
+
+
+class _Node:
+    """
+    A node of an AVL tree of free extents.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ("height", "key", "left", "right")
+
+    def __init__(self, key):
+        """
+        Initializer.
+
+        :param key: the length and the start of the free extent
+        :type key: tuple of int * int
+        """
+        self.key = key
+        self.left = None
+        self.right = None
+        self.height = 1
+
+
+def _height(node):
+    return 0 if node is None else node.height
+
+
+def _set_height(node):
+    (left, right) = (_height(node.left), _height(node.right))
+    node.height = (left if left > right else right) + 1
+    return node
+
+
+def _rotate_right(node):
+    pivot = node.left
+    (node.left, pivot.right) = (pivot.right, node)
+    _set_height(node)
+    return _set_height(pivot)
+
+
+def _rotate_left(node):
+    pivot = node.right
+    (node.right, pivot.left) = (pivot.left, node)
+    _set_height(node)
+    return _set_height(pivot)
+
+
+def _rebalance(node):
+    """
+    Restore the AVL invariant at ``node`` and recompute its height.
+
+    :param _Node node: a node whose subtrees are balanced
+    :returns: the root of the balanced subtree
+    :rtype: _Node
+    """
+    (left, right) = (node.left, node.right)
+    left_height = 0 if left is None else left.height
+    right_height = 0 if right is None else right.height
+    if left_height > right_height + 1:
+        if _height(left.left) < _height(left.right):
+            node.left = _rotate_left(left)
+        return _rotate_right(node)
+    if right_height > left_height + 1:
+        if _height(right.right) < _height(right.left):
+            node.right = _rotate_right(right)
+        return _rotate_left(node)
+    node.height = (left_height if left_height > right_height else right_height) + 1
+    return node
+
+
+def _retrace(path, root):
+    """
+    Rebalance the nodes on a path from the root, starting from the last,
+    until the height of a subtree is unchanged.
+
+    :param path: the nodes on the path
+    :type path: list of _Node
+    :param _Node root: the root of the tree
+    :returns: the root of the tree
+    :rtype: _Node
+    """
+    for index in range(len(path) - 1, -1, -1):
+        node = path[index]
+        height = node.height
+        subtree = _rebalance(node)
+        if subtree is not node:
+            if index == 0:
+                root = subtree
+            elif path[index - 1].left is node:
+                path[index - 1].left = subtree
+            else:
+                path[index - 1].right = subtree
+        if subtree.height == height:
+            break
+    return root
+
+
+def _insert(root, new):
+    """
+    Insert ``new`` into the tree rooted at ``root``.
+
+    :returns: the root of the tree
+    :rtype: _Node
+    """
+    if root is None:
+        return new
+    (path, node, key) = ([], root, new.key)
+    while node is not None:
+        path.append(node)
+        node = node.left if key < node.key else node.right
+    if key < path[-1].key:
+        path[-1].left = new
+    else:
+        path[-1].right = new
+    return _retrace(path, root)
+
+
+def _remove(root, key):
+    """
+    Remove the node with ``key`` from the tree rooted at ``root``.
+
+    :returns: the root of the tree
+    :rtype: _Node or NoneType
+    """
+    (path, node) = ([], root)
+    while node.key != key:
+        path.append(node)
+        node = node.left if key < node.key else node.right
+
+    # A node with two children takes the key of its successor, which is
+    # removed instead.
+    if node.left is not None and node.right is not None:
+        path.append(node)
+        successor = node.right
+        while successor.left is not None:
+            path.append(successor)
+            successor = successor.left
+        node.key = successor.key
+        node = successor
+
+    child = node.right if node.left is None else node.left
+    if not path:
+        return child
+    if path[-1].left is node:
+        path[-1].left = child
+    else:
+        path[-1].right = child
+    return _retrace(path, root)
+
+
+def _ascending(node, key):
+    """
+    Yield the nodes of a tree in order, starting at the first whose key is
+    at least ``key``.
+
+    :param node: the root of the tree
+    :type node: _Node or NoneType
+    :param tuple key: the least key
+    :rtype: generator of _Node
+    """
+    stack = []
+    while node is not None:
+        if node.key >= key:
+            stack.append(node)
+            node = node.left
+        else:
+            node = node.right
+    while stack:
+        node = stack.pop()
+        yield node
+        node = node.right
+        while node is not None:
+            stack.append(node)
+            node = node.left
+
+
+def _factor(value, param):
+    """
+    The positive integral number of bytes of ``value``.
+
+    :param value: the value
+    :type value: Range or int or element in :func:`._constants.UNITS`
+    :param str param: the parameter, for error messages
+    :returns: the number of bytes
+    :rtype: int
+    :raises RangeValueError: if value is not a positive number of bytes
+    """
+    factor = Range._get_unit_value(value)
+    if type(factor) is not int or factor < 1:
+        raise RangeValueError(
+            value, param, "must be a positive integral number of bytes"
+        )
+    return factor
+
+
+class AllocatorStats(
+    namedtuple(
+        "AllocatorStats",
+        ["free", "used", "requested", "largest_free", "free_blocks", "allocations"],
+    )
+):
+    """
+    Statistics about the state of an allocator.
+
+    The free, used, requested and largest free amounts are Ranges. Used
+    space includes space reserved for alignment or rounding, requested
+    space does not.
+    """
+
+    __slots__ = ()
+
+    @property
+    def fragmentation(self):
+        """
+        The proportion of free space which is not in the largest free block.
+
+        :returns: the external fragmentation, 0 if there is no free space
+        :rtype: float
+        """
+        free = self.free._magnitude
+        return 1 - self.largest_free._magnitude / free if free != 0 else 0.0
+
+    @property
+    def internal_fragmentation(self):
+        """
+        The proportion of used space which was not requested.
+
+        :returns: the internal fragmentation, 0 if there is no used space
+        :rtype: float
+        """
+        used = self.used._magnitude
+        return 1 - self.requested._magnitude / used if used != 0 else 0.0
+
+
+class _Allocator:
+    """
+    Behavior shared by all allocators.
+
+    Subclasses implement _reserve, _release, _largest_free and
+    _free_blocks.
+    """
+
+    def __init__(self, start, length):
+        """
+        Initializer.
+
+        :param int start: the start address of the arena
+        :param int length: the length of the arena, greater than 0
+        """
+        self._start = start
+        self._length = length
+        self._allocated = {}
+        self._used = 0
+        self._requested = 0
+
+    def __len__(self):
+        return len(self._allocated)
+
+    def __contains__(self, address):
+        return _address(address, "address") in self._allocated
+
+    def allocate(self, size, alignment=None):
+        """
+        Allocate an extent.
+
+        :param size: the number of bytes required, greater than 0
+        :type size: Range or int
+        :param alignment: the start address is a multiple of alignment
+        :type alignment: Range or int or element in :func:`._constants.UNITS`
+        :returns: the start address of the allocated extent
+        :rtype: Range
+        :raises RangeValueError: on bad parameters or if the request can
+           not be satisfied from the free space
+        """
+        size = _address(size, "size")
+        if size < 1:
+            raise RangeValueError(size, "size", "must be at least 1")
+        alignment = 1 if alignment is None else _factor(alignment, "alignment")
+
+        reservation = self._reserve(size, alignment)
+        if reservation is None:
+            raise RangeValueError(size, "size", "can not be satisfied")
+
+        (address, reserved) = reservation
+        self._allocated[address] = (reserved, size)
+        self._used += reserved
+        self._requested += size
+        return Range._from_magnitude(address)
+
+    def free(self, address):
+        """
+        Free an allocated extent.
+
+        :param address: the start address of the extent
+        :type address: Range or int
+        :returns: the number of bytes which were reserved for the extent
+        :rtype: Range
+        :raises RangeValueError: if no extent is allocated at address
+        """
+        address = _address(address, "address")
+        allocation = self._allocated.pop(address, None)
+        if allocation is None:
+            raise RangeValueError(address, "address", "is not allocated")
+
+        (reserved, size) = allocation
+        self._used -= reserved
+        self._requested -= size
+        self._release(address, reserved)
+        return Range._from_magnitude(reserved)
+
+    def stats(self):
+        """
+        Statistics about the current state of this allocator.
+
+        :rtype: AllocatorStats
+        """
+        return AllocatorStats(
+            Range._from_magnitude(self._length - self._used),
+            Range._from_magnitude(self._used),
+            Range._from_magnitude(self._requested),
+            Range._from_magnitude(self._largest_free()),
+            self._free_blocks(),
+            len(self._allocated),
+        )
+
+
+class _FitAllocator(_Allocator):
+    """
+    Behavior shared by allocators which split and coalesce free extents.
+
+    Subclasses implement _index_add, _index_remove and _find, which
+    maintain and search an index of the free extents.
+    """
+
+    def __init__(self, start, length):
+        """
+        Initializer.
+
+        :param start: the start address of the arena
+        :type start: Range or int
+        :param length: the length of the arena, greater than 0
+        :type length: Range or int
+        :raises RangeValueError: on bad parameters
+        """
+        start = _address(start, "start")
+        length = _address(length, "length")
+        if length < 1:
+            raise RangeValueError(length, "length", "must be at least 1")
+        super().__init__(start, length)
+        self._ends = {}
+        self._starts = {}
+        self._add(start, start + length)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._start!r}, {self._length!r})"
+
+    def _add(self, start, end):
+        """
+        Add a free extent, which is not adjacent to any other free extent.
+
+        :param int start: the start address
+        :param int end: the end address
+        """
+        self._ends[start] = end
+        self._starts[end] = start
+        self._index_add(start, end)
+
+    def _take(self, start, end):
+        """
+        Remove a free extent.
+
+        :param int start: the start address
+        :param int end: the end address
+        """
+        del self._ends[start]
+        del self._starts[end]
+        self._index_remove(start, end)
+
+    def _reserve(self, size, alignment):
+        found = self._find(size, alignment)
+        if found is None:
+            return None
+
+        (start, end) = found
+        address = -(-start // alignment) * alignment
+        self._take(start, end)
+        if address != start:
+            self._add(start, address)
+        if address + size != end:
+            self._add(address + size, end)
+        return (address, size)
+
+    def _release(self, address, size):
+        (start, end) = (address, address + size)
+        before = self._starts.get(start)
+        if before is not None:
+            self._take(before, start)
+            start = before
+        after = self._ends.get(end)
+        if after is not None:
+            self._take(end, after)
+            end = after
+        self._add(start, end)
+
+
+class BestFitAllocator(_FitAllocator):
+    """
+    An allocator which chooses the smallest free extent which can satisfy
+    a request, breaking ties by lowest address.
+
+    Free extents are indexed by an AVL tree keyed by length and start
+    address. An aligned request is satisfied by the smallest free extent
+    which is long enough to satisfy it wherever it starts, unless one of the first _MAX_PROBES shorter extents which
+    are no shorter than the request happens to be suitably aligned.
+    """
+
+    def __init__(self, start, length):
+        """
+        Initializer.
+
+        :param start: the start address of the arena
+        :type start: Range or int
+        :param length: the length of the arena, greater than 0
+        :type length: Range or int
+        :raises RangeValueError: on bad parameters
+        """
+        self._root = None
+        self._count = 0
+        super().__init__(start, length)
+
+    def _index_add(self, start, end):
+        self._root = _insert(self._root, _Node((end - start, start)))
+        self._count += 1
+
+    def _index_remove(self, start, end):
+        self._root = _remove(self._root, (end - start, start))
+        self._count -= 1
+
+    def _find(self, size, alignment):
+        """
+        Find the smallest free extent which can satisfy a request.
+
+        :param int size: the size requested
+        :param int alignment: the alignment requested
+        :returns: the start and end of the free extent or None
+        :rtype: (tuple of int * int) or NoneType
+        """
+        # Any free extent at least this long can satisfy the request.
+        sufficient = size + alignment - 1
+        candidates = _ascending(self._root, (size,))
+        if alignment == 1:
+            found = next(candidates, None)
+        else:
+            found = next(_ascending(self._root, (sufficient,)), None)
+            for node in itertools.islice(candidates, _MAX_PROBES):
+                (length, start) = node.key
+                if length >= sufficient:
+                    break
+                if -(-start // alignment) * alignment + size <= start + length:
+                    found = node
+                    break
+
+        if found is None:
+            return None
+        (length, start) = found.key
+        return (start, start + length)
+
+    def _largest_free(self):
+        node = self._root
+        if node is None:
+            return 0
+        while node.right is not None:
+            node = node.right
+        return node.key[0]
+
+    def _free_blocks(self):
+        return self._count
+
+
+class SegregatedFitAllocator(_FitAllocator):
+    """
+    An allocator which keeps free extents in lists segregated by size
+    class, where size class k holds the free extents whose length is at
+    least 2**k but less than 2**(k + 1).
+
+    A request is satisfied by the most recently freed member of the
+    smallest size class whose members can all satisfy it. If all those
+    classes are empty, the most recently freed _MAX_PROBES members of the
+    smaller classes which may hold a suitable free extent are searched.
+    A request may therefore fail although some free extent could satisfy
+    it, as with other good fit allocators.
+    """
+
+    def __init__(self, start, length):
+        """
+        Initializer.
+
+        :param start: the start address of the arena
+        :type start: Range or int
+        :param length: the length of the arena, greater than 0
+        :type length: Range or int
+        :raises RangeValueError: on bad parameters
+        """
+        self._classes = [{} for _ in range(_address(length, "length").bit_length())]
+        super().__init__(start, length)
+
+    def _index_add(self, start, end):
+        self._classes[(end - start).bit_length() - 1][start] = end
+
+    def _index_remove(self, start, end):
+        del self._classes[(end - start).bit_length() - 1][start]
+
+    def _find(self, size, alignment):
+        """
+        Find a free extent which can satisfy a request.
+
+        :param int size: the size requested
+        :param int alignment: the alignment requested
+        :returns: the start and end of the free extent or None
+        :rtype: (tuple of int * int) or NoneType
+        """
+        classes = self._classes
+        # Every member of size class sufficient or greater can satisfy
+        # the request.
+        sufficient = (size + alignment - 2).bit_length()
+        for free in classes[sufficient:]:
+            if free:
+                start = next(reversed(free))
+                return (start, free[start])
+
+        probes = _MAX_PROBES
+        for free in classes[size.bit_length() - 1 : sufficient]:
+            for start, end in itertools.islice(reversed(free.items()), probes):
+                if -(-start // alignment) * alignment + size <= end:
+                    return (start, end)
+            probes -= min(len(free), probes)
+        return None
+
+    def _largest_free(self):
+        for free in reversed(self._classes):
+            if free:
+                return max(end - start for (start, end) in free.items())
+        return 0
+
+    def _free_blocks(self):
+        return sum(len(free) for free in self._classes)
+
+
+class BuddyAllocator(_Allocator):
+    """
+    An allocator which splits its arena into blocks whose sizes are powers
+    of two, each aligned to its size relative to the start of the arena.
+
+    A request is satisfied by the lowest addressed free block of the
+    smallest sufficient size, splitting a larger block in halves if
+    necessary. A freed block is coalesced with its buddy, the other half
+    of the block from which it was split, whenever both are free.
+    """
+
+    def __init__(self, length, min_block=B, start=0):
+        """
+        Initializer.
+
+        :param length: the length of the arena, a power of two
+        :type length: Range or int or element in :func:`._constants.UNITS`
+        :param min_block: the size of the smallest block, a power of two
+        :type min_block: Range or int or element in :func:`._constants.UNITS`
+        :param start: the start address of the arena
+        :type start: Range or int
+        :raises RangeValueError: on bad parameters
+
+        Units are specified by their factors, e.g., ``BuddyAllocator(GiB,
+        KiB)`` manages an arena of 1 GiB in blocks of at least 1 KiB.
+        """
+        length = _factor(length, "length")
+        if length & (length - 1) != 0:
+            raise RangeValueError(length, "length", "must be a power of two")
+        min_block = _factor(min_block, "min_block")
+        if min_block & (min_block - 1) != 0 or min_block > length:
+            raise RangeValueError(
+                min_block, "min_block", "must be a power of two no greater than length"
+            )
+        super().__init__(_address(start, "start"), length)
+
+        self._min_order = min_block.bit_length() - 1
+        self._max_order = length.bit_length() - 1
+        # For each order, the offsets of the free blocks, and a heap which
+        # contains those offsets and, possibly, some stale entries.
+        self._free_sets = [set() for _ in range(self._max_order + 1)]
+        self._heaps = [[] for _ in range(self._max_order + 1)]
+        self._push(self._max_order, 0)
+
+    def __repr__(self):
+        return (
+            f"BuddyAllocator({self._length!r}, {1 << self._min_order!r}, "
+            f"{self._start!r})"
+        )
+
+    def _push(self, order, offset):
+        """
+        Add a free block.
+
+        :param int order: the block size is 2**order
+        :param int offset: the offset of the block from the start
+        """
+        (free, heap) = (self._free_sets[order], self._heaps[order])
+        if len(heap) > 2 * len(free) + 16:  # noqa: PLR2004
+            heap[:] = free
+            heapq.heapify(heap)
+        free.add(offset)
+        heapq.heappush(heap, offset)
+
+    def _pop(self, order):
+        """
+        Remove the lowest addressed free block.
+
+        :param int order: the block size is 2**order, there is such a block
+        :returns: the offset of the block from the start
+        :rtype: int
+        """
+        (free, heap) = (self._free_sets[order], self._heaps[order])
+        while True:
+            offset = heapq.heappop(heap)
+            if offset in free:
+                free.remove(offset)
+                return offset
+
+    def _reserve(self, size, alignment):
+        if alignment & (alignment - 1) != 0 or self._start % alignment != 0:
+            raise RangeValueError(
+                alignment,
+                "alignment",
+                "must be a power of two which divides the start of the arena",
+            )
+
+        order = max(
+            self._min_order, (size - 1).bit_length(), alignment.bit_length() - 1
+        )
+        current = order
+        while current <= self._max_order and not self._free_sets[current]:
+            current += 1
+        if current > self._max_order:
+            return None
+
+        offset = self._pop(current)
+        while current > order:
+            current -= 1
+            self._push(current, offset + (1 << current))
+        return (self._start + offset, 1 << order)
+
+    def _release(self, address, size):
+        (offset, order) = (address - self._start, size.bit_length() - 1)
+        while order < self._max_order:
+            buddy = offset ^ (1 << order)
+            free = self._free_sets[order]
+            if buddy not in free:
+                break
+            free.remove(buddy)
+            offset = min(offset, buddy)
+            order += 1
+        self._push(order, offset)
+
+    def _largest_free(self):
+        for order in range(self._max_order, self._min_order - 1, -1):
+            if self._free_sets[order]:
+                return 1 << order
+        return 0
+
+    def _free_blocks(self):
+        return sum(len(free) for free in self._free_sets)
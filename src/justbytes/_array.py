@@ -0,0 +1,466 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""RangeArray class, for operating on many Range values at once.
+
+A RangeArray stores the number of bytes of each of its elements in
+columns, rather than as individual Range objects. Arithmetic operations
+are applied elementwise and obey the same rules as the corresponding
+operations on Range objects.
+
+Columns are arrays of 64 bit integers where possible. A column that
+must hold a value of any larger magnitude, e.g., some number of YiB,
+is stored as a list of Python ints instead, so that every value that
+a Range can hold can also be held by a RangeArray.
+
+Operations are not vectorized: each is a loop over the numbers of bytes
+of the elements. A RangeArray is faster than a list of Range objects
+only because it neither constructs nor validates a Range for every
+element, and its 64 bit columns take less memory.
+"""
+
+# pylint: disable=protected-access
+
+import itertools
+import operator
+from array import array
+from fractions import Fraction
+
+from ._config import Config
+from ._constants import PRECISE_NUMERIC_TYPES, B
+from ._errors import (
+    RangeFractionalResultError,
+    RangeNonsensicalBinOpError,
+    RangeNonsensicalBinOpValueError,
+    RangePowerResultError,
+    RangeValueError,
+)
+from ._size import Range, _reduce
+
+_INT64 = "q"
+
+# Typecodes of arrays of integers, which hold numbers of bytes
+_INTEGER_TYPECODES = frozenset("bBhHiIlLqQ")
+
+
+def _column(values):
+    """
+    Make a column from integer values.
+
+    :param values: integer values
+    :type values: list of int
+    :returns: a column containing the values
+    :rtype: array or list
+    :raises TypeError: if any value is not an int
+
+    If every value fits in 64 bits, the column is an array of 64 bit
+    integers. Otherwise, it is a list of arbitrary precision ints.
+    """
+    try:
+        return array(_INT64, values)
+    except OverflowError:
+        if not all(type(x) is int for x in values):
+            raise TypeError("column values must be ints") from None
+        return values
+
+
+class RangeArray:
+    """
+    Class for instantiating RangeArray objects.
+
+    RangeArray objects are immutable.
+    """
+
+    __slots__ = ("_denominators", "_numerators")
+
+    @classmethod
+    def _from_magnitudes(cls, magnitudes):
+        """
+        Construct a RangeArray from a sequence of numbers of bytes.
+
+        :param magnitudes: the number of bytes of each element
+        :type magnitudes: iterable of int or Fraction
+        :returns: a new RangeArray
+        :rtype: RangeArray
+        :raises RangeFractionalResultError: if fractional and strict
+        """
+        magnitudes = list(magnitudes)
+        try:
+            (numerators, denominators) = (_column(magnitudes), None)
+        except TypeError:
+            magnitudes = [_reduce(x) for x in magnitudes]
+            if all(type(x) is int for x in magnitudes):
+                (numerators, denominators) = (_column(magnitudes), None)
+            elif Config.get_strict() is True:
+                raise RangeFractionalResultError() from None
+            else:
+                numerators = _column([x.numerator for x in magnitudes])
+                denominators = _column([x.denominator for x in magnitudes])
+
+        result = object.__new__(cls)
+        object.__setattr__(result, "_numerators", numerators)
+        object.__setattr__(result, "_denominators", denominators)
+        return result
+
+    def __new__(cls, values=(), units=None):
+        """
+        Construct a new RangeArray object.
+
+        :param values: the size values, default is no values
+        :type values: iterable of Range or precise numeric type (possibly as str)
+        :param units: the units of the numeric values, default is None
+        :type units: any of the publicly defined units constants or a Range
+        :raises RangeValueError: on bad parameters
+
+        Each value is interpreted exactly as by the Range constructor.
+        """
+        factor = Range._get_unit_value(B if units is None else units)
+        if factor is None:
+            raise RangeValueError(units, "units")
+        if type(factor) is int:
+            magnitudes = (
+                x * factor if type(x) is int else Range(x, units)._magnitude
+                for x in values
+            )
+        else:
+            magnitudes = (Range(x, units)._magnitude for x in values)
+        return cls._from_magnitudes(magnitudes)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __reduce__(self):
+        return (RangeArray._from_magnitudes, (self._magnitudes(),))
+
+    def _magnitudes(self):
+        """
+        The number of bytes of each element.
+
+        :returns: the magnitudes
+        :rtype: sequence of int or Fraction
+        """
+        if self._denominators is None:
+            return self._numerators
+        return [
+            n if d == 1 else Fraction(n, d)
+            for (n, d) in zip(self._numerators, self._denominators)
+        ]
+
+    def _operand(self, other, operator_name):
+        """
+        The magnitudes of a Range or RangeArray operand.
+
+        :param other: the other operand
+        :type other: Range or RangeArray
+        :param str operator_name: the operator, for error messages
+        :returns: the magnitudes to pair with the elements of this array
+        :rtype: iterable of int or Fraction
+        :raises RangeValueError: if lengths of arrays differ
+        """
+        if isinstance(other, Range):
+            return itertools.repeat(other._magnitude, len(self))
+        if len(other) != len(self):
+            raise RangeValueError(
+                other, "other", f"length must be {len(self)} for {operator_name}"
+            )
+        return other._magnitudes()
+
+    def __len__(self):
+        return len(self._numerators)
+
+    def __iter__(self):
+        return (Range._from_magnitude(x) for x in self._magnitudes())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RangeArray._from_magnitudes(self._magnitudes()[index])
+        if self._denominators is None:
+            return Range._from_magnitude(self._numerators[index])
+        return Range._from_magnitude(
+            Fraction(self._numerators[index], self._denominators[index])
+        )
+
+    def __repr__(self):
+        return f"RangeArray({list(self)!r})"
+
+    def tolist(self):
+        """
+        The elements of this array as Range objects.
+
+        :returns: the elements
+        :rtype: list of Range
+        """
+        return list(self)
+
+    def convertTo(self, spec=None):
+        """
+        Return the sizes in the units indicated by the specifier.
+
+        :param spec: a units specifier
+        :type spec: a units specifier or :class:`Range`
+        :returns: numeric values in the units indicated by the specifier
+        :rtype: list of :class:`fractions.Fraction`
+        :raises RangeValueError: if unit specifier is non-positive
+        """
+        spec = B if spec is None else spec
+        factor = Range._get_unit_value(spec)
+        if factor is None:
+            raise RangeValueError(spec, "spec")
+
+        if factor <= 0:
+            raise RangeValueError(
+                factor, "factor", "can not convert to non-positive unit %s"
+            )
+
+        return [Fraction(x, factor) for x in self._magnitudes()]
+
+    # UNARY OPERATIONS
+
+    def __abs__(self):
+        return RangeArray._from_magnitudes(map(abs, self._magnitudes()))
+
+    def __neg__(self):
+        return RangeArray._from_magnitudes(map(operator.neg, self._magnitudes()))
+
+    def __pos__(self):
+        return self
+
+    # BINARY OPERATIONS
+    def __add__(self, other):
+        if not isinstance(other, (Range, RangeArray)):
+            raise RangeNonsensicalBinOpError("+", other)
+        return RangeArray._from_magnitudes(
+            map(operator.add, self._magnitudes(), self._operand(other, "+"))
+        )
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if not isinstance(other, (Range, RangeArray)):
+            raise RangeNonsensicalBinOpError("-", other)
+        return RangeArray._from_magnitudes(
+            map(operator.sub, self._magnitudes(), self._operand(other, "-"))
+        )
+
+    def __rsub__(self, other):
+        if not isinstance(other, (Range, RangeArray)):
+            raise RangeNonsensicalBinOpError("rsub", other)
+        return RangeArray._from_magnitudes(
+            map(operator.sub, self._operand(other, "rsub"), self._magnitudes())
+        )
+
+    def __mul__(self, other):
+        # T(mul) = RangeArray and T(other) is a numeric type.
+        if isinstance(other, PRECISE_NUMERIC_TYPES):
+            factor = _reduce(other)
+            return RangeArray._from_magnitudes(x * factor for x in self._magnitudes())
+        if isinstance(other, (Range, RangeArray)):
+            raise RangePowerResultError()
+        raise RangeNonsensicalBinOpError("*", other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        # T(truediv) = list of Fraction, if T(other) is Range or RangeArray
+        #            = RangeArray, if T(other) is numeric
+        if isinstance(other, (Range, RangeArray)):
+            try:
+                return list(
+                    map(Fraction, self._magnitudes(), self._operand(other, "truediv"))
+                )
+            except ZeroDivisionError as err:
+                raise RangeNonsensicalBinOpValueError("truediv", other) from err
+        if isinstance(other, PRECISE_NUMERIC_TYPES):
+            divisor = _reduce(other)
+            try:
+                return RangeArray._from_magnitudes(
+                    Fraction(x, divisor) for x in self._magnitudes()
+                )
+            except ZeroDivisionError as err:
+                raise RangeNonsensicalBinOpValueError("truediv", other) from err
+        raise RangeNonsensicalBinOpError("truediv", other)
+
+    def __floordiv__(self, other):
+        # T(floor) = list of int, if T(other) is Range or RangeArray
+        #          = RangeArray, if T(other) is numeric
+        if isinstance(other, (Range, RangeArray)):
+            try:
+                return list(
+                    map(
+                        operator.floordiv,
+                        self._magnitudes(),
+                        self._operand(other, "floordiv"),
+                    )
+                )
+            except ZeroDivisionError as err:
+                raise RangeNonsensicalBinOpValueError("floordiv", other) from err
+        if isinstance(other, PRECISE_NUMERIC_TYPES):
+            divisor = _reduce(other)
+            try:
+                return RangeArray._from_magnitudes(
+                    x // divisor for x in self._magnitudes()
+                )
+            except ZeroDivisionError as err:
+                raise RangeNonsensicalBinOpValueError("floordiv", other) from err
+        raise RangeNonsensicalBinOpError("floordiv", other)
+
+    def __mod__(self, other):
+        # T(mod) = RangeArray
+        if isinstance(other, (Range, RangeArray)):
+            try:
+                return RangeArray._from_magnitudes(
+                    map(operator.mod, self._magnitudes(), self._operand(other, "%"))
+                )
+            except ZeroDivisionError as err:
+                raise RangeNonsensicalBinOpValueError("%", other) from err
+        if isinstance(other, PRECISE_NUMERIC_TYPES):
+            divisor = _reduce(other)
+            try:
+                return RangeArray._from_magnitudes(
+                    x % divisor for x in self._magnitudes()
+                )
+            except ZeroDivisionError as err:
+                raise RangeNonsensicalBinOpValueError("%", other) from err
+        raise RangeNonsensicalBinOpError("%", other)
+
+    def __divmod__(self, other):
+        # T(rem) = RangeArray
+        # T(div) = list of int, if T(other) is Range or RangeArray
+        #        = RangeArray, if T(other) is numeric
+        if isinstance(other, (Range, RangeArray)):
+            try:
+                pairs = list(
+                    map(divmod, self._magnitudes(), self._operand(other, "divmod"))
+                )
+            except ZeroDivisionError as err:
+                raise RangeNonsensicalBinOpValueError("divmod", other) from err
+            return (
+                [div for (div, _) in pairs],
+                RangeArray._from_magnitudes(rem for (_, rem) in pairs),
+            )
+        if isinstance(other, PRECISE_NUMERIC_TYPES):
+            divisor = _reduce(other)
+            try:
+                pairs = [divmod(x, divisor) for x in self._magnitudes()]
+            except ZeroDivisionError as err:
+                raise RangeNonsensicalBinOpValueError("divmod", other) from err
+            return (
+                RangeArray._from_magnitudes(div for (div, _) in pairs),
+                RangeArray._from_magnitudes(rem for (_, rem) in pairs),
+            )
+        raise RangeNonsensicalBinOpError("divmod", other)
+
+    def __rtruediv__(self, other):
+        raise RangeNonsensicalBinOpError("rtruediv", other)
+
+    def __rfloordiv__(self, other):
+        raise RangeNonsensicalBinOpError("rfloordiv", other)
+
+    def __rmod__(self, other):
+        raise RangeNonsensicalBinOpError("rmod", other)
+
+    def __rdivmod__(self, other):
+        raise RangeNonsensicalBinOpError("rdivmod", other)
+
+    def __pow__(self, other):
+        # Cannot represent multiples of Ranges.
+        if not isinstance(other, PRECISE_NUMERIC_TYPES):
+            raise RangeNonsensicalBinOpError("**", other)
+        raise RangePowerResultError()
+
+    def __rpow__(self, other):
+        # A Range exponent is meaningless.
+        raise RangeNonsensicalBinOpError("rpow", other)
+
+    # COMPARISONS
+    # Ordering comparisons are elementwise, and yield a list of bool.
+    # Equality compares whole arrays, and yields a bool; the methods eq and
+    # ne compare elementwise.
+
+    def _compare(self, other, operator_name, method):
+        """
+        Compare elementwise.
+
+        :param other: the other operand
+        :param str operator_name: the operator, for error messages
+        :param method: the comparison
+        :returns: the result of each comparison
+        :rtype: list of bool
+        :raises RangeNonsensicalBinOpError: if other is not a Range or RangeArray
+        """
+        if not isinstance(other, (Range, RangeArray)):
+            raise RangeNonsensicalBinOpError(operator_name, other)
+        return list(
+            map(method, self._magnitudes(), self._operand(other, operator_name))
+        )
+
+    def eq(self, other):
+        """
+        Compare elementwise for equality.
+
+        :param other: the other operand
+        :type other: Range or RangeArray
+        :returns: whether each element is equal to the other operand
+        :rtype: list of bool
+        :raises RangeValueError: if lengths of arrays differ
+        """
+        if not isinstance(other, (Range, RangeArray)):
+            return [False] * len(self)
+        return self._compare(other, "eq", operator.eq)
+
+    def ne(self, other):
+        """
+        Compare elementwise for inequality.
+
+        :param other: the other operand
+        :type other: Range or RangeArray
+        :returns: whether each element is not equal to the other operand
+        :rtype: list of bool
+        :raises RangeValueError: if lengths of arrays differ
+        """
+        if not isinstance(other, (Range, RangeArray)):
+            return [True] * len(self)
+        return self._compare(other, "ne", operator.ne)
+
+    def __eq__(self, other):
+        if not isinstance(other, RangeArray):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            map(operator.eq, self._magnitudes(), other._magnitudes())
+        )
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash(tuple(self._magnitudes()))
+
+    def __ge__(self, other):
+        return self._compare(other, ">=", operator.ge)
+
+    def __gt__(self, other):
+        return self._compare(other, ">", operator.gt)
+
+    def __le__(self, other):
+        return self._compare(other, "<=", operator.le)
+
+    def __lt__(self, other):
+        return self._compare(other, "<", operator.lt)
@@ -0,0 +1,108 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Adapters between asyncio streams and Range objects."""
+
+import asyncio
+
+from ._config import Config
+from ._errors import RangeValueError
+from ._stream import ColumnParser
+
+
+async def read_ranges(reader, parser=None, *, encoding="utf-8"):
+    """
+    Parse Range values from the lines read from ``reader``.
+
+    :param reader: the stream reader
+    :type reader: asyncio.StreamReader
+    :param parser: the parser, default parses the first column
+    :type parser: ColumnParser or NoneType
+    :param str encoding: the encoding of the stream
+    :returns: a Range for each line which can be parsed
+    :rtype: async generator of Range
+
+    A line is read only when the next Range is requested, so a slow
+    consumer exerts backpressure on the stream. Lines which can not be
+    parsed or decoded are recorded in the parser's errors.
+    """
+    parser = ColumnParser() if parser is None else parser
+    parser.reset()
+
+    line_number = 0
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        line_number += 1
+        value = parser.parse_line(line_number, line, encoding)
+        if value is not None:
+            yield value
+
+
+async def write_ranges(  # noqa: PLR0913
+    writer, ranges, config=None, *, batch_size=1024, separator="\n", encoding="utf-8"
+):
+    """
+    Write string representations of ``ranges`` to ``writer``.
+
+    :param writer: the stream writer
+    :type writer: asyncio.StreamWriter
+    :param ranges: the Ranges to write
+    :type ranges: iterable or async iterable of Range
+    :param config: the configuration, default is current
+    :type config: StringConfig or NoneType
+    :param int batch_size: the number of Ranges to format at a time
+    :param str separator: the string written after each Range
+    :param str encoding: the encoding of the stream
+    :returns: the number of Ranges written
+    :rtype: int
+    :raises RangeValueError: if batch_size is less than 1
+
+    After writing each batch, waits for the writer to drain and yields
+    to the event loop, so that formatting many Ranges does not block it.
+    """
+    if batch_size < 1:
+        raise RangeValueError(batch_size, "batch_size", "must be at least 1")
+
+    formatter = (Config.get_string_config() if config is None else config).compile()
+    count = 0
+    batch = []
+
+    async def flush():
+        writer.write("".join(batch).encode(encoding))
+        batch.clear()
+        await writer.drain()
+        await asyncio.sleep(0)
+
+    if hasattr(ranges, "__aiter__"):
+        async for value in ranges:
+            batch.append(formatter(value) + separator)
+            if len(batch) == batch_size:
+                count += batch_size
+                await flush()
+    else:
+        for value in ranges:
+            batch.append(formatter(value) + separator)
+            if len(batch) == batch_size:
+                count += batch_size
+                await flush()
+
+    if batch:
+        count += len(batch)
+        await flush()
+    return count
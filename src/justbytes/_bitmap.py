@@ -0,0 +1,436 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""ChunkBitmap class, a compressed record of allocated chunks.
+
+The address space is divided into chunks of a fixed size, and the chunks
+into containers of 2**16 chunks each, after the manner of Roaring bitmaps.
+Only containers with some allocated chunks are stored. A container is
+stored either as sorted runs of allocated chunks, in a pair of arrays of
+starts and ends, or, if it has many runs, as a bitmap in a Python int.
+Full containers all share a single run container.
+"""
+
+# pylint: disable=protected-access
+
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+
+from ._allocator import _factor
+from ._errors import RangeValueError
+from ._extents import _address
+from ._size import Range
+
+_BITS = 16
+_CONTAINER = 1 << _BITS
+
+# A run container with more runs than this is converted to a bitmap, which
+# takes the same space. A bitmap with no more than half as many runs is
+# converted back.
+_MAX_RUNS = _CONTAINER // 64
+_MIN_RUNS = _MAX_RUNS // 2
+
+_FULL = (array("I", [0]), array("I", [_CONTAINER]))
+
+_ONES = re.compile("1+")
+
+
+def _runs(container):
+    """
+    The runs of allocated chunks in a container.
+
+    :param container: a run container or a bitmap
+    :type container: (tuple of array * array) or int
+    :returns: pairs of start and end, sorted
+    :rtype: iterable of (int * int)
+    """
+    if isinstance(container, int):
+        bits = format(container, f"0{_CONTAINER}b")[::-1]
+        return ((match.start(), match.end()) for match in _ONES.finditer(bits))
+    return zip(*container)
+
+
+def _to_bitmap(container):
+    """
+    Convert a run container to a bitmap.
+
+    :param container: a run container
+    :type container: tuple of array * array
+    :rtype: int
+    """
+    bits = 0
+    for start, end in zip(*container):
+        bits |= ((1 << (end - start)) - 1) << start
+    return bits
+
+
+def _compact(bits):
+    """
+    Convert a bitmap to a run container, if it has few enough runs.
+
+    :param int bits: the bitmap
+    :returns: a run container or the bitmap
+    :rtype: (tuple of array * array) or int
+    """
+    if (bits ^ (bits << 1)).bit_count() // 2 > _MIN_RUNS:
+        return bits
+    (starts, ends) = (array("I"), array("I"))
+    for start, end in _runs(bits):
+        starts.append(start)
+        ends.append(end)
+    return (starts, ends)
+
+
+def _bitmap_update(bits, mask):
+    """
+    Replace a bitmap.
+
+    :param int bits: the bitmap
+    :param int mask: the new bitmap
+    :returns: a new container and the change in the number of chunks
+    :rtype: ((tuple of array * array) or int) * int
+    """
+    return (_compact(mask), mask.bit_count() - bits.bit_count())
+
+
+def _runs_update(container, i, j, starts, ends):
+    """
+    Replace some runs in a run container.
+
+    :param container: the run container, which may be changed
+    :type container: tuple of array * array
+    :param int i: the index of the first run to replace
+    :param int j: the index after the last run to replace
+    :param starts: the starts of the new runs
+    :type starts: list of int
+    :param ends: the ends of the new runs
+    :type ends: list of int
+    :returns: a new container and the change in the number of chunks
+    :rtype: ((tuple of array * array) or int) * int
+    """
+    if container is _FULL:
+        container = (array("I", _FULL[0]), array("I", _FULL[1]))
+    (old_starts, old_ends) = container
+    delta = (sum(ends) - sum(starts)) - (sum(old_ends[i:j]) - sum(old_starts[i:j]))
+    old_starts[i:j] = array("I", starts)
+    old_ends[i:j] = array("I", ends)
+    if len(old_starts) > _MAX_RUNS:
+        return (_to_bitmap(container), delta)
+    return (container, delta)
+
+
+def _set(container, start, end):
+    """
+    Mark chunks in a container allocated.
+
+    :param container: a run container or a bitmap, which may be changed
+    :type container: (tuple of array * array) or int
+    :param int start: the first chunk
+    :param int end: the chunk after the last chunk
+    :returns: a new container and the change in the number of chunks
+    :rtype: ((tuple of array * array) or int) * int
+    """
+    if isinstance(container, int):
+        return _bitmap_update(
+            container, container | (((1 << (end - start)) - 1) << start)
+        )
+
+    (starts, ends) = container
+    i = bisect_left(ends, start)
+    j = bisect_right(starts, end)
+    if i < j:
+        start = min(start, starts[i])
+        end = max(end, ends[j - 1])
+        if j - i == 1 and starts[i] == start and ends[i] == end:
+            return (container, 0)
+    return _runs_update(container, i, j, [start], [end])
+
+
+def _clear(container, start, end):
+    """
+    Mark chunks in a container free.
+
+    :param container: a run container or a bitmap, which may be changed
+    :type container: (tuple of array * array) or int
+    :param int start: the first chunk
+    :param int end: the chunk after the last chunk
+    :returns: a new container and the change in the number of chunks
+    :rtype: ((tuple of array * array) or int) * int
+    """
+    if isinstance(container, int):
+        return _bitmap_update(
+            container, container & ~(((1 << (end - start)) - 1) << start)
+        )
+
+    (starts, ends) = container
+    i = bisect_right(ends, start)
+    j = bisect_left(starts, end)
+    if i >= j:
+        return (container, 0)
+    (new_starts, new_ends) = ([], [])
+    if starts[i] < start:
+        new_starts.append(starts[i])
+        new_ends.append(start)
+    if ends[j - 1] > end:
+        new_starts.append(end)
+        new_ends.append(ends[j - 1])
+    return _runs_update(container, i, j, new_starts, new_ends)
+
+
+class ChunkBitmap:
+    """
+    A mutable record of which chunks of an address space are allocated.
+
+    The address space starts at 0. Its length must be a multiple of the
+    chunk size. All extents which are marked allocated or free must be
+    aligned to the chunk size.
+    """
+
+    __slots__ = ("_chunk", "_chunks", "_containers", "_count", "_counts", "_keys")
+
+    def __init__(self, length, chunk_size):
+        """
+        Initializer.
+
+        :param length: the length of the address space
+        :type length: Range or int or element in :func:`._constants.UNITS`
+        :param chunk_size: the size of a chunk
+        :type chunk_size: Range or int or element in :func:`._constants.UNITS`
+        :raises RangeValueError: on bad parameters
+
+        Units are specified by their factors, e.g., ``ChunkBitmap(PiB,
+        Range(64, KiB))`` records allocation in chunks of 64 KiB.
+        """
+        self._chunk = _factor(chunk_size, "chunk_size")
+        (self._chunks, remainder) = divmod(_factor(length, "length"), self._chunk)
+        if remainder != 0:
+            raise RangeValueError(length, "length", "must be a multiple of chunk_size")
+
+        self._containers = {}
+        self._counts = {}
+        self._keys = []
+        self._count = 0
+
+    def __repr__(self):
+        return f"ChunkBitmap({self._chunks * self._chunk!r}, {self._chunk!r})"
+
+    @property
+    def chunk_size(self):
+        """
+        The size of a chunk.
+
+        :rtype: Range
+        """
+        return Range._from_magnitude(self._chunk)
+
+    def _bounds(self, start, length):
+        """
+        The first chunk and the chunk after the last chunk of an extent.
+
+        :param start: the start of the extent
+        :type start: Range or int
+        :param length: the length of the extent
+        :type length: Range or int
+        :rtype: tuple of int * int
+        :raises RangeValueError: on bad parameters
+        """
+        (first, start_remainder) = divmod(_address(start, "start"), self._chunk)
+        (count, length_remainder) = divmod(_address(length, "length"), self._chunk)
+        if start_remainder != 0 or length_remainder != 0:
+            raise RangeValueError(
+                (start, length), "extent", "must be aligned to chunk_size"
+            )
+        if first < 0 or count < 0 or first + count > self._chunks:
+            raise RangeValueError(
+                (start, length), "extent", "must lie within the address space"
+            )
+        return (first, first + count)
+
+    def _update(self, start, length, operation, full):
+        """
+        Apply an operation to every container which an extent touches.
+
+        :param start: the start of the extent
+        :type start: Range or int
+        :param length: the length of the extent
+        :type length: Range or int
+        :param operation: _set or _clear
+        :param full: the container which results from a whole container
+        :type full: (tuple of array * array) or NoneType
+        :raises RangeValueError: on bad parameters
+        """
+        (first, end) = self._bounds(start, length)
+        if first == end:
+            return
+
+        (containers, counts) = (self._containers, self._counts)
+        (low_key, high_key) = (first >> _BITS, (end - 1) >> _BITS)
+        keys_changed = False
+        for key in range(low_key, high_key + 1):
+            base = key << _BITS
+            (low, high) = (max(first, base) - base, min(end, base + _CONTAINER) - base)
+            container = containers.get(key)
+            count = counts.get(key, 0)
+            if low == 0 and high == _CONTAINER:
+                (container, delta) = (full, (0 if full is None else _CONTAINER) - count)
+            elif container is not None:
+                (container, delta) = operation(container, low, high)
+            elif operation is _set:
+                container = (array("I", [low]), array("I", [high]))
+                delta = high - low
+            else:
+                delta = 0
+
+            self._count += delta
+            count += delta
+            if count == 0:
+                if key in containers:
+                    del containers[key]
+                    del counts[key]
+                    keys_changed = True
+            else:
+                keys_changed = keys_changed or key not in containers
+                containers[key] = container
+                counts[key] = count
+
+        if keys_changed:
+            keys = self._keys
+            keys[bisect_left(keys, low_key) : bisect_right(keys, high_key)] = (
+                key for key in range(low_key, high_key + 1) if key in containers
+            )
+
+    def set(self, start, length):
+        """
+        Mark an extent allocated.
+
+        :param start: the start of the extent
+        :type start: Range or int
+        :param length: the length of the extent
+        :type length: Range or int
+        :raises RangeValueError: on bad parameters
+        """
+        self._update(start, length, _set, _FULL)
+
+    def clear(self, start, length):
+        """
+        Mark an extent free.
+
+        :param start: the start of the extent
+        :type start: Range or int
+        :param length: the length of the extent
+        :type length: Range or int
+        :raises RangeValueError: on bad parameters
+        """
+        self._update(start, length, _clear, None)
+
+    def __contains__(self, address):
+        chunk = _address(address, "address") // self._chunk
+        container = self._containers.get(chunk >> _BITS)
+        if container is None:
+            return False
+        chunk &= _CONTAINER - 1
+        if isinstance(container, int):
+            return (container >> chunk) & 1 == 1
+        (starts, ends) = container
+        index = bisect_right(starts, chunk) - 1
+        return index >= 0 and chunk < ends[index]
+
+    def allocated(self):
+        """
+        The allocated space.
+
+        :returns: the number of allocated chunks times the chunk size
+        :rtype: Range
+        """
+        return Range._from_magnitude(self._count * self._chunk)
+
+    def available(self):
+        """
+        The free space.
+
+        :returns: the number of free chunks times the chunk size
+        :rtype: Range
+        """
+        return Range._from_magnitude((self._chunks - self._count) * self._chunk)
+
+    def _allocated_runs(self):
+        """
+        The maximal runs of allocated chunks.
+
+        :returns: pairs of first chunk and chunk after the last chunk
+        :rtype: iterable of (int * int)
+        """
+        (run_start, run_end) = (None, None)
+        for key in self._keys:
+            base = key << _BITS
+            for start, end in _runs(self._containers[key]):
+                if run_end == base + start:
+                    run_end = base + end
+                    continue
+                if run_end is not None:
+                    yield (run_start, run_end)
+                (run_start, run_end) = (base + start, base + end)
+        if run_end is not None:
+            yield (run_start, run_end)
+
+    def _extents(self, runs):
+        """
+        Convert runs of chunks to extents.
+
+        :param runs: pairs of first chunk and chunk after the last chunk
+        :type runs: iterable of (int * int)
+        :returns: pairs of start and length
+        :rtype: iterable of (Range * Range)
+        """
+
+        chunk = self._chunk
+        return (
+            (
+                Range._from_magnitude(start * chunk),
+                Range._from_magnitude((end - start) * chunk),
+            )
+            for (start, end) in runs
+        )
+
+    def allocated_runs(self):
+        """
+        The maximal allocated extents, in order of address.
+
+        :returns: pairs of start and length
+        :rtype: iterable of (Range * Range)
+        """
+        return self._extents(self._allocated_runs())
+
+    def free_runs(self):
+        """
+        The maximal free extents, in order of address.
+
+        :returns: pairs of start and length
+        :rtype: iterable of (Range * Range)
+        """
+
+        def runs():
+            previous = 0
+            for start, end in self._allocated_runs():
+                if start != previous:
+                    yield (previous, start)
+                previous = end
+            if previous != self._chunks:
+                yield (previous, self._chunks)
+
+        return self._extents(runs())
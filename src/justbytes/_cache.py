@@ -0,0 +1,134 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Caching of formatted Range output."""
+
+import threading
+from collections import OrderedDict, namedtuple
+
+from ._errors import RangeValueError
+
+
+class CacheStats(
+    namedtuple("CacheStats", ["hits", "misses", "evictions", "size", "maxsize"])
+):
+    """
+    Statistics about use of a FormatCache.
+    """
+
+    __slots__ = ()
+
+    @property
+    def hit_rate(self):
+        """
+        The proportion of lookups which were hits.
+
+        :returns: the hit rate, 0 if there have been no lookups
+        :rtype: float
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups != 0 else 0.0
+
+
+class FormatCache:
+    """
+    A bounded, thread-safe, least recently used cache of the results of
+    :meth:`._size.Range.getString` and :meth:`._size.Range.getStringInfo`,
+    keyed by magnitude and configuration.
+
+    Configurations are keyed by identity. The cache is cleared whenever
+    the global configuration is changed through :class:`._config.Config`,
+    but modifying a configuration object in place after it has been used
+    with the cache is not detected.
+    """
+
+    def __init__(self, maxsize=4096):
+        """
+        Initializer.
+
+        :param int maxsize: the maximum number of entries, at least 1
+        :raises RangeValueError: if maxsize is less than 1
+        """
+        if maxsize < 1:
+            raise RangeValueError(maxsize, "maxsize", "must be at least 1")
+
+        self._maxsize = maxsize
+        self._table = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        return len(self._table)
+
+    def get(self, key):
+        """
+        Get the cached result for ``key``.
+
+        :param key: the key, a pair of a magnitude and a configuration
+        :returns: the result or None if there is none
+        :rtype: object or NoneType
+        """
+        with self._lock:
+            result = self._table.get(key)
+            if result is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._table.move_to_end(key)
+        return result
+
+    def add(self, key, value):
+        """
+        Cache ``value`` as the result for ``key``.
+
+        :param key: the key, a pair of a magnitude and a configuration
+        :param object value: the result, not None
+        """
+        with self._lock:
+            table = self._table
+            if key not in table and len(table) >= self._maxsize:
+                table.popitem(last=False)
+                self._evictions += 1
+            table[key] = value
+
+    def clear(self):
+        """
+        Remove all entries and reset the statistics.
+        """
+        with self._lock:
+            self._table.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self):
+        """
+        Statistics about use of this cache.
+
+        :returns: hits, misses, evictions, current size and maximum size
+        :rtype: CacheStats
+        """
+        with self._lock:
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._table),
+                self._maxsize,
+            )
@@ -19,6 +19,9 @@
 
 # pylint: disable=invalid-name
 
+import contextlib
+import contextvars
+
 import justbases
 
 from ._constants import PRECISE_NUMERIC_TYPES, UNITS, RoundingMethods
@@ -188,6 +191,65 @@ class StringConfig:
         self.VALUE_CONFIG = value_config
         self.DISPLAY_CONFIG = display_config
 
+    def compile(self):
+        """
+        Compile this configuration into a formatter.
+
+        :returns: an immutable, hashable callable that formats a Range
+        :rtype: :class:`._formatter.Formatter`
+
+        The formatter is equivalent to :meth:`._size.Range.getString` with
+        this configuration, but interprets the configuration only once.
+        Later changes to this configuration do not affect the formatter.
+        """
+        from ._formatter import Formatter  # noqa: PLC0415 pylint: disable=import-outside-toplevel
+
+        return Formatter(self)
+
+
+# The context-local string configuration and strictness, None where the
+# global value set in Config applies.
+_CONTEXT = contextvars.ContextVar("justbytes_config", default=(None, None))
+
+# String configurations derived by Config.using from a base configuration
+# and overrides, keyed by the identities of the base and the overrides.
+# Each entry also holds the base and overrides, so that the identities
+# remain valid. The table is cleared when it grows too large.
+_DERIVED = {}
+_MAX_DERIVED = 256
+
+
+def _derived(base, value_config, display_config, display_impl):
+    """
+    The string configuration which overrides parts of ``base``.
+
+    :param StringConfig base: the base configuration
+    :param value_config: the value configuration, None for that of base
+    :type value_config: ValueConfig or NoneType
+    :param display_config: the display configuration, None for that of base
+    :type display_config: DisplayConfig or NoneType
+    :param display_impl: the display implementation, None for that of base
+    :type display_impl: type or NoneType
+    :returns: the derived configuration, the same for the same arguments
+    :rtype: StringConfig
+    :raises RangeValueError: if configuration and implementation can't work
+    """
+    sources = (base, value_config, display_config, display_impl)
+    key = tuple(map(id, sources))
+    entry = _DERIVED.get(key)
+    if entry is not None:
+        return entry[1]
+
+    string_config = StringConfig(
+        base.VALUE_CONFIG if value_config is None else value_config,
+        base.DISPLAY_CONFIG if display_config is None else display_config,
+        base.DISPLAY_IMPL_CLASS if display_impl is None else display_impl,
+    )
+    if len(_DERIVED) >= _MAX_DERIVED:
+        _DERIVED.clear()
+    _DERIVED[key] = (sources, string_config)
+    return string_config
+
 
 class Config:
     """
@@ -198,15 +260,140 @@ class Config:
 
     STRICT = False
 
+    INTERN_TABLE = None
+
+    FORMAT_CACHE = None
+
+    @classmethod
+    def set_format_cache(cls, cache):
+        """
+        Set the cache used for string representations of Range objects.
+
+        :param cache: the cache, None disables caching
+        :type cache: FormatCache or NoneType
+        """
+        cls.FORMAT_CACHE = cache
+
     @classmethod
-    def set_display_impl(cls, impl):  # pragma: no cover
+    def _set_string_config(cls, config):
+        """
+        Set the string configuration, invalidating any cached results.
+
+        :param StringConfig config: the new configuration
+        """
+        cls.STRING_CONFIG = config
+        _DERIVED.clear()
+        if cls.FORMAT_CACHE is not None:
+            cls.FORMAT_CACHE.clear()
+
+    @classmethod
+    def get_string_config(cls):
+        """
+        Get the string configuration in effect in the current context.
+
+        :returns: the string configuration
+        :rtype: StringConfig
+        """
+        string_config = _CONTEXT.get()[0]
+        return cls.STRING_CONFIG if string_config is None else string_config
+
+    @classmethod
+    def get_strict(cls):
+        """
+        Get whether fractional results are errors in the current context.
+
+        :returns: True if fractional results are errors
+        :rtype: bool
+        """
+        strict = _CONTEXT.get()[1]
+        return cls.STRICT if strict is None else strict
+
+    @classmethod
+    @contextlib.contextmanager
+    def using(  # noqa: PLR0913
+        cls,
+        string_config=None,
+        *,
+        value_config=None,
+        display_config=None,
+        display_impl=None,
+        strict=None,
+    ):
+        """
+        Override the configuration within a ``with`` statement.
+
+        :param string_config: the string configuration, default is current
+        :type string_config: StringConfig or NoneType
+        :param value_config: the value configuration, default is current
+        :type value_config: ValueConfig or NoneType
+        :param display_config: the display configuration, default is current
+        :type display_config: DisplayConfig or NoneType
+        :param display_impl: the display implementation, default is current
+        :type display_impl: type or NoneType
+        :param strict: whether fractional results are errors, default is current
+        :type strict: bool or NoneType
+        :returns: a context manager, which yields the string configuration
+        :raises RangeValueError: if configuration and implementation can't work
+
+        The override applies only to the current thread or asyncio task,
+        and to tasks created within the ``with`` statement.
+
+        If no string configuration is given and none of value_config,
+        display_config and display_impl is given, the string configuration
+        continues to follow the global configuration, including changes
+        made within the ``with`` statement. Otherwise, the parts which are
+        not overridden are taken from the configuration current on entry,
+        and later changes to the global configuration are not seen.
+
+        The string configuration derived from the same configuration and
+        the same override objects is constructed only once, so that
+        repeated use of ``using`` with the same arguments is cheap and
+        shares entries in the format cache.
+        """
+        (current_string_config, current_strict) = _CONTEXT.get()
+        if string_config is None:
+            string_config = current_string_config
+
+        if (value_config, display_config, display_impl) != (None, None, None):
+            string_config = _derived(
+                cls.STRING_CONFIG if string_config is None else string_config,
+                value_config,
+                display_config,
+                display_impl,
+            )
+
+        token = _CONTEXT.set(
+            (string_config, current_strict if strict is None else strict)
+        )
+        try:
+            yield cls.get_string_config()
+        finally:
+            _CONTEXT.reset(token)
+
+    @classmethod
+    def set_intern_table(cls, table):
+        """
+        Set the table used to intern Range objects.
+
+        :param table: the intern table, None disables interning
+        :type table: InternTable or NoneType
+        """
+        cls.INTERN_TABLE = table
+
+    @classmethod
+    def set_display_impl(cls, impl):
         """
         Set display implementation.
 
         :param type impl: the display implementation class
+
+        See :mod:`._display` for the requirements on a display
+        implementation.
         """
-        cls.STRING_CONFIG = StringConfig(
-            cls.STRING_CONFIG.VALUE_CONFIG, cls.STRING_CONFIG.DISPLAY_CONFIG, impl
+        cls._set_string_config(
+            StringConfig(
+                cls.STRING_CONFIG.VALUE_CONFIG, cls.STRING_CONFIG.DISPLAY_CONFIG, impl
+            )
         )
 
     @classmethod
@@ -216,8 +403,12 @@ class Config:
 
         :param DisplayConfig config: a configuration object
         """
-        cls.STRING_CONFIG = StringConfig(
-            cls.STRING_CONFIG.VALUE_CONFIG, config, cls.STRING_CONFIG.DISPLAY_IMPL_CLASS
+        cls._set_string_config(
+            StringConfig(
+                cls.STRING_CONFIG.VALUE_CONFIG,
+                config,
+                cls.STRING_CONFIG.DISPLAY_IMPL_CLASS,
+            )
         )
 
     @classmethod
@@ -227,8 +418,10 @@ class Config:
 
         :param :class:`ValueConfig` config: a configuration object
         """
-        cls.STRING_CONFIG = StringConfig(
-            config,
-            cls.STRING_CONFIG.DISPLAY_CONFIG,
-            cls.STRING_CONFIG.DISPLAY_IMPL_CLASS,
+        cls._set_string_config(
+            StringConfig(
+                config,
+                cls.STRING_CONFIG.DISPLAY_CONFIG,
+                cls.STRING_CONFIG.DISPLAY_IMPL_CLASS,
+            )
         )
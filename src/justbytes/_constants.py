@@ -33,12 +33,27 @@ RoundingMethods = justbases.RoundingMethods
 
 
 class Unit:
-    """Class to encapsulate unit information."""
+    """
+    Class to encapsulate unit information.
+
+    Unit objects are immutable.
+    """
+
+    __slots__ = ("_abbr", "_factor", "_prefix")
 
     def __init__(self, factor, prefix, abbr):
-        self._factor = factor
-        self._prefix = prefix
-        self._abbr = abbr
+        object.__setattr__(self, "_factor", factor)
+        object.__setattr__(self, "_prefix", prefix)
+        object.__setattr__(self, "_abbr", abbr)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __reduce__(self):
+        return (Unit, (self._factor, self._prefix, self._abbr))
 
     def __str__(self):
         return self.abbr + "B"
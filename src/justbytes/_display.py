@@ -0,0 +1,122 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Display implementations.
+
+A display implementation is a class which is constructed from a
+DisplayConfig and a base and which has an xform method that transforms a
+Radix and its relation to the actual value into a str.
+
+A display implementation may also define an xform_rational method, which
+transforms a rational value directly into a str, without constructing a
+Radix. It returns None if it can not transform the value, in which case
+the xform method is used instead.
+"""
+
+import justbases
+
+from ._radix import scaled
+
+_APPROX_STRS = {-1: "> ", 0: "", 1: "< "}
+
+
+class NativeString:
+    """
+    Convert size components to string according to configuration.
+
+    Produces exactly the same strings as justbases.String, but transforms
+    values in base 10 or 16 which have a terminating representation
+    directly, using integer arithmetic and str formatting.
+    """
+
+    def __init__(self, display, base):
+        """
+        Initializer.
+
+        :param DisplayConfig display: the display config
+        :param int base: the base of the radix
+
+        :raises BasesValueError: if the configuration cannot work
+        """
+        self._string = justbases.String(display, base)
+        self.CONFIG = display
+
+        digits_config = display.digits_config
+        if base == 10:  # noqa: PLR2004
+            self._fmt = "d"
+        elif base == 16 and digits_config.use_letters:  # noqa: PLR2004
+            self._fmt = "X" if digits_config.use_caps else "x"
+        else:
+            self._fmt = None
+
+        base_config = display.base_config
+        self._prefix = "0x" if base == 16 and base_config.use_prefix else ""  # noqa: PLR2004
+        self._suffix = f"_{base}" if base_config.use_subscript else ""
+
+    def xform(self, radix, relation):
+        """
+        Transform a radix and some information to a str according to
+        configurations.
+
+        :param Radix radix: the radix
+        :param int relation: relation of display value to actual value
+        :returns: a string representing the value
+        :rtype: str
+
+        :raises BasesValueError: if configuration does not work with value
+        """
+        return self._string.xform(radix, relation)
+
+    def xform_rational(self, value, config):
+        """
+        Transform a rational value to a str according to configurations.
+
+        :param Rational value: the value
+        :param ValueConfig config: how to calculate the value to display
+        :returns: a string representing the value or None
+        :rtype: str or NoneType
+        """
+        if self._fmt is None:
+            return None
+
+        parts = scaled(value, config.base, config.max_places, config.rounding_method)
+        if parts is None:
+            return None
+
+        (sign, result, places, relation) = parts
+        (left, right) = divmod(result, config.base**places)
+        right = format(right, f"0{places}{self._fmt}") if places != 0 else ""
+
+        strip_config = self.CONFIG.strip_config
+        if (
+            strip_config.strip
+            or (strip_config.strip_exact and relation == 0)
+            or (strip_config.strip_whole and relation == 0 and right.strip("0") == "")
+        ):
+            right = right.rstrip("0")
+
+        return "".join(
+            [
+                _APPROX_STRS[relation] if self.CONFIG.show_approx_str else "",
+                "-" if sign == -1 else "",
+                self._prefix,
+                format(left, self._fmt),
+                "." if right else "",
+                right,
+                self._suffix,
+            ]
+        )
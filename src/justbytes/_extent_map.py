@@ -0,0 +1,508 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""ExtentMap class, a persistent map from start address to extent.
+
+The map is an AVL tree whose nodes are never changed once constructed.
+An update copies only the nodes on the path from the root to the updated
+node, sharing every other node with the previous version, so every
+version of a map remains valid and versions share most of their storage.
+The difference between two versions is found by an in-order traversal of
+both which skips any subtree the versions share.
+"""
+
+# pylint: disable=protected-access
+
+from ._errors import RangeNonsensicalBinOpError, RangeValueError
+from ._extents import _address
+from ._size import Range
+
+
+class _Node:
+    """
+    A node of an ExtentMap, never changed after construction.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ("height", "key", "left", "length", "payload", "right")
+
+    def __init__(self, key, length, payload, left, right):
+        """
+        Initializer.
+
+        :param int key: the start address
+        :param int length: the length of the extent
+        :param object payload: the payload
+        :param left: the left subtree
+        :type left: _Node or NoneType
+        :param right: the right subtree
+        :type right: _Node or NoneType
+        """
+        self.key = key
+        self.length = length
+        self.payload = payload
+        self.left = left
+        self.right = right
+        left_height = 0 if left is None else left.height
+        right_height = 0 if right is None else right.height
+        self.height = 1 + max(left_height, right_height)
+
+
+def _height(node):
+    return 0 if node is None else node.height
+
+
+def _copy(node, left, right):
+    return _Node(node.key, node.length, node.payload, left, right)
+
+
+def _balance(node, left, right):
+    """
+    A copy of ``node`` with new subtrees, rebalanced.
+
+    :param _Node node: the node
+    :param left: the new left subtree, balanced
+    :type left: _Node or NoneType
+    :param right: the new right subtree, balanced
+    :type right: _Node or NoneType
+    :returns: the root of the balanced subtree
+    :rtype: _Node
+    """
+    balance = (0 if left is None else left.height) - (
+        0 if right is None else right.height
+    )
+    if -1 <= balance <= 1:
+        return _Node(node.key, node.length, node.payload, left, right)
+    if balance > 1:
+        if _height(left.left) >= _height(left.right):
+            return _copy(left, left.left, _copy(node, left.right, right))
+        pivot = left.right
+        return _copy(
+            pivot, _copy(left, left.left, pivot.left), _copy(node, pivot.right, right)
+        )
+    if _height(right.right) >= _height(right.left):
+        return _copy(right, _copy(node, left, right.left), right.right)
+    pivot = right.left
+    return _copy(
+        pivot, _copy(node, left, pivot.left), _copy(right, pivot.right, right.right)
+    )
+
+
+def _insert(node, key, length, payload):
+    """
+    Insert or replace the extent at ``key`` in the subtree at ``node``.
+
+    :returns: the root of the new subtree
+    :rtype: _Node
+    """
+    if node is None:
+        return _Node(key, length, payload, None, None)
+    if key < node.key:
+        return _balance(node, _insert(node.left, key, length, payload), node.right)
+    if key > node.key:
+        return _balance(node, node.left, _insert(node.right, key, length, payload))
+    return _Node(key, length, payload, node.left, node.right)
+
+
+def _replace(node, key, length, payload):
+    """
+    Replace the extent at ``key``, which is present, in the subtree at
+    ``node``. The shape of the subtree is unchanged.
+
+    :returns: the root of the new subtree
+    :rtype: _Node
+    """
+    path = []
+    while node.key != key:
+        path.append(node)
+        node = node.left if key < node.key else node.right
+    result = _Node(key, length, payload, node.left, node.right)
+    for parent in reversed(path):
+        result = (
+            _copy(parent, result, parent.right)
+            if key < parent.key
+            else _copy(parent, parent.left, result)
+        )
+    return result
+
+
+def _remove_first(node):
+    """
+    Remove the first node of the subtree at ``node``.
+
+    :returns: the root of the new subtree and the removed node
+    :rtype: tuple of (_Node or NoneType) * _Node
+    """
+    if node.left is None:
+        return (node.right, node)
+    (left, first) = _remove_first(node.left)
+    return (_balance(node, left, node.right), first)
+
+
+def _remove(node, key):
+    """
+    Remove the extent at ``key``, which is present, from the subtree at
+    ``node``.
+
+    :returns: the root of the new subtree
+    :rtype: _Node or NoneType
+    """
+    if key < node.key:
+        return _balance(node, _remove(node.left, key), node.right)
+    if key > node.key:
+        return _balance(node, node.left, _remove(node.right, key))
+    if node.left is None:
+        return node.right
+    if node.right is None:
+        return node.left
+    (right, successor) = _remove_first(node.right)
+    return _balance(successor, node.left, right)
+
+
+def _build(nodes, low, high):
+    """
+    Build a balanced subtree from sorted extents.
+
+    :param nodes: the keys, lengths and payloads of the extents
+    :type nodes: list of (int * int * object)
+    :param int low: the index of the first extent
+    :param int high: the index after the last extent
+    :returns: the root of the subtree
+    :rtype: _Node or NoneType
+    """
+    if low == high:
+        return None
+    middle = (low + high) // 2
+    (key, length, payload) = nodes[middle]
+    return _Node(
+        key,
+        length,
+        payload,
+        _build(nodes, low, middle),
+        _build(nodes, middle + 1, high),
+    )
+
+
+def _nodes(stack):
+    """
+    Yield the nodes on ``stack`` in order, consuming it.
+
+    :param stack: subtrees yet to be traversed and, as one-tuples, nodes
+       yet to be visited, the next at the top
+    :type stack: list of (_Node or NoneType or tuple of _Node)
+    :rtype: generator of _Node
+    """
+    while stack:
+        item = stack.pop()
+        if isinstance(item, tuple):
+            yield item[0]
+        elif item is not None:
+            stack.extend((item.right, (item,), item.left))
+
+
+def _expand(mine, theirs):
+    """
+    Expand the subtree at the top of one of two stacks, if any, choosing
+    the taller, so that a subtree of it may yet be found to be shared.
+
+    :param mine: a stack, as for _nodes, not empty
+    :param theirs: another stack, as for _nodes, not empty
+    :returns: True if a subtree was expanded, otherwise False
+    :rtype: bool
+    """
+    (top, other_top) = (mine[-1], theirs[-1])
+    mine_tree = not isinstance(top, tuple)
+    theirs_tree = not isinstance(other_top, tuple)
+    if not (mine_tree or theirs_tree):
+        return False
+    if mine_tree and (not theirs_tree or _height(top) >= _height(other_top)):
+        stack = mine
+    else:
+        stack = theirs
+    node = stack.pop()
+    if node is not None:
+        stack.extend((node.right, (node,), node.left))
+    return True
+
+
+def _diff(mine, theirs):
+    """
+    Yield the pairs of nodes at which two stacks differ, in order.
+
+    :param mine: a stack, as for _nodes
+    :param theirs: another stack, as for _nodes
+    :returns: pairs of nodes with the same key, or with None for a key
+       which is only in one
+    :rtype: generator of ((_Node or NoneType) * (_Node or NoneType))
+
+    Shared subtrees are skipped without being traversed.
+    """
+    while mine and theirs:
+        if mine[-1] is theirs[-1]:
+            mine.pop()
+            theirs.pop()
+            continue
+        if _expand(mine, theirs):
+            continue
+
+        ((node,), (other_node,)) = (mine[-1], theirs[-1])
+        if node.key < other_node.key:
+            mine.pop()
+            yield (node, None)
+        elif node.key > other_node.key:
+            theirs.pop()
+            yield (None, other_node)
+        else:
+            mine.pop()
+            theirs.pop()
+            if node.length != other_node.length or not (
+                node.payload is other_node.payload or node.payload == other_node.payload
+            ):
+                yield (node, other_node)
+
+    for node in _nodes(mine):
+        yield (node, None)
+    for node in _nodes(theirs):
+        yield (None, node)
+
+
+class ExtentMap:
+    """
+    Class for instantiating ExtentMap objects.
+
+    ExtentMap objects are immutable. They map the start address of each
+    extent to its length and a payload. Operations which change a map
+    return a new map, which shares storage with the old one, so that
+    taking a snapshot of a map is just keeping a reference to it.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    @classmethod
+    def _from_root(cls, root, size):
+        """
+        Construct an ExtentMap from a tree.
+
+        :param root: the root of the tree
+        :type root: _Node or NoneType
+        :param int size: the number of nodes in the tree
+        :returns: a new ExtentMap
+        :rtype: ExtentMap
+        """
+        result = object.__new__(cls)
+        object.__setattr__(result, "_root", root)
+        object.__setattr__(result, "_size", size)
+        return result
+
+    def __new__(cls, extents=()):
+        """
+        Construct a new ExtentMap object.
+
+        :param extents: the extents, in any order
+        :type extents: iterable of ((Range or int) * (Range or int) * object)
+        :raises RangeValueError: on bad parameters
+
+        Each extent is a triple of its start address, its length and its
+        payload. Ints are numbers of bytes. Where there are several extents
+        with the same start address, the last is kept.
+        """
+        table = {}
+        for extent_start, extent_length, payload in extents:
+            (start, length) = cls._bounds(extent_start, extent_length)
+            table[start] = (start, length, payload)
+        nodes = sorted(table.values(), key=lambda node: node[0])
+        return cls._from_root(_build(nodes, 0, len(nodes)), len(nodes))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __reduce__(self):
+        return (
+            ExtentMap,
+            ([(node.key, node.length, node.payload) for node in self._nodes()],),
+        )
+
+    @staticmethod
+    def _bounds(start, length):
+        """
+        The start address and length of an extent.
+
+        :param start: the start of the extent
+        :type start: Range or int
+        :param length: the length of the extent, greater than 0
+        :type length: Range or int
+        :rtype: tuple of int * int
+        :raises RangeValueError: on bad parameters
+        """
+        start = _address(start, "start")
+        length = _address(length, "length")
+        if length < 1:
+            raise RangeValueError(length, "length", "must be at least 1")
+        return (start, length)
+
+    def _nodes(self):
+        return _nodes([self._root])
+
+    def _find(self, key):
+        """
+        The node with the given key.
+
+        :param int key: the key
+        :rtype: _Node or NoneType
+        """
+        node = self._root
+        while node is not None and node.key != key:
+            node = node.left if key < node.key else node.right
+        return node
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return (
+            (
+                Range._from_magnitude(node.key),
+                Range._from_magnitude(node.length),
+                node.payload,
+            )
+            for node in self._nodes()
+        )
+
+    def __repr__(self):
+        return f"ExtentMap({[(n.key, n.length) for n in self._nodes()]!r})"
+
+    def __contains__(self, start):
+        return self._find(_address(start, "start")) is not None
+
+    def get(self, start, default=None):
+        """
+        The extent at a start address.
+
+        :param start: the start address
+        :type start: Range or int
+        :param object default: the result if there is no extent at start
+        :returns: the length and payload of the extent, or default
+        :rtype: (Range * object) or object
+        :raises RangeValueError: if start is not an integral number of bytes
+        """
+        node = self._find(_address(start, "start"))
+        if node is None:
+            return default
+        return (Range._from_magnitude(node.length), node.payload)
+
+    def find(self, address):
+        """
+        The extent which contains ``address``, if it starts at the greatest
+        start address not greater than ``address``.
+
+        :param address: the address
+        :type address: Range or int
+        :returns: the start, length and payload of the extent, or None
+        :rtype: (Range * Range * object) or NoneType
+        :raises RangeValueError: if address is not an integral number of bytes
+        """
+        address = _address(address, "address")
+        (node, found) = (self._root, None)
+        while node is not None:
+            if node.key <= address:
+                (node, found) = (node.right, node)
+            else:
+                node = node.left
+        if found is None or found.key + found.length <= address:
+            return None
+        return (
+            Range._from_magnitude(found.key),
+            Range._from_magnitude(found.length),
+            found.payload,
+        )
+
+    def set(self, start, length, payload=None):
+        """
+        Add an extent, replacing any extent with the same start address.
+
+        :param start: the start of the extent
+        :type start: Range or int
+        :param length: the length of the extent, greater than 0
+        :type length: Range or int
+        :param object payload: a payload associated with the extent
+        :returns: the new map
+        :rtype: ExtentMap
+        :raises RangeValueError: on bad parameters
+        """
+        (start, length) = self._bounds(start, length)
+        node = self._find(start)
+        if node is not None:
+            if node.length == length and node.payload is payload:
+                return self
+            return ExtentMap._from_root(
+                _replace(self._root, start, length, payload), self._size
+            )
+        return ExtentMap._from_root(
+            _insert(self._root, start, length, payload), self._size + 1
+        )
+
+    def remove(self, start):
+        """
+        Remove the extent at a start address.
+
+        :param start: the start address
+        :type start: Range or int
+        :returns: the new map
+        :rtype: ExtentMap
+        :raises RangeValueError: if there is no extent at start
+        """
+        start = _address(start, "start")
+        if self._find(start) is None:
+            raise RangeValueError(start, "start", "is not the start of an extent")
+        return ExtentMap._from_root(_remove(self._root, start), self._size - 1)
+
+    def diff(self, other):
+        """
+        The extents which differ between this map and ``other``.
+
+        :param ExtentMap other: the other map, typically a later version
+        :returns: the start address, and the length and payload in this
+           map and in other, or None where there is no extent, for every
+           start address at which the maps differ, in order
+        :rtype: generator of (Range * ((Range * object) or NoneType) *
+           ((Range * object) or NoneType))
+        :raises RangeNonsensicalBinOpError: if other is not an ExtentMap
+
+        Extents differ if their lengths differ or their payloads are not
+        equal. The time taken is proportional to the number of nodes which
+        the maps do not share, times the height of the trees.
+        """
+        if not isinstance(other, ExtentMap):
+            raise RangeNonsensicalBinOpError("diff", other)
+
+        def entry(node):
+            if node is None:
+                return None
+            return (Range._from_magnitude(node.length), node.payload)
+
+        return (
+            (
+                Range._from_magnitude((node or other_node).key),
+                entry(node),
+                entry(other_node),
+            )
+            for (node, other_node) in _diff([self._root], [other._root])
+        )
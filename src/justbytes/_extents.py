@@ -0,0 +1,279 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""ExtentSet class, for sets of byte addresses.
+
+An extent is a contiguous range of byte addresses, specified by its start
+address and its length. An ExtentSet stores a set of addresses as the
+minimal sorted sequence of disjoint, non-adjacent extents which covers it.
+"""
+
+# pylint: disable=protected-access
+
+import heapq
+import operator
+from bisect import bisect_right
+
+from ._array import _column
+from ._errors import RangeNonsensicalBinOpError, RangeValueError
+from ._size import Range
+
+
+def _address(value, param):
+    """
+    The integral number of bytes of ``value``.
+
+    :param value: the value, an int is a number of bytes
+    :type value: Range or int
+    :param str param: the parameter, for error messages
+    :returns: the number of bytes
+    :rtype: int
+    :raises RangeValueError: if value is fractional or of another type
+    """
+    if isinstance(value, Range):
+        value = value._magnitude
+    if type(value) is not int:
+        raise RangeValueError(value, param, "must be an integral number of bytes")
+    return value
+
+
+def _coalesce(pairs):
+    """
+    Coalesce extents.
+
+    :param pairs: pairs of start and end, sorted by start
+    :type pairs: iterable of (int * int)
+    :returns: the starts and lengths of the coalesced extents
+    :rtype: (list of int) * (list of int)
+    """
+    (starts, lengths) = ([], [])
+    (start, end) = (None, None)
+    for current_start, current_end in pairs:
+        if end is not None and current_start <= end:
+            end = max(end, current_end)
+            continue
+        if end is not None:
+            starts.append(start)
+            lengths.append(end - start)
+        (start, end) = (current_start, current_end)
+    if end is not None:
+        starts.append(start)
+        lengths.append(end - start)
+    return (starts, lengths)
+
+
+class ExtentSet:
+    """
+    Class for instantiating ExtentSet objects.
+
+    ExtentSet objects are immutable. The starts and lengths of the extents
+    are stored in parallel columns, sorted by start. Set operations merge
+    the columns of their operands in linear time.
+    """
+
+    __slots__ = ("_lengths", "_starts")
+
+    @classmethod
+    def _from_columns(cls, starts, lengths):
+        """
+        Construct an ExtentSet from coalesced, sorted extents.
+
+        :param starts: the starts of the extents
+        :type starts: list of int
+        :param lengths: the lengths of the extents, all greater than 0
+        :type lengths: list of int
+        :returns: a new ExtentSet
+        :rtype: ExtentSet
+        """
+        result = object.__new__(cls)
+        object.__setattr__(result, "_starts", _column(starts))
+        object.__setattr__(result, "_lengths", _column(lengths))
+        return result
+
+    def __new__(cls, extents=()):
+        """
+        Construct a new ExtentSet object.
+
+        :param extents: the extents, in any order, possibly overlapping
+        :type extents: iterable of ((Range or int) * (Range or int))
+        :raises RangeValueError: on bad parameters
+
+        Each extent is a pair of its start address and its length. Ints
+        are numbers of bytes. Extents of length 0 contribute nothing.
+        """
+        pairs = []
+        for extent_start, extent_length in extents:
+            start = _address(extent_start, "start")
+            length = _address(extent_length, "length")
+            if length < 0:
+                raise RangeValueError(length, "length", "must be at least 0")
+            if length != 0:
+                pairs.append((start, start + length))
+        pairs.sort()
+        return cls._from_columns(*_coalesce(pairs))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __reduce__(self):
+        return (ExtentSet._from_columns, (list(self._starts), list(self._lengths)))
+
+    def _pairs(self):
+        """
+        The start and end of every extent.
+
+        :returns: pairs of start and end, sorted
+        :rtype: iterable of (int * int)
+        """
+        return zip(self._starts, map(operator.add, self._starts, self._lengths))
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __iter__(self):
+        return (
+            (Range._from_magnitude(start), Range._from_magnitude(length))
+            for (start, length) in zip(self._starts, self._lengths)
+        )
+
+    def __repr__(self):
+        return f"ExtentSet({list(zip(self._starts, self._lengths))!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, ExtentSet):
+            return NotImplemented
+        return list(self._starts) == list(other._starts) and list(
+            self._lengths
+        ) == list(other._lengths)
+
+    def __hash__(self):
+        return hash((tuple(self._starts), tuple(self._lengths)))
+
+    def __contains__(self, address):
+        address = _address(address, "address")
+        index = bisect_right(self._starts, address) - 1
+        return index >= 0 and address < self._starts[index] + self._lengths[index]
+
+    def size(self):
+        """
+        The number of addresses in this set.
+
+        :returns: the sum of the lengths of the extents
+        :rtype: Range
+        """
+        return Range._from_magnitude(sum(self._lengths))
+
+    def _operand(self, other, operator_name):
+        """
+        Check that ``other`` is an ExtentSet.
+
+        :param object other: the other operand
+        :param str operator_name: the operator, for error messages
+        :returns: other
+        :rtype: ExtentSet
+        :raises RangeNonsensicalBinOpError: if other is not an ExtentSet
+        """
+        if not isinstance(other, ExtentSet):
+            raise RangeNonsensicalBinOpError(operator_name, other)
+        return other
+
+    def union(self, other):
+        """
+        The addresses in either set.
+
+        :param ExtentSet other: the other set
+        :rtype: ExtentSet
+        :raises RangeNonsensicalBinOpError: if other is not an ExtentSet
+        """
+        other = self._operand(other, "union")
+        return ExtentSet._from_columns(
+            *_coalesce(heapq.merge(self._pairs(), other._pairs()))
+        )
+
+    def intersection(self, other):
+        """
+        The addresses in both sets.
+
+        :param ExtentSet other: the other set
+        :rtype: ExtentSet
+        :raises RangeNonsensicalBinOpError: if other is not an ExtentSet
+        """
+        other = self._operand(other, "intersection")
+        (starts, lengths) = ([], [])
+        mine = list(self._pairs())
+        theirs = list(other._pairs())
+        (i, j) = (0, 0)
+        while i < len(mine) and j < len(theirs):
+            ((my_start, my_end), (their_start, their_end)) = (mine[i], theirs[j])
+            start = max(my_start, their_start)
+            end = min(my_end, their_end)
+            if start < end:
+                starts.append(start)
+                lengths.append(end - start)
+            if my_end < their_end:
+                i += 1
+            else:
+                j += 1
+        return ExtentSet._from_columns(starts, lengths)
+
+    def difference(self, other):
+        """
+        The addresses in this set, but not in ``other``.
+
+        :param ExtentSet other: the other set
+        :rtype: ExtentSet
+        :raises RangeNonsensicalBinOpError: if other is not an ExtentSet
+        """
+        other = self._operand(other, "difference")
+        (starts, lengths) = ([], [])
+        theirs = list(other._pairs())
+        j = 0
+        for my_start, end in self._pairs():
+            while j < len(theirs) and theirs[j][1] <= my_start:
+                j += 1
+            (k, start) = (j, my_start)
+            while k < len(theirs) and theirs[k][0] < end:
+                (their_start, their_end) = theirs[k]
+                if their_start > start:
+                    starts.append(start)
+                    lengths.append(their_start - start)
+                start = max(start, their_end)
+                k += 1
+            if start < end:
+                starts.append(start)
+                lengths.append(end - start)
+        return ExtentSet._from_columns(starts, lengths)
+
+    def complement(self, start, length):
+        """
+        The addresses in the given extent, but not in this set.
+
+        :param start: the start of the extent
+        :type start: Range or int
+        :param length: the length of the extent
+        :type length: Range or int
+        :rtype: ExtentSet
+        :raises RangeValueError: on bad parameters
+        """
+        return ExtentSet([(start, length)]).difference(self)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
@@ -0,0 +1,215 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Compiled formatters for Range objects."""
+
+# pylint: disable=protected-access
+
+import copy
+from bisect import bisect_right
+from fractions import Fraction
+
+from ._radix import from_rational
+from ._size import Range, _unit_limits
+
+
+class Formatter:
+    """
+    A callable which formats a Range according to a fixed StringConfig.
+
+    All interpretation of the configuration, e.g., selection of the unit
+    table and calculation of the limits which determine the unit, is done
+    once, on construction. Formatter objects are immutable and hashable,
+    and may be shared among threads.
+
+    Obtain a Formatter with :meth:`._config.StringConfig.compile`.
+    """
+
+    __slots__ = (
+        "_base",
+        "_exact",
+        "_factors",
+        "_key",
+        "_last",
+        "_limits",
+        "_method",
+        "_places",
+        "_suffixes",
+        "_units",
+        "_value_config",
+        "_xform",
+        "_xform_rational",
+    )
+
+    def __init__(self, config):
+        """
+        Initializer.
+
+        :param StringConfig config: the configuration
+
+        The configuration is copied, so later changes to it do not
+        affect the formatter.
+        """
+        value_config = copy.copy(config.VALUE_CONFIG)
+        display_config = copy.deepcopy(config.DISPLAY_CONFIG)
+        display_impl = config.DISPLAY_IMPL_CLASS(display_config, value_config.base)
+
+        if value_config.unit is None:
+            (units, limits) = _unit_limits(
+                value_config.binary_units, value_config.min_value
+            )
+        else:
+            (units, limits) = ((value_config.unit,), ())
+
+        set_ = object.__setattr__
+        set_(self, "_value_config", value_config)
+        set_(self, "_units", units)
+        set_(self, "_limits", limits)
+        set_(self, "_last", len(units) - 1)
+        set_(self, "_factors", tuple(unit.factor for unit in units))
+        set_(
+            self,
+            "_suffixes",
+            tuple(f" {unit.abbr}{Range._BYTES_SYMBOL}" for unit in units),
+        )
+        set_(self, "_exact", value_config.exact_value and value_config.unit is None)
+        set_(self, "_base", value_config.base)
+        set_(self, "_places", value_config.max_places)
+        set_(self, "_method", value_config.rounding_method)
+        set_(self, "_xform", display_impl.xform)
+        set_(self, "_xform_rational", getattr(display_impl, "xform_rational", None))
+        set_(
+            self,
+            "_key",
+            (
+                value_config.base,
+                value_config.binary_units,
+                value_config.exact_value,
+                value_config.max_places,
+                value_config.min_value,
+                value_config.rounding_method,
+                value_config.unit,
+                display_config.show_approx_str,
+                display_config.base_config.use_prefix,
+                display_config.base_config.use_subscript,
+                display_config.digits_config.separator,
+                display_config.digits_config.use_caps,
+                display_config.digits_config.use_letters,
+                display_config.strip_config.strip,
+                display_config.strip_config.strip_exact,
+                display_config.strip_config.strip_whole,
+                config.DISPLAY_IMPL_CLASS,
+            ),
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __eq__(self, other):
+        if not isinstance(other, Formatter):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __repr__(self):
+        return f"Formatter({self._value_config!r})"
+
+    def _exact_index(self, magnitude, index):
+        """
+        The index of the largest unit, no larger than the unit at ``index``,
+        in which ``magnitude`` can be displayed exactly.
+
+        :param magnitude: the number of bytes
+        :type magnitude: int or Fraction
+        :param int index: the index of the largest unit to consider
+        :returns: the index of the unit, 0 if no larger unit is exact
+        :rtype: int
+        """
+        for i in range(index, 0, -1):
+            value = Fraction(magnitude, self._factors[i])
+            if from_rational(value, self._base, self._places, self._method)[1] == 0:
+                return i
+        return 0
+
+    def components(self, value):
+        """
+        Return a representation of ``value``, decomposed into a Fraction
+        value and a unit.
+
+        :param Range value: the value
+        :returns: a pair of a Fraction value and a unit
+        :rtype: tuple of Fraction * unit
+
+        The result is the same as that of :meth:`._size.Range.components`
+        for the configuration.
+        """
+        magnitude = value._magnitude
+        index = min(bisect_right(self._limits, abs(magnitude)), self._last)
+        if self._exact:
+            index = self._exact_index(magnitude, index)
+        return (Fraction(magnitude, self._factors[index]), self._units[index])
+
+    def __call__(self, value):
+        """
+        Return a string representation of ``value``.
+
+        :param Range value: the value
+        :returns: a string representation
+        :rtype: str
+
+        The result is the same as that of :meth:`._size.Range.getString`
+        for the configuration.
+        """
+        return self._format(value._magnitude)
+
+    def _format(self, magnitude):
+        """
+        Return a string representation of a number of bytes.
+
+        :param magnitude: the number of bytes
+        :type magnitude: int or Fraction
+        :returns: a string representation
+        :rtype: str
+        """
+        index = min(bisect_right(self._limits, abs(magnitude)), self._last)
+        if self._exact:
+            index = self._exact_index(magnitude, index)
+        converted = Fraction(magnitude, self._factors[index])
+
+        xform_rational = self._xform_rational
+        number = (
+            None
+            if xform_rational is None
+            else xform_rational(converted, self._value_config)
+        )
+        if number is None:
+            (result, relation) = from_rational(
+                converted, self._base, self._places, self._method
+            )
+            number = self._xform(result, relation)
+        return number + self._suffixes[index]
@@ -0,0 +1,246 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""RangeHistogram class, for distributions of Range values."""
+
+# pylint: disable=protected-access
+
+import functools
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from fractions import Fraction
+
+from ._array import _INTEGER_TYPECODES, RangeArray
+from ._config import Config
+from ._constants import PRECISE_NUMERIC_TYPES, BinaryUnits, DecimalUnits
+from ._errors import RangeNonsensicalBinOpError, RangeValueError
+from ._size import Range, _unit_limits
+
+
+class RangeHistogram:
+    """
+    Counts of Range values in buckets delimited by a sequence of edges.
+
+    With edges e_0 < e_1 < ... < e_n-1 there are n + 1 buckets. The first
+    bucket holds values less than e_0, bucket i holds values at least
+    e_i-1 and less than e_i, and the last bucket holds values at least
+    e_n-1.
+    """
+
+    __slots__ = ("_absolute", "_counts", "_edges")
+
+    def __init__(self, edges, absolute=False):
+        """
+        Initializer.
+
+        :param edges: the edges, in strictly increasing order
+        :type edges: iterable of Range
+        :param bool absolute: if True, bucket values by their absolute value
+        :raises RangeValueError: if the edges are not increasing Ranges
+        """
+        edges = list(edges)
+        if not edges or not all(isinstance(x, Range) for x in edges):
+            raise RangeValueError(edges, "edges", "must be a non-empty list of Range")
+        magnitudes = tuple(x._magnitude for x in edges)
+        if any(x >= y for (x, y) in zip(magnitudes, magnitudes[1:])):
+            raise RangeValueError(edges, "edges", "must be strictly increasing")
+
+        self._edges = magnitudes
+        self._absolute = absolute
+        self._counts = [0] * (len(magnitudes) + 1)
+
+    @classmethod
+    def log2(cls, max_exponent=80):
+        """
+        A histogram with an edge at every power of two bytes.
+
+        :param int max_exponent: the exponent of the largest edge, at least 0
+        :returns: a histogram with edges 1 B, 2 B, 4 B, ..., 2**max_exponent B
+        :rtype: RangeHistogram
+        :raises RangeValueError: if max_exponent is less than 0
+        """
+        if max_exponent < 0:
+            raise RangeValueError(max_exponent, "max_exponent", "must be at least 0")
+        return cls(Range(2**x) for x in range(max_exponent + 1))
+
+    @classmethod
+    def units(cls, binary_units=True, min_value=1):
+        """
+        A histogram with a bucket for each unit, as selected for display.
+
+        :param bool binary_units: binary units if True, else SI
+        :param min_value: the smallest value to display, see ValueConfig
+        :type min_value: a precise numeric type
+        :returns: a histogram which buckets values by absolute value
+        :rtype: RangeHistogram
+        :raises RangeValueError: if min_value is not usable
+
+        The index of the bucket for a value is the index, in B followed by
+        the units, of the unit which :meth:`._size.Range.components` would
+        choose to display it, given the same binary_units and min_value.
+        """
+        if min_value < 0 or not isinstance(min_value, PRECISE_NUMERIC_TYPES):
+            raise RangeValueError(
+                min_value, "min_value", "must be a precise positive numeric value."
+            )
+
+        # The edges are the limits used by components, which need not be
+        # strictly increasing, or integral, so no Range is made of them.
+        (_, limits) = _unit_limits(binary_units, min_value)
+        result = object.__new__(cls)
+        result._edges = limits[:-1]
+        result._absolute = True
+        result._counts = [0] * len(limits)
+        return result
+
+    def __len__(self):
+        return len(self._counts)
+
+    def __repr__(self):
+        return f"RangeHistogram({self._counts!r})"
+
+    def edges(self):
+        """
+        The edges of the buckets.
+
+        :rtype: list of Range
+        """
+        return [Range._from_magnitude(x) for x in self._edges]
+
+    def counts(self):
+        """
+        The number of values in each bucket.
+
+        :rtype: list of int
+        """
+        return self._counts[:]
+
+    def total(self):
+        """
+        The number of values in all buckets.
+
+        :rtype: int
+        """
+        return sum(self._counts)
+
+    def _index(self, magnitude):
+        """
+        The index of the bucket for a magnitude.
+
+        :param magnitude: the magnitude
+        :type magnitude: int or Fraction
+        :rtype: int
+        """
+        return bisect_right(
+            self._edges, abs(magnitude) if self._absolute else magnitude
+        )
+
+    def add(self, value, count=1):
+        """
+        Add a value.
+
+        :param value: the value, an int is a number of bytes
+        :type value: Range or int
+        :param int count: the number of times to add the value
+        :raises RangeNonsensicalBinOpError: if value is of another type
+        """
+        if isinstance(value, Range):
+            self._counts[self._index(value._magnitude)] += count
+        elif isinstance(value, int):
+            self._counts[self._index(value)] += count
+        else:
+            raise RangeNonsensicalBinOpError("+", value)
+
+    def add_many(self, values):
+        """
+        Add many values at once.
+
+        :param values: the values, ints are numbers of bytes
+        :type values: RangeArray, array of int, or iterable of Range or int
+        :raises RangeNonsensicalBinOpError: if a value is of another type
+
+        The values of a RangeArray or of an array of integers are bucketed
+        without constructing any intermediate objects.
+        """
+        if isinstance(values, RangeArray):
+            magnitudes = (
+                values._numerators
+                if values._denominators is None
+                else values._magnitudes()
+            )
+        elif isinstance(values, array) and values.typecode in _INTEGER_TYPECODES:
+            magnitudes = values
+        else:
+            for value in values:
+                self.add(value)
+            return
+
+        if self._absolute:
+            magnitudes = map(abs, magnitudes)
+        index = functools.partial(bisect_right, self._edges)
+        for bucket, count in Counter(map(index, magnitudes)).items():
+            self._counts[bucket] += count
+
+    def merge(self, other):
+        """
+        Add the counts of ``other``.
+
+        :param RangeHistogram other: a histogram with the same buckets
+        :returns: this object
+        :rtype: RangeHistogram
+        :raises RangeNonsensicalBinOpError: if other is not a RangeHistogram
+        :raises RangeValueError: if other has different buckets
+        """
+        if not isinstance(other, RangeHistogram):
+            raise RangeNonsensicalBinOpError("merge", other)
+        if (other._edges, other._absolute) != (self._edges, self._absolute):
+            raise RangeValueError(other, "other", "has different buckets")
+        self._counts = [x + y for (x, y) in zip(self._counts, other._counts)]
+        return self
+
+    def labels(self, config=None):
+        """
+        Labels for the buckets, e.g., "[1 KiB, 2 KiB)".
+
+        :param config: the configuration, default is current
+        :type config: StringConfig or NoneType
+        :returns: a label for each bucket
+        :rtype: list of str
+
+        The edges are represented by :meth:`._size.Range.getString`. The
+        labels of a histogram which buckets by absolute value describe
+        the absolute values.
+        """
+        config = Config.get_string_config() if config is None else config
+        names = [Range._from_magnitude(x).getString(config) for x in self._edges]
+        return (
+            [f"< {names[0]}"]
+            + [f"[{x}, {y})" for (x, y) in zip(names, names[1:])]
+            + [f">= {names[-1]}"]
+        )
+
+    def items(self, config=None):
+        """
+        The label and count of every bucket.
+
+        :param config: the configuration, default is current
+        :type config: StringConfig or NoneType
+        :returns: pairs of label and count
+        :rtype: list of (str * int)
+        """
+        return list(zip(self.labels(config), self._counts))
@@ -0,0 +1,98 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Interning of Range objects."""
+
+from collections import namedtuple
+
+from ._errors import RangeValueError
+
+InternStats = namedtuple("InternStats", ["hits", "misses", "size", "maxsize"])
+
+
+class InternTable:
+    """
+    A bounded table of canonical Range objects, keyed by magnitude.
+
+    Once the table is full, the oldest entry is evicted to make room for
+    a new one. An evicted Range remains valid, it is simply no longer
+    the canonical Range for its magnitude.
+    """
+
+    def __init__(self, maxsize=4096):
+        """
+        Initializer.
+
+        :param int maxsize: the maximum number of entries, at least 1
+        :raises RangeValueError: if maxsize is less than 1
+        """
+        if maxsize < 1:
+            raise RangeValueError(maxsize, "maxsize", "must be at least 1")
+
+        self._maxsize = maxsize
+        self._table = {}
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        return len(self._table)
+
+    def get(self, magnitude):
+        """
+        Get the canonical Range for ``magnitude``.
+
+        :param magnitude: the internal magnitude of a Range
+        :type magnitude: int or Fraction
+        :returns: the canonical Range or None if there is none
+        :rtype: Range or NoneType
+        """
+        result = self._table.get(magnitude)
+        if result is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return result
+
+    def add(self, magnitude, value):
+        """
+        Make ``value`` the canonical Range for ``magnitude``.
+
+        :param magnitude: the internal magnitude of ``value``
+        :type magnitude: int or Fraction
+        :param Range value: the Range
+        """
+        table = self._table
+        if len(table) >= self._maxsize:
+            table.pop(next(iter(table)), None)
+        table[magnitude] = value
+
+    def clear(self):
+        """
+        Remove all entries and reset the statistics.
+        """
+        self._table.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def stats(self):
+        """
+        Statistics about use of this table.
+
+        :returns: hits, misses, current size and maximum size
+        :rtype: InternStats
+        """
+        return InternStats(self._hits, self._misses, len(self._table), self._maxsize)
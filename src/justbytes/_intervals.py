@@ -0,0 +1,358 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""IntervalTree class, for overlap queries on extents which change.
+
+The tree is an AVL tree of extents, ordered by start address, in which
+every node also records the greatest end address in its subtree. Any
+subtree whose greatest end address does not exceed the start of a query
+can be skipped, so an overlap query takes O(log n + k) time for k results.
+"""
+
+from ._errors import RangeValueError
+from ._extents import _address
+from ._size import Range
+
+
+class _Node:
+    """
+    A node of an IntervalTree.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ("end", "height", "key", "left", "max_end", "payload", "right")
+
+    def __init__(self, key, payload):
+        """
+        Initializer.
+
+        :param key: the start, the end, and a sequence number
+        :type key: tuple of int * int * int
+        :param object payload: the payload
+        """
+        self.key = key
+        self.end = key[1]
+        self.payload = payload
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.max_end = key[1]
+
+
+def _height(node):
+    return 0 if node is None else node.height
+
+
+def _update(node):
+    """
+    Recompute the height and greatest end address of ``node``.
+
+    :param _Node node: the node
+    """
+    (left, right) = (node.left, node.right)
+    (height, max_end) = (0, node.end)
+    if left is not None:
+        (height, max_end) = (left.height, max(max_end, left.max_end))
+    if right is not None:
+        height = max(height, right.height)
+        max_end = max(max_end, right.max_end)
+    node.height = height + 1
+    node.max_end = max_end
+
+
+def _rotate_right(node):
+    pivot = node.left
+    (node.left, pivot.right) = (pivot.right, node)
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node):
+    pivot = node.right
+    (node.right, pivot.left) = (pivot.left, node)
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node):
+    """
+    Restore the AVL invariant at ``node``.
+
+    :param _Node node: a node whose subtrees are balanced
+    :returns: the root of the balanced subtree
+    :rtype: _Node
+    """
+    _update(node)
+    (left, right) = (node.left, node.right)
+    balance = (0 if left is None else left.height) - (
+        0 if right is None else right.height
+    )
+    if -1 <= balance <= 1:
+        return node
+    if balance > 1:
+        if _height(left.left) < _height(left.right):
+            node.left = _rotate_left(left)
+        return _rotate_right(node)
+    if _height(right.right) < _height(right.left):
+        node.right = _rotate_right(right)
+    return _rotate_left(node)
+
+
+def _insert(node, new):
+    """
+    Insert ``new`` into the subtree rooted at ``node``.
+
+    :returns: the root of the subtree
+    :rtype: _Node
+    """
+    if node is None:
+        return new
+    if new.key < node.key:
+        node.left = _insert(node.left, new)
+    else:
+        node.right = _insert(node.right, new)
+    return _rebalance(node)
+
+
+def _remove_first(node):
+    """
+    Remove the first node of the subtree rooted at ``node``.
+
+    :returns: the root of the subtree and the removed node
+    :rtype: tuple of (_Node or NoneType) * _Node
+    """
+    if node.left is None:
+        return (node.right, node)
+    (node.left, first) = _remove_first(node.left)
+    return (_rebalance(node), first)
+
+
+def _remove(node, key):
+    """
+    Remove the node with ``key`` from the subtree rooted at ``node``.
+
+    :returns: the root of the subtree
+    :rtype: _Node or NoneType
+    """
+    if key < node.key:
+        node.left = _remove(node.left, key)
+    elif key > node.key:
+        node.right = _remove(node.right, key)
+    else:
+        if node.left is None:
+            return node.right
+        if node.right is None:
+            return node.left
+        (right, successor) = _remove_first(node.right)
+        (successor.left, successor.right) = (node.left, right)
+        node = successor
+    return _rebalance(node)
+
+
+class IntervalTree:
+    """
+    A mutable collection of extents, each with an optional payload, which
+    supports efficient overlap queries.
+
+    An extent is specified by its start address and its length. Extents
+    may overlap, and the same extent may be inserted more than once.
+    Query results are ordered by start address and are computed lazily.
+    """
+
+    __slots__ = ("_root", "_sequence", "_size")
+
+    def __init__(self, extents=()):
+        """
+        Initializer.
+
+        :param extents: initial extents, as pairs of start and length
+        :type extents: iterable of ((Range or int) * (Range or int))
+        :raises RangeValueError: on bad parameters
+        """
+        self._root = None
+        self._size = 0
+        self._sequence = 0
+        for start, length in extents:
+            self.insert(start, length)
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return f"IntervalTree({[(int(s), int(n)) for (s, n, _) in self]!r})"
+
+    @staticmethod
+    def _bounds(start, length):
+        """
+        The start and end addresses of an extent.
+
+        :param start: the start of the extent
+        :type start: Range or int
+        :param length: the length of the extent, greater than 0
+        :type length: Range or int
+        :rtype: tuple of int * int
+        :raises RangeValueError: on bad parameters
+        """
+        start = _address(start, "start")
+        length = _address(length, "length")
+        if length < 1:
+            raise RangeValueError(length, "length", "must be at least 1")
+        return (start, start + length)
+
+    def insert(self, start, length, payload=None):
+        """
+        Insert an extent.
+
+        :param start: the start of the extent
+        :type start: Range or int
+        :param length: the length of the extent, greater than 0
+        :type length: Range or int
+        :param object payload: a payload associated with the extent
+        :raises RangeValueError: on bad parameters
+        """
+        (start, end) = self._bounds(start, length)
+        self._sequence += 1
+        self._root = _insert(self._root, _Node((start, end, self._sequence), payload))
+        self._size += 1
+
+    def remove(self, start, length):
+        """
+        Remove an extent, the earliest inserted if there are several.
+
+        :param start: the start of the extent
+        :type start: Range or int
+        :param length: the length of the extent
+        :type length: Range or int
+        :returns: the payload of the removed extent
+        :rtype: object
+        :raises RangeValueError: if the extent is not present
+        """
+        (start, end) = self._bounds(start, length)
+        node = self._root
+        found = None
+        while node is not None:
+            if (start, end) <= node.key[:2]:
+                if node.key[:2] == (start, end):
+                    found = node
+                node = node.left
+            else:
+                node = node.right
+        if found is None:
+            raise RangeValueError((start, end - start), "extent", "is not present")
+
+        self._root = _remove(self._root, found.key)
+        self._size -= 1
+        return found.payload
+
+    def _overlapping(self, start, end):
+        """
+        Yield the nodes whose extents overlap [start, end), in order.
+
+        :param int start: the first address
+        :param end: the address after the last, None if unbounded
+        :type end: int or NoneType
+        :rtype: generator of _Node
+        """
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            # Descend leftward, skipping subtrees that end before start
+            while node is not None and node.max_end > start:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if end is not None and node.key[0] >= end:
+                return
+            if node.end > start:
+                yield node
+            node = node.right
+
+    def __iter__(self):
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            (start, end, _) = node.key
+            yield (
+                Range._from_magnitude(start),
+                Range._from_magnitude(end - start),
+                node.payload,
+            )
+            node = node.right
+
+    def overlap(self, start, length):
+        """
+        The extents which overlap the given extent.
+
+        :param start: the start of the extent
+        :type start: Range or int
+        :param length: the length of the extent, greater than 0
+        :type length: Range or int
+        :returns: the start, length and payload of each overlapping extent
+        :rtype: generator of (Range * Range * object)
+        :raises RangeValueError: on bad parameters
+        """
+        (start, end) = self._bounds(start, length)
+        return (
+            (
+                Range._from_magnitude(node.key[0]),
+                Range._from_magnitude(node.end - node.key[0]),
+                node.payload,
+            )
+            for node in self._overlapping(start, end)
+        )
+
+    def stab(self, address):
+        """
+        The extents which contain ``address``.
+
+        :param address: the address
+        :type address: Range or int
+        :returns: the start, length and payload of each containing extent
+        :rtype: generator of (Range * Range * object)
+        :raises RangeValueError: if address is not an integral number of bytes
+        """
+        return self.overlap(address, 1)
+
+    def find_gap(self, length, start=0):
+        """
+        The first address, at least ``start``, at which an extent of the
+        given length would overlap no extent in this tree.
+
+        :param length: the length of the gap, greater than 0
+        :type length: Range or int
+        :param start: the least acceptable address
+        :type start: Range or int
+        :returns: the start of the gap
+        :rtype: Range
+        :raises RangeValueError: on bad parameters
+        """
+        (start, end) = self._bounds(start, length)
+        length = end - start
+        for node in self._overlapping(start, None):
+            if node.key[0] >= start + length:
+                break
+            start = max(start, node.end)
+        return Range._from_magnitude(start)
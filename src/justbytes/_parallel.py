@@ -0,0 +1,182 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Formatting of many Range objects in parallel."""
+
+# pylint: disable=protected-access
+
+import collections
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+
+from ._array import RangeArray, _column
+from ._config import Config, StringConfig, ValueConfig
+from ._constants import ROUNDING_METHODS, UNITS
+from ._errors import RangeValueError
+
+# The state of a worker process, set by _initialize
+_WORKER = {}
+
+
+def _initialize(value_args, display_config, display_impl):
+    """
+    Initialize a worker process.
+
+    :param tuple value_args: the arguments from _value_args
+    :param DisplayConfig display_config: the display configuration
+    :param type display_impl: the display implementation class
+
+    Units and rounding methods are compared by identity, so they are
+    passed by index and the ValueConfig is reconstructed from them.
+    """
+    (max_places, min_value, binary_units, exact_value, unit, base, method) = value_args
+    value_config = ValueConfig(
+        max_places=max_places,
+        min_value=min_value,
+        binary_units=binary_units,
+        exact_value=exact_value,
+        unit=None if unit is None else UNITS()[unit],
+        base=base,
+        rounding_method=ROUNDING_METHODS()[method],
+    )
+    _WORKER["formatter"] = StringConfig(
+        value_config, display_config, display_impl
+    ).compile()
+
+
+def _value_args(config):
+    """
+    The arguments from which _initialize reconstructs ``config``.
+
+    :param ValueConfig config: the value configuration
+    :returns: the arguments
+    :rtype: tuple
+    """
+    return (
+        config.max_places,
+        config.min_value,
+        config.binary_units,
+        config.exact_value,
+        None if config.unit is None else UNITS().index(config.unit),
+        config.base,
+        ROUNDING_METHODS().index(config.rounding_method),
+    )
+
+
+def _format_chunk(numerators, denominators):
+    """
+    Format a chunk of magnitudes in a worker process.
+
+    :param numerators: the numerators of the magnitudes
+    :type numerators: array of int or list of int
+    :param denominators: the denominators or None if all are integers
+    :type denominators: array of int or list of int or NoneType
+    :returns: the string representations
+    :rtype: list of str
+    """
+    format_ = _WORKER["formatter"]._format
+    if denominators is None:
+        return [format_(x) for x in numerators]
+    return [format_(Fraction(n, d)) for (n, d) in zip(numerators, denominators)]
+
+
+def _chunks(ranges, chunk_size):
+    """
+    Split ``ranges`` into columns of magnitudes.
+
+    :param ranges: the Ranges
+    :type ranges: RangeArray or iterable of Range
+    :param int chunk_size: the maximum number of Ranges in a chunk
+    :returns: pairs of numerators and denominators, as for _format_chunk
+    :rtype: generator
+    """
+    if isinstance(ranges, RangeArray):
+        for start in range(0, len(ranges), chunk_size):
+            chunk = ranges[start : start + chunk_size]
+            yield (chunk._numerators, chunk._denominators)
+        return
+
+    iterator = iter(ranges)
+    while True:
+        magnitudes = [x._magnitude for x in itertools.islice(iterator, chunk_size)]
+        if not magnitudes:
+            return
+        try:
+            yield (_column(magnitudes), None)
+        except TypeError:
+            magnitudes = [Fraction(x) for x in magnitudes]
+            yield (
+                _column([x.numerator for x in magnitudes]),
+                _column([x.denominator for x in magnitudes]),
+            )
+
+
+def format_many(ranges, config=None, workers=None, *, chunk_size=65536):
+    """
+    Format many Ranges using a pool of worker processes.
+
+    :param ranges: the Ranges
+    :type ranges: RangeArray or iterable of Range
+    :param config: the configuration, default is current
+    :type config: StringConfig or NoneType
+    :param workers: the number of processes, default is the number of CPUs
+    :type workers: int or NoneType
+    :param int chunk_size: the number of Ranges sent to a worker at a time
+    :returns: the string representation of each Range, in order
+    :rtype: list of str
+    :raises RangeValueError: on bad parameters
+
+    Ranges are sent to workers as columns of integers, and each worker
+    reconstructs the configuration once, on startup. If workers is 1,
+    the Ranges are formatted in this process.
+
+    The display implementation class must be importable by the workers.
+    """
+    config = Config.get_string_config() if config is None else config
+    workers = (os.cpu_count() or 1) if workers is None else workers
+
+    if workers < 1:
+        raise RangeValueError(workers, "workers", "must be at least 1")
+    if chunk_size < 1:
+        raise RangeValueError(chunk_size, "chunk_size", "must be at least 1")
+
+    if workers == 1:
+        formatter = config.compile()
+        return [formatter(x) for x in ranges]
+
+    results = []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize,
+        initargs=(
+            _value_args(config.VALUE_CONFIG),
+            config.DISPLAY_CONFIG,
+            config.DISPLAY_IMPL_CLASS,
+        ),
+    ) as executor:
+        # Bound the number of chunks in flight, so that memory use does not
+        # depend on the number of Ranges.
+        pending = collections.deque()
+        for chunk in _chunks(ranges, chunk_size):
+            if len(pending) == 2 * workers:
+                results.extend(pending.popleft().result())
+            pending.append(executor.submit(_format_chunk, *chunk))
+        while pending:
+            results.extend(pending.popleft().result())
+    return results
@@ -0,0 +1,142 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Parsing of human-readable Range strings."""
+
+import functools
+import re
+from fractions import Fraction
+
+from ._constants import UNITS, B, DecimalUnits
+from ._errors import RangeValueError
+
+
+def _unit_names():
+    """
+    All the names by which a unit may be specified.
+
+    :returns: a map from names to units
+    :rtype: dict of str * Unit
+
+    Abbreviations are case-sensitive, except that "K" is accepted for
+    kilo, as in the constant name KB. Prefixed forms of "bytes" are
+    matched case-insensitively by the scanner.
+    """
+    names = {"": B, "B": B, "K": DecimalUnits.KB, "KB": DecimalUnits.KB}
+    for unit in UNITS():
+        if unit is not B:
+            names[unit.abbr] = unit
+            names[unit.abbr + "B"] = unit
+    return names
+
+
+_ABBRS = _unit_names()
+
+_WORDS = {
+    f"{unit.prefix}{suffix}": unit for unit in UNITS() for suffix in ("byte", "bytes")
+}
+
+_NUMBER = (
+    r"\s*(?P<sign>[+-]?)"
+    r"(?:(?P<whole>\d+)(?:\.(?P<point>\d*))?|\.(?P<fraction>\d+))"
+    r"(?:[eE](?P<exponent>[+-]?\d+))?"
+)
+
+_NUMBER_SCANNER = re.compile(_NUMBER + r"\s*")
+
+_SCANNER = re.compile(
+    _NUMBER
+    + r"\s*(?:(?P<abbr>{})|(?P<word>{}))\s*".format(
+        "|".join(re.escape(x) for x in sorted(_ABBRS, key=len, reverse=True)),
+        "(?i:{})".format(
+            "|".join(re.escape(x) for x in sorted(_WORDS, key=len, reverse=True))
+        ),
+    )
+)
+
+
+def _convert(match, factor):
+    """
+    Convert a matched number to an exact value.
+
+    :param match: a match of a pattern which includes _NUMBER
+    :type match: re.Match
+    :param factor: the factor by which to multiply the number
+    :type factor: int or Fraction
+    :returns: the value of the number multiplied by factor
+    :rtype: int or Fraction
+    """
+    (whole, point, fraction, exponent) = match.group(
+        "whole", "point", "fraction", "exponent"
+    )
+    places = point or fraction or ""
+
+    numerator = int((whole or "") + places) * factor
+    denominator = 10 ** len(places)
+    if exponent is not None:
+        exponent = int(exponent)
+        if exponent >= 0:
+            numerator *= 10**exponent
+        else:
+            denominator *= 10**-exponent
+
+    if match.group("sign") == "-":
+        numerator = -numerator
+
+    if type(numerator) is int and numerator % denominator == 0:
+        return numerator // denominator
+    result = Fraction(numerator, denominator)
+    return result.numerator if result.denominator == 1 else result
+
+
+def parse_number(text, factor=1):
+    """
+    Parse a decimal number, optionally multiplied by a factor.
+
+    :param str text: the text, e.g., "1.5" or "-2e3"
+    :param factor: the factor by which to multiply the number
+    :type factor: int or Fraction
+    :returns: the exact value
+    :rtype: int or Fraction
+    :raises RangeValueError: if the text can not be parsed
+    """
+    match = _NUMBER_SCANNER.fullmatch(text)
+    if match is None:
+        raise RangeValueError(text, "text", "not a decimal number")
+    return _convert(match, factor)
+
+
+@functools.lru_cache(maxsize=1024)
+def parse(text):
+    """
+    Parse a human-readable size into a number of bytes.
+
+    :param str text: the text, e.g., "1.5 GiB", "512k", or "4 megabytes"
+    :returns: the number of bytes
+    :rtype: int or Fraction
+    :raises RangeValueError: if the text can not be parsed
+
+    The number is a decimal, optionally signed and with an exponent. It
+    is converted exactly, without recourse to the Fraction constructor.
+    """
+    match = _SCANNER.fullmatch(text)
+    if match is None:
+        raise RangeValueError(text, "text", "not a recognized size")
+
+    abbr = match.group("abbr")
+    unit = _ABBRS[abbr] if abbr is not None else _WORDS[match.group("word").lower()]
+    return _convert(match, unit.factor)
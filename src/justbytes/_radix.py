@@ -0,0 +1,178 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Conversion of rational values to Radix objects.
+
+Values in base 10 or 16 whose denominator is a power of two, which
+includes all integers, have a terminating representation which can be
+computed using only integer arithmetic. Such values are converted
+directly. All other values are converted by justbases.
+"""
+
+import justbases
+
+from ._constants import RoundingMethods
+
+_DIGIT_FORMATS = {10: "d", 16: "x"}
+
+# The number of factors of 2 in the base, e.g., 16 = 2**4
+_TWOS = {10: 1, 16: 4}
+
+_DIGIT_VALUES = {c: int(c, 16) for c in "0123456789abcdef"}
+
+_REVERSED_METHODS = {
+    RoundingMethods.ROUND_DOWN: RoundingMethods.ROUND_UP,
+    RoundingMethods.ROUND_HALF_DOWN: RoundingMethods.ROUND_HALF_UP,
+    RoundingMethods.ROUND_HALF_UP: RoundingMethods.ROUND_HALF_DOWN,
+    RoundingMethods.ROUND_HALF_ZERO: RoundingMethods.ROUND_HALF_ZERO,
+    RoundingMethods.ROUND_TO_ZERO: RoundingMethods.ROUND_TO_ZERO,
+    RoundingMethods.ROUND_UP: RoundingMethods.ROUND_DOWN,
+}
+
+
+def digits(value, base, places=None):
+    """
+    The digits of a non-negative int.
+
+    :param int value: the value, at least 0
+    :param int base: the base, 10 or 16
+    :param places: the number of digits, or None for as many as needed
+    :type places: int or NoneType
+    :returns: the digits, most significant first, no leading zeros
+    :rtype: list of int
+
+    If places is specified, the result is padded with leading zeros.
+    """
+    if places is None:
+        if value == 0:
+            return []
+        fmt = _DIGIT_FORMATS[base]
+    else:
+        if places == 0:
+            return []
+        fmt = f"0{places}{_DIGIT_FORMATS[base]}"
+    return list(map(_DIGIT_VALUES.__getitem__, format(value, fmt)))
+
+
+def _round(numerator, denominator, method):
+    """
+    Round a non-negative rational value to an int.
+
+    :param int numerator: the numerator, at least 0
+    :param int denominator: the denominator, at least 1
+    :param method: the rounding method
+    :returns: the rounded value and its relation to the actual value
+    :rtype: int * int
+    """
+    (quotient, remainder) = divmod(numerator, denominator)
+    if remainder == 0:
+        return (quotient, 0)
+
+    if method in (RoundingMethods.ROUND_DOWN, RoundingMethods.ROUND_TO_ZERO):
+        return (quotient, -1)
+    if method is RoundingMethods.ROUND_UP:
+        return (quotient + 1, 1)
+
+    twice = 2 * remainder
+    if twice < denominator:
+        return (quotient, -1)
+    if twice > denominator or method is RoundingMethods.ROUND_HALF_UP:
+        return (quotient + 1, 1)
+    return (quotient, -1)
+
+
+def scaled(value, base, precision, method):
+    """
+    Round a rational value to a scaled integer, if it has a terminating
+    representation in ``base`` which can be computed directly.
+
+    :param Rational value: the value to convert
+    :param int base: base of result, must be at least 2
+    :param precision: number of digits after the radix or None
+    :type precision: int or NoneType
+    :param method: rounding method
+    :type method: element of RoundingMethods.METHODS()
+    :returns: sign, scaled absolute value, places and relation, or None
+    :rtype: (tuple of int * int * int * int) or NoneType
+
+    The absolute value of the rounded result is the scaled value divided
+    by base**places. The sign is 0 if the rounded result is 0.
+    """
+    numerator = value.numerator
+    denominator = value.denominator
+
+    if (
+        base not in _DIGIT_FORMATS
+        or denominator & (denominator - 1) != 0
+        or method not in _REVERSED_METHODS
+        or (precision is not None and precision < 0)
+    ):
+        return None
+
+    if numerator == 0:
+        return (0, 0, 0 if precision is None else precision, 0)
+
+    if numerator < 0:
+        (sign, numerator, method) = (-1, -numerator, _REVERSED_METHODS[method])
+    else:
+        sign = 1
+
+    if precision is None:
+        # With a denominator of 2**k, there are exactly ceil(k / t) digits
+        # after the radix, where t is the number of factors of 2 in base.
+        exponent = denominator.bit_length() - 1
+        places = -(-exponent // _TWOS[base])
+        (result, relation) = (numerator * base**places // denominator, 0)
+    else:
+        places = precision
+        (result, relation) = _round(numerator * base**places, denominator, method)
+
+    return (sign if result != 0 else 0, result, places, relation * sign)
+
+
+def from_rational(value, base, precision, method):
+    """
+    Convert rational value to a base.
+
+    :param Rational value: the value to convert
+    :param int base: base of result, must be at least 2
+    :param precision: number of digits after the radix or None
+    :type precision: int or NoneType
+    :param method: rounding method
+    :type method: element of RoundingMethods.METHODS()
+    :returns: the conversion result and its relation to actual result
+    :rtype: Radix * int
+
+    The result is always identical to that of
+    justbases.Radices.from_rational().
+    """
+    parts = scaled(value, base, precision, method)
+    if parts is None:
+        return justbases.Radices.from_rational(value, base, precision, method)
+
+    (sign, result, places, relation) = parts
+    (integer_part, fractional_part) = divmod(result, base**places)
+    radix = justbases.Radix(
+        sign,
+        digits(integer_part, base),
+        digits(fractional_part, base, places),
+        [],
+        base,
+        False,
+        False,
+    )
+    return (radix, relation)
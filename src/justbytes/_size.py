@@ -24,6 +24,8 @@ but all occurrences of floating point and Decimal numbers in arithmetic
 expressions will cause an exception to be raised.
 """
 
+import functools
+from bisect import bisect_right
 from fractions import Fraction
 
 import justbases
@@ -37,11 +39,63 @@ from ._errors import (
     RangePowerResultError,
     RangeValueError,
 )
-from ._generators import next_or_last, takeuntil
+from ._parse import parse
+from ._radix import from_rational
+
+
+def _reduce(value):
+    """
+    Reduce a rational value to the representation used internally by Range.
+
+    :param Rational value: a rational value
+    :returns: an int if ``value`` is integral, otherwise a Fraction
+    :rtype: int or Fraction
+    """
+    if value.denominator == 1:
+        return int(value.numerator)
+    return value if isinstance(value, Fraction) else Fraction(value)
+
+
+def _is_array(value):
+    """
+    Whether ``value`` is a RangeArray, which implements the reflected
+    binary operations and comparisons with a Range.
+
+    :param object value: the value
+    :rtype: bool
+    """
+    # pylint: disable=import-outside-toplevel,cyclic-import
+    from ._array import RangeArray  # noqa: PLC0415
+
+    return isinstance(value, RangeArray)
+
+
+@functools.lru_cache(maxsize=64)
+def _unit_limits(binary_units, min_value):
+    """
+    Units in increasing order, each with the least number of bytes which
+    is too large to be displayed in that unit.
+
+    :param bool binary_units: binary units if True, else SI
+    :param min_value: the smallest value to display, see ValueConfig
+    :type min_value: a precise numeric type
+    :returns: the units and the corresponding limits
+    :rtype: tuple of (tuple of Unit) * (tuple of int or Fraction)
+    """
+    units = BinaryUnits if binary_units else DecimalUnits
+    limit = units.FACTOR * Fraction(min_value)
+    all_units = tuple([B] + units.UNITS())
+    return (all_units, tuple(_reduce(limit * unit.factor) for unit in all_units))
 
 
 class Range:
-    """Class for instantiating Range objects."""
+    """
+    Class for instantiating Range objects.
+
+    Range objects are immutable.
+    """
+
+    __slots__ = ("_magnitude",)
 
     _BYTES_SYMBOL = "B"
 
@@ -57,7 +111,7 @@ class Range:
         :returns: the result and its relation to ``value``
         :rtype: Radix * int
         """
-        return justbases.Radices.from_rational(
+        return from_rational(
             value, config.base, config.max_places, config.rounding_method
         )
 
@@ -71,14 +125,51 @@ class Range:
         :returns: None if not convertible, else numeric value
         :rtype: Fraction or NoneType
         """
-        if not isinstance(unit, UNIT_TYPES) and not isinstance(unit, Range):
+        if isinstance(unit, Range):
+            return unit._magnitude
+        if not isinstance(unit, UNIT_TYPES):
             return None
-        factor = getattr(unit, "factor", getattr(unit, "magnitude", None))
-        return Fraction(factor if factor is not None else unit)
+        factor = getattr(unit, "factor", unit)
+        return factor if type(factor) is int else _reduce(Fraction(factor))
 
-    def __init__(self, value=0, units=None):
+    @classmethod
+    def _from_magnitude(cls, magnitude):
         """
-        Initialize a new Range object.
+        Construct a Range directly from a number of bytes.
+
+        :param Rational magnitude: the number of bytes
+        :returns: a Range
+        :rtype: Range
+        :raises RangeFractionalResultError: if fractional and strict
+
+        Bypasses the argument checking done by the constructor, and so
+        is suitable only for values computed by Range itself.
+
+        If an intern table is configured, returns the canonical Range
+        for the magnitude.
+        """
+        # An int if the number of bytes is integral, otherwise a Fraction
+        if type(magnitude) is not int:
+            magnitude = _reduce(magnitude)
+            if type(magnitude) is not int and Config.get_strict() is True:
+                raise RangeFractionalResultError()
+
+        table = Config.INTERN_TABLE
+        if table is not None:
+            result = table.get(magnitude)
+            if result is not None:
+                return result
+
+        result = object.__new__(cls)
+        object.__setattr__(result, "_magnitude", magnitude)
+
+        if table is not None:
+            table.add(magnitude, result)
+        return result
+
+    def __new__(cls, value=0, units=None):
+        """
+        Construct a new Range object.
 
         :param value: a size value, default is 0
         :type value: Range, or any finite numeric type (possibly as str)
@@ -93,10 +184,13 @@ class Range:
         if isinstance(value, (PRECISE_NUMERIC_TYPES, str)):
             try:
                 units = B if units is None else units
-                factor = self._get_unit_value(units)
+                factor = cls._get_unit_value(units)
                 if factor is None:
                     raise RangeValueError(units, "units")
-                magnitude = Fraction(value) * factor
+                if type(value) is int and type(factor) is int:
+                    magnitude = value * factor
+                else:
+                    magnitude = _reduce(Fraction(value) * factor)
             except (ValueError, TypeError) as err:
                 raise RangeValueError(value, "value") from err
 
@@ -105,13 +199,57 @@ class Range:
                 raise RangeValueError(
                     units, "units", "meaningless when Range value is passed"
                 )
-            magnitude = value.magnitude
+            magnitude = value._magnitude
         else:
             raise RangeValueError(value, "value")
 
-        if Config.STRICT is True and magnitude.denominator != 1:
-            raise RangeFractionalResultError()
-        self._magnitude = magnitude
+        return cls._from_magnitude(magnitude)
+
+    @classmethod
+    def parse(cls, text):
+        """
+        Construct a Range from a human-readable string.
+
+        :param str text: the text, e.g., "1.5 GiB", "512k", or "4 megabytes"
+        :returns: a Range
+        :rtype: Range
+        :raises RangeValueError: if the text can not be parsed
+        :raises RangeFractionalResultError: if fractional and strict
+
+        The text is a decimal number followed by an optional unit. The
+        unit may be given as an abbreviation, e.g., "Gi" or "GiB", or as
+        a prefixed word, e.g., "gibibytes". If it is omitted, the unit is
+        bytes.
+        """
+        if not isinstance(text, str):
+            raise RangeValueError(text, "text")
+        return cls._from_magnitude(parse(text))
+
+    @classmethod
+    def sum(cls, values):
+        """
+        Sum values without constructing intermediate Range objects.
+
+        :param values: the values, an int is a number of bytes
+        :type values: iterable of Range, int, or RangeArray
+        :returns: the sum of the values
+        :rtype: Range
+        :raises RangeNonsensicalBinOpError: if a value is of another type
+        :raises RangeFractionalResultError: if fractional and strict
+        """
+        # pylint: disable=import-outside-toplevel
+        from ._accumulator import RangeAccumulator  # noqa: PLC0415
+
+        return RangeAccumulator(values).total()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __reduce__(self):
+        return (Range, (self._magnitude,))
 
     @property
     def magnitude(self):
@@ -119,11 +257,11 @@ class Range:
         :returns: the number of bytes
         :rtype: Fraction
         """
-        return self._magnitude
+        return Fraction(self._magnitude)
 
-    def getStringInfo(self, config):
+    def _string_info(self, config):
         """
-        Return a representation of the size.
+        Compute the result of :meth:`getStringInfo`, without caching.
 
         :param `ValueConfig` config: representation configuration
         :returns: a tuple representing the number to display
@@ -133,6 +271,47 @@ class Range:
         (result, relation) = self._as_single_number(magnitude, config)
         return (result, relation, units)
 
+    def _string(self, config):
+        """
+        Compute the result of :meth:`getString`, without caching.
+
+        :param StringConfig config: the configuration
+        :returns: a string representation
+        :rtype: str
+        :raises RangeValueError: if configuration is not satisfiable
+        """
+        value_config = config.VALUE_CONFIG
+        display_impl = config.DISPLAY_IMPL
+        (magnitude, units) = self.components(value_config)
+
+        xform_rational = getattr(display_impl, "xform_rational", None)
+        number = (
+            None if xform_rational is None else xform_rational(magnitude, value_config)
+        )
+        if number is None:
+            (result, relation) = self._as_single_number(magnitude, value_config)
+            number = display_impl.xform(result, relation)
+        return f"{number} {units.abbr + self._BYTES_SYMBOL}"
+
+    def getStringInfo(self, config):
+        """
+        Return a representation of the size.
+
+        :param `ValueConfig` config: representation configuration
+        :returns: a tuple representing the number to display
+        :rtype: tuple of Radix * int * unit
+        """
+        cache = Config.FORMAT_CACHE
+        if cache is None:
+            return self._string_info(config)
+
+        key = (self._magnitude, config)
+        result = cache.get(key)
+        if result is None:
+            result = self._string_info(config)
+            cache.add(key, result)
+        return result
+
     def getString(self, config):
         """
         Return a string representation of the size.
@@ -142,22 +321,31 @@ class Range:
         :rtype: str
         :raises RangeValueError: if configuration is not satisfiable
         """
-        (result, relation, units) = self.getStringInfo(config.VALUE_CONFIG)
-        number = config.DISPLAY_IMPL.xform(result, relation)
-        return f"{number} {units.abbr + self._BYTES_SYMBOL}"
+        cache = Config.FORMAT_CACHE
+        if cache is None:
+            return self._string(config)
+
+        key = (self._magnitude, config)
+        result = cache.get(key)
+        if result is None:
+            result = self._string(config)
+            cache.add(key, result)
+        return result
 
     def __str__(self):
-        return self.getString(Config.STRING_CONFIG)
+        return self.getString(Config.get_string_config())
 
     def __repr__(self):
         """
         Use actual Fraction magnitude in result.
         """
-        return f"Range({self._magnitude!r})"
+        return f"Range({self.magnitude!r})"
 
-    def __deepcopy__(self, memo):
+    def __copy__(self):
+        return self
 
-        return Range(self._magnitude)
+    def __deepcopy__(self, memo):
+        return self
 
     def __nonzero__(self):
         return self._magnitude != 0
@@ -176,19 +364,21 @@ class Range:
     # UNARY OPERATIONS
 
     def __abs__(self):
-        return Range(abs(self._magnitude))
+        return Range._from_magnitude(abs(self._magnitude))
 
     def __neg__(self):
-        return Range(-(self._magnitude))
+        return Range._from_magnitude(-(self._magnitude))
 
     def __pos__(self):
-        return Range(self._magnitude)
+        return Range._from_magnitude(self._magnitude)
 
     # BINARY OPERATIONS
     def __add__(self, other):
         if not isinstance(other, Range):
+            if _is_array(other):
+                return NotImplemented
             raise RangeNonsensicalBinOpError("+", other)
-        return Range(self._magnitude + other.magnitude)
+        return Range._from_magnitude(self._magnitude + other._magnitude)
 
     __radd__ = __add__
 
@@ -199,16 +389,18 @@ class Range:
         #                   = Fraction, if T(other) is Range
         if isinstance(other, Range):
             try:
-                (div, rem) = divmod(self._magnitude, other.magnitude)
-                return (div, Range(rem))
+                (div, rem) = divmod(self._magnitude, other._magnitude)
+                return (div, Range._from_magnitude(rem))
             except ZeroDivisionError as err:
                 raise RangeNonsensicalBinOpValueError("divmod", other) from err
         if isinstance(other, PRECISE_NUMERIC_TYPES):
             try:
-                (div, rem) = divmod(self._magnitude, Fraction(other))
-                return (Range(div), Range(rem))
+                (div, rem) = divmod(self._magnitude, _reduce(other))
+                return (Range._from_magnitude(div), Range._from_magnitude(rem))
             except ZeroDivisionError as err:
                 raise RangeNonsensicalBinOpValueError("divmod", other) from err
+        if _is_array(other):
+            return NotImplemented
         raise RangeNonsensicalBinOpError("divmod", other)
 
     def __rdivmod__(self, other):
@@ -219,13 +411,15 @@ class Range:
         if not isinstance(other, Range):
             raise RangeNonsensicalBinOpError("rdivmod", other)
         try:
-            (div, rem) = divmod(other.magnitude, self._magnitude)
-            return (div, Range(rem))
+            (div, rem) = divmod(other._magnitude, self._magnitude)
+            return (div, Range._from_magnitude(rem))
         except ZeroDivisionError as err:
             raise RangeNonsensicalBinOpValueError("rdivmod", other) from err
 
     def __eq__(self, other):
-        return isinstance(other, Range) and self._magnitude == other.magnitude
+        if isinstance(other, Range):
+            return self._magnitude == other._magnitude
+        return NotImplemented if _is_array(other) else False
 
     def __floordiv__(self, other):
         # other * floor + rem = self
@@ -233,14 +427,16 @@ class Range:
         #                     = int, if T(other) is Range
         if isinstance(other, Range):
             try:
-                return self._magnitude.__floordiv__(other.magnitude)
+                return self._magnitude // other._magnitude
             except ZeroDivisionError as err:
                 raise RangeNonsensicalBinOpValueError("floordiv", other) from err
         if isinstance(other, PRECISE_NUMERIC_TYPES):
             try:
-                return Range(self._magnitude.__floordiv__(Fraction(other)))
+                return Range._from_magnitude(self._magnitude // _reduce(other))
             except ZeroDivisionError as err:
                 raise RangeNonsensicalBinOpValueError("floordiv", other) from err
+        if _is_array(other):
+            return NotImplemented
         raise RangeNonsensicalBinOpError("floordiv", other)
 
     def __rfloordiv__(self, other):
@@ -249,43 +445,53 @@ class Range:
         if not isinstance(other, Range):
             raise RangeNonsensicalBinOpError("rfloordiv", other)
         try:
-            return other.magnitude.__floordiv__(self._magnitude)
+            return other._magnitude // self._magnitude
         except ZeroDivisionError as err:
             raise RangeNonsensicalBinOpValueError("rfloordiv", other) from err
 
     def __ge__(self, other):
         if not isinstance(other, Range):
+            if _is_array(other):
+                return NotImplemented
             raise RangeNonsensicalBinOpError(">=", other)
-        return self._magnitude >= other.magnitude
+        return self._magnitude >= other._magnitude
 
     def __gt__(self, other):
         if not isinstance(other, Range):
+            if _is_array(other):
+                return NotImplemented
             raise RangeNonsensicalBinOpError(">", other)
-        return self._magnitude > other.magnitude
+        return self._magnitude > other._magnitude
 
     def __le__(self, other):
         if not isinstance(other, Range):
+            if _is_array(other):
+                return NotImplemented
             raise RangeNonsensicalBinOpError("<=", other)
-        return self._magnitude <= other.magnitude
+        return self._magnitude <= other._magnitude
 
     def __lt__(self, other):
         if not isinstance(other, Range):
+            if _is_array(other):
+                return NotImplemented
             raise RangeNonsensicalBinOpError("<", other)
-        return self._magnitude < other.magnitude
+        return self._magnitude < other._magnitude
 
     def __mod__(self, other):
         # other * div + mod = self
         # Therefore, T(mod) = Range
         if isinstance(other, Range):
             try:
-                return Range(self._magnitude % other.magnitude)
+                return Range._from_magnitude(self._magnitude % other._magnitude)
             except ZeroDivisionError as err:
                 raise RangeNonsensicalBinOpValueError("%", other) from err
         if isinstance(other, PRECISE_NUMERIC_TYPES):
             try:
-                return Range(self._magnitude % Fraction(other))
+                return Range._from_magnitude(self._magnitude % _reduce(other))
             except ZeroDivisionError as err:
                 raise RangeNonsensicalBinOpValueError("%", other) from err
+        if _is_array(other):
+            return NotImplemented
         raise RangeNonsensicalBinOpError("%", other)
 
     def __rmod__(self, other):
@@ -294,7 +500,7 @@ class Range:
         if not isinstance(other, Range):
             raise RangeNonsensicalBinOpError("rmod", other)
         try:
-            return Range(other.magnitude % Fraction(self._magnitude))
+            return Range._from_magnitude(other._magnitude % self._magnitude)
         except ZeroDivisionError as err:
             raise RangeNonsensicalBinOpValueError("rmod", other) from err
 
@@ -302,9 +508,11 @@ class Range:
         # self * other = mul
         # Therefore, T(mul) = Range and T(other) is a numeric type.
         if isinstance(other, PRECISE_NUMERIC_TYPES):
-            return Range(self._magnitude * Fraction(other))
+            return Range._from_magnitude(self._magnitude * _reduce(other))
         if isinstance(other, Range):
             raise RangePowerResultError()
+        if _is_array(other):
+            return NotImplemented
         raise RangeNonsensicalBinOpError("*", other)
 
     __rmul__ = __mul__
@@ -320,35 +528,41 @@ class Range:
         raise RangeNonsensicalBinOpError("rpow", other)
 
     def __ne__(self, other):
-        return not isinstance(other, Range) or self._magnitude != other.magnitude
+        if isinstance(other, Range):
+            return self._magnitude != other._magnitude
+        return NotImplemented if _is_array(other) else True
 
     def __sub__(self, other):
         # self - other = sub
         # Therefore, T(sub) = T(self) = Range and T(other) = Range.
         if not isinstance(other, Range):
+            if _is_array(other):
+                return NotImplemented
             raise RangeNonsensicalBinOpError("-", other)
-        return Range(self._magnitude - other.magnitude)
+        return Range._from_magnitude(self._magnitude - other._magnitude)
 
     def __rsub__(self, other):
         # other - self = sub
         # Therefore, T(sub) = T(self) = Range and T(other) = Range.
         if not isinstance(other, Range):
             raise RangeNonsensicalBinOpError("rsub", other)
-        return Range(other.magnitude - self._magnitude)
+        return Range._from_magnitude(other._magnitude - self._magnitude)
 
     def __truediv__(self, other):
         # other * truediv = self
         # Therefore, T(truediv) = Fraction, if T(other) is Range
         if isinstance(other, Range):
             try:
-                return self._magnitude.__truediv__(other.magnitude)
+                return Fraction(self._magnitude, other._magnitude)
             except ZeroDivisionError as err:
                 raise RangeNonsensicalBinOpValueError("truediv", other) from err
         elif isinstance(other, PRECISE_NUMERIC_TYPES):
             try:
-                return Range(self._magnitude.__truediv__(Fraction(other)))
+                return Range._from_magnitude(Fraction(self._magnitude, _reduce(other)))
             except ZeroDivisionError as err:
                 raise RangeNonsensicalBinOpValueError("truediv", other) from err
+        if _is_array(other):
+            return NotImplemented
         raise RangeNonsensicalBinOpError("truediv", other)
 
     __div__ = __truediv__
@@ -359,7 +573,7 @@ class Range:
         if not isinstance(other, Range):
             raise RangeNonsensicalBinOpError("rtruediv", other)
         try:
-            return other.magnitude.__truediv__(self._magnitude)
+            return Fraction(other._magnitude, self._magnitude)
         except ZeroDivisionError as err:
             raise RangeNonsensicalBinOpValueError("rtruediv", self) from err
 
@@ -385,7 +599,7 @@ class Range:
                 factor, "factor", "can not convert to non-positive unit %s"
             )
 
-        return self._magnitude / factor
+        return Fraction(self._magnitude, factor)
 
     def componentsList(self, binary_units=True):
         """
@@ -414,8 +628,6 @@ class Range:
         The meaning of the parameters is the same as for
         :class:`._config.ValueConfig`.
         """
-        units = BinaryUnits if config.binary_units else DecimalUnits
-
         if config.unit is not None:
             return (self.convertTo(config.unit), config.unit)
 
@@ -423,16 +635,18 @@ class Range:
         # FACTOR * min_value to the left of the decimal point.
         # If the number is so large that no prefix will satisfy this
         # requirement use the largest prefix.
-        limit = units.FACTOR * Fraction(config.min_value)
-        components = self.componentsList(binary_units=config.binary_units)
-        candidates = list(takeuntil(lambda x: abs(x[0]) < limit, components))
+        (units, limits) = _unit_limits(config.binary_units, config.min_value)
+        index = min(bisect_right(limits, abs(self._magnitude)), len(units) - 1)
 
         if config.exact_value:
-            return next_or_last(
-                lambda x: self._as_single_number(x[0], config)[1] == 0,
-                reversed(candidates),
-            )
-        return candidates[-1]
+            for unit in units[index:0:-1]:
+                value = self.convertTo(unit)
+                if self._as_single_number(value, config)[1] == 0:
+                    return (value, unit)
+            return (self.convertTo(B), B)
+
+        unit = units[index]
+        return (self.convertTo(unit), unit)
 
     def roundTo(self, unit, rounding, bounds=(None, None)):
         """
@@ -465,9 +679,9 @@ class Range:
         if factor == 0:
             res = Range(0)
         else:
-            magnitude = self._magnitude / factor
+            magnitude = Fraction(self._magnitude, factor)
             (rounded, _) = justbases.Rationals.round_to_int(magnitude, rounding)
-            res = Range(rounded * factor)
+            res = Range._from_magnitude(rounded * factor)
 
         (lower, upper) = bounds
         if lower is not None and upper is not None:
@@ -0,0 +1,497 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""QuantileSketch class, for approximate quantiles of Range values.
+
+The sketch is a DDSketch: values are counted in buckets whose boundaries
+are consecutive powers of a number gamma slightly greater than 1, so that
+any value in a bucket is within a fixed relative error of the bucket's
+representative value. Here gamma is chosen so that some power of gamma
+is exactly the unit factor, 1024 or 1000, so that every unit boundary is
+also a bucket boundary.
+"""
+
+# pylint: disable=protected-access
+
+import math
+from fractions import Fraction
+
+import justbases
+
+from ._array import RangeArray
+from ._constants import B, BinaryUnits, DecimalUnits, RoundingMethods
+from ._errors import RangeNonsensicalBinOpError, RangeValueError
+from ._size import Range, _reduce
+
+_VERSION = 1
+
+# The bit of a varint byte which indicates that more bytes follow
+_CONTINUATION = 0x80
+
+
+def _write_varint(out, value):
+    """
+    Append a non-negative int to ``out`` as a little-endian base-128 varint.
+
+    :param bytearray out: the output
+    :param int value: the value, at least 0
+    """
+    while value >= _CONTINUATION:
+        out.append((value & 0x7F) | _CONTINUATION)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, position):
+    """
+    Read a varint written by _write_varint.
+
+    :param bytes data: the data
+    :param int position: the position of the varint
+    :returns: the value and the position after the varint
+    :rtype: int * int
+    :raises IndexError: if the data ends before the varint does
+    """
+    (result, shift) = (0, 0)
+    while True:
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if byte < _CONTINUATION:
+            return (result, position)
+        shift += 7
+
+
+def _write_signed(out, value):
+    """
+    Append an int to ``out``, zigzag encoded as a varint.
+
+    :param bytearray out: the output
+    :param int value: the value
+    """
+    _write_varint(out, 2 * value if value >= 0 else -2 * value - 1)
+
+
+def _read_signed(data, position):
+    """
+    Read an int written by _write_signed.
+
+    :param bytes data: the data
+    :param int position: the position of the int
+    :returns: the value and the position after the int
+    :rtype: int * int
+    """
+    (value, position) = _read_varint(data, position)
+    return ((value >> 1) if value & 1 == 0 else -((value + 1) >> 1), position)
+
+
+class QuantileSketch:
+    """
+    A mergeable sketch of the distribution of Range values, from which
+    quantiles can be estimated with a bounded relative error.
+
+    Zero values are counted exactly. Positive and negative values are
+    counted in buckets. The estimate of any quantile is within the
+    relative accuracy of the actual value, so long as the lowest buckets
+    have not been collapsed to keep the number of buckets within bounds.
+    Bucket boundaries within a unit and representative values are
+    computed in floating point, so the bound holds only up to a relative
+    rounding error of about 1e-15. Values of any magnitude are accepted.
+    """
+
+    __slots__ = (
+        "_binary_units",
+        "_count",
+        "_gamma",
+        "_log2_factor",
+        "_log_factor",
+        "_max",
+        "_max_buckets",
+        "_min",
+        "_negative",
+        "_positive",
+        "_steps",
+        "_zero_count",
+    )
+
+    def __init__(self, relative_accuracy=0.01, binary_units=True, max_buckets=2048):
+        """
+        Initializer.
+
+        :param float relative_accuracy: the relative accuracy, 0 < x < 1
+        :param bool binary_units: align buckets with binary units if True
+        :param int max_buckets: the maximum number of buckets of each sign
+        :raises RangeValueError: on bad parameters
+
+        The actual relative accuracy may be a little better than that
+        specified, since the buckets must align with the units.
+        """
+        if not 0 < relative_accuracy < 1:
+            raise RangeValueError(
+                relative_accuracy, "relative_accuracy", "must be between 0 and 1"
+            )
+        if max_buckets < 1:
+            raise RangeValueError(max_buckets, "max_buckets", "must be at least 1")
+
+        factor = (BinaryUnits if binary_units else DecimalUnits).FACTOR
+        gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._init(binary_units, math.ceil(math.log(factor, gamma)), max_buckets)
+
+    def _init(self, binary_units, steps, max_buckets):
+        """
+        Initialize the sketch to have no values.
+
+        :param bool binary_units: align buckets with binary units if True
+        :param int steps: the number of buckets for each unit
+        :param int max_buckets: the maximum number of buckets of each sign
+        """
+        factor = (BinaryUnits if binary_units else DecimalUnits).FACTOR
+        self._binary_units = binary_units
+        self._steps = steps
+        self._gamma = factor ** (1 / steps)
+        self._log_factor = math.log(factor)
+        self._log2_factor = math.log2(factor)
+        self._max_buckets = max_buckets
+        self._count = 0
+        self._zero_count = 0
+        self._positive = {}
+        self._negative = {}
+        self._min = None
+        self._max = None
+
+    def __repr__(self):
+        return (
+            f"QuantileSketch(relative_accuracy={self.relative_accuracy()!r}, "
+            f"binary_units={self._binary_units!r}, count={self._count})"
+        )
+
+    def relative_accuracy(self):
+        """
+        The relative accuracy guaranteed by this sketch, up to floating
+        point rounding.
+
+        :rtype: float
+        """
+        return (self._gamma - 1) / (self._gamma + 1)
+
+    def count(self):
+        """
+        The number of values.
+
+        :rtype: int
+        """
+        return self._count
+
+    def _index(self, magnitude):
+        """
+        The index of the bucket for a positive magnitude.
+
+        :param magnitude: the magnitude, greater than 0
+        :type magnitude: int or Fraction
+        :returns: the index i such that gamma**(i - 1) < magnitude <= gamma**i
+        :rtype: int
+
+        The power of the unit factor which does not exceed the magnitude
+        is computed exactly, so that unit boundaries are bucket boundaries.
+        """
+        power = self._power
+
+        # The bit lengths give the binary logarithm to within 1, so the
+        # estimate of the exponent is off by at most 1.
+        bits = magnitude.numerator.bit_length() - magnitude.denominator.bit_length()
+        exponent = math.floor(bits / self._log2_factor)
+        while power(exponent) > magnitude:
+            exponent -= 1
+        while power(exponent + 1) <= magnitude:
+            exponent += 1
+
+        # 1 <= ratio < factor, so the floating point logarithm is safe.
+        ratio = Fraction(magnitude) / power(exponent)
+        if ratio == 1:
+            return exponent * self._steps
+        step = math.ceil(self._steps * math.log(ratio) / self._log_factor)
+        return exponent * self._steps + min(max(step, 1), self._steps)
+
+    def _power(self, exponent):
+        """
+        The unit factor raised to an integral power, exactly.
+
+        :param int exponent: the exponent
+        :rtype: int or Fraction
+        """
+        factor = (BinaryUnits if self._binary_units else DecimalUnits).FACTOR
+        if exponent >= 0:
+            return factor**exponent
+        return Fraction(1, factor**-exponent)
+
+    def _collapse(self, buckets):
+        """
+        Merge the lowest buckets until there are no more than max_buckets.
+
+        :param dict buckets: a map from bucket index to count
+        """
+        if len(buckets) > self._max_buckets:
+            indices = sorted(buckets)
+            excess = len(indices) - self._max_buckets
+            target = indices[excess]
+            buckets[target] += sum(buckets.pop(i) for i in indices[:excess])
+
+    def _add_magnitude(self, magnitude, count):
+        """
+        Add a magnitude ``count`` times.
+
+        :param magnitude: the magnitude
+        :type magnitude: int or Fraction
+        :param int count: the number of times, at least 1
+        """
+        self._count += count
+        if self._min is None or magnitude < self._min:
+            self._min = magnitude
+        if self._max is None or magnitude > self._max:
+            self._max = magnitude
+
+        if magnitude == 0:
+            self._zero_count += count
+            return
+
+        (buckets, magnitude) = (
+            (self._positive, magnitude)
+            if magnitude > 0
+            else (self._negative, -magnitude)
+        )
+        index = self._index(magnitude)
+        buckets[index] = buckets.get(index, 0) + count
+        self._collapse(buckets)
+
+    def add(self, value, count=1):
+        """
+        Add a value.
+
+        :param value: the value, an int is a number of bytes
+        :type value: Range, int, or RangeArray
+        :param int count: the number of times to add the value
+        :raises RangeNonsensicalBinOpError: if value is of another type
+        :raises RangeValueError: if count is less than 1
+        """
+        if count < 1:
+            raise RangeValueError(count, "count", "must be at least 1")
+        if isinstance(value, Range):
+            self._add_magnitude(value._magnitude, count)
+        elif isinstance(value, int):
+            self._add_magnitude(value, count)
+        elif isinstance(value, RangeArray):
+            for magnitude in value._magnitudes():
+                self._add_magnitude(magnitude, count)
+        else:
+            raise RangeNonsensicalBinOpError("+", value)
+
+    def update(self, values):
+        """
+        Add every value in ``values``.
+
+        :param values: the values
+        :type values: iterable of Range, int, or RangeArray
+        :raises RangeNonsensicalBinOpError: if a value is of another type
+        """
+        for value in values:
+            self.add(value)
+
+    def merge(self, other):
+        """
+        Add the values summarized by ``other``.
+
+        :param QuantileSketch other: a sketch with the same bucket layout
+        :returns: this object
+        :rtype: QuantileSketch
+        :raises RangeNonsensicalBinOpError: if other is not a QuantileSketch
+        :raises RangeValueError: if other has a different bucket layout
+        """
+        if not isinstance(other, QuantileSketch):
+            raise RangeNonsensicalBinOpError("merge", other)
+        if (other._binary_units, other._steps) != (self._binary_units, self._steps):
+            raise RangeValueError(other, "other", "has a different bucket layout")
+        if other._count == 0:
+            return self
+
+        self._count += other._count
+        self._zero_count += other._zero_count
+        for mine, theirs in (
+            (self._positive, other._positive),
+            (self._negative, other._negative),
+        ):
+            for index, count in theirs.items():
+                mine[index] = mine.get(index, 0) + count
+            self._collapse(mine)
+
+        if self._min is None or other._min < self._min:
+            self._min = other._min
+        if self._max is None or other._max > self._max:
+            self._max = other._max
+        return self
+
+    def _estimate(self, index):
+        """
+        The representative value of a bucket.
+
+        :param int index: the bucket index
+        :returns: a value within the relative accuracy of every value in it
+        :rtype: Fraction
+
+        The bucket with index i covers the values greater than gamma**(i - 1)
+        and at most gamma**i. With i - 1 = e * steps + j, where 0 <= j <
+        steps, the estimate is factor**e, computed exactly, times
+        2 * gamma**(j + 1) / (gamma + 1), computed in floating point, which
+        is always between 1 and factor.
+        """
+        (exponent, step) = divmod(index - 1, self._steps)
+        factor = (BinaryUnits if self._binary_units else DecimalUnits).FACTOR
+        scale = 2 * factor ** ((step + 1) / self._steps) / (self._gamma + 1)
+        return self._power(exponent) * Fraction(scale)
+
+    def quantile(self, q, unit=B, rounding=RoundingMethods.ROUND_HALF_ZERO):
+        """
+        Estimate a quantile.
+
+        :param q: the quantile, 0 <= q <= 1
+        :type q: float or Fraction
+        :param unit: the unit to which to round the estimate
+        :type unit: any non-negative :class:`Range` or element in :func:`._constants.UNITS`
+        :param rounding: rounding mode to use
+        :type rounding: a field of :class:`._constants.RoundingMethods`
+        :returns: the estimate, or None if there are no values
+        :rtype: Range or NoneType
+        :raises RangeValueError: on unusable arguments
+
+        The estimate is rounded as by :meth:`._size.Range.roundTo`, within
+        the bounds of the least and greatest values.
+        """
+        if not 0 <= q <= 1:
+            raise RangeValueError(q, "q", "must be between 0 and 1")
+        if self._count == 0:
+            return None
+
+        rank = q * (self._count - 1)
+
+        def estimate():
+            seen = 0
+            for index in sorted(self._negative, reverse=True):
+                seen += self._negative[index]
+                if seen > rank:
+                    return -self._estimate(index)
+            seen += self._zero_count
+            if seen > rank:
+                return 0
+            for index in sorted(self._positive):
+                seen += self._positive[index]
+                if seen > rank:
+                    return self._estimate(index)
+            return self._max  # pragma: no cover
+
+        factor = Range._get_unit_value(unit)
+        if factor is None:
+            raise RangeValueError(unit, "unit")
+        if factor < 0:
+            raise RangeValueError(factor, "factor")
+
+        # Round the number of bytes, so that no fractional Range, which is
+        # forbidden in strict mode, is constructed for an integral result.
+        magnitude = min(max(estimate(), self._min), self._max)
+        if factor == 0:
+            magnitude = 0
+        else:
+            (rounded, _) = justbases.Rationals.round_to_int(
+                Fraction(magnitude, factor), rounding
+            )
+            magnitude = rounded * factor
+        return Range._from_magnitude(min(max(magnitude, self._min), self._max))
+
+    def to_bytes(self):
+        """
+        Serialize this sketch compactly.
+
+        :returns: the serialized sketch
+        :rtype: bytes
+
+        Bucket indices are delta encoded, and all numbers are varints.
+        """
+        out = bytearray()
+        _write_varint(out, _VERSION)
+        _write_varint(out, 1 if self._binary_units else 0)
+        _write_varint(out, self._steps)
+        _write_varint(out, self._max_buckets)
+        _write_varint(out, self._zero_count)
+        for buckets in (self._positive, self._negative):
+            _write_varint(out, len(buckets))
+            previous = 0
+            for index in sorted(buckets):
+                _write_signed(out, index - previous)
+                _write_varint(out, buckets[index])
+                previous = index
+        if self._count != 0:
+            for magnitude in (Fraction(self._min), Fraction(self._max)):
+                _write_signed(out, magnitude.numerator)
+                _write_varint(out, magnitude.denominator)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Deserialize a sketch serialized by :meth:`to_bytes`.
+
+        :param bytes data: the serialized sketch
+        :returns: the sketch
+        :rtype: QuantileSketch
+        :raises RangeValueError: if the data is not a serialized sketch
+        """
+        try:
+            (version, position) = _read_varint(data, 0)
+            if version != _VERSION:
+                raise RangeValueError(version, "version", "is not supported")
+
+            (binary_units, position) = _read_varint(data, position)
+            (steps, position) = _read_varint(data, position)
+            (max_buckets, position) = _read_varint(data, position)
+            if binary_units not in (0, 1) or steps < 1 or max_buckets < 1:
+                raise RangeValueError(data, "data", "has an invalid layout")
+
+            result = object.__new__(cls)
+            result._init(binary_units == 1, steps, max_buckets)
+            (result._zero_count, position) = _read_varint(data, position)
+            result._count = result._zero_count
+            for buckets in (result._positive, result._negative):
+                (length, position) = _read_varint(data, position)
+                index = 0
+                for _ in range(length):
+                    (delta, position) = _read_signed(data, position)
+                    (count, position) = _read_varint(data, position)
+                    index += delta
+                    buckets[index] = count
+                    result._count += count
+
+            if result._count != 0:
+                (numerator, position) = _read_signed(data, position)
+                (denominator, position) = _read_varint(data, position)
+                result._min = _reduce(Fraction(numerator, denominator))
+                (numerator, position) = _read_signed(data, position)
+                (denominator, position) = _read_varint(data, position)
+                result._max = _reduce(Fraction(numerator, denominator))
+        except (IndexError, ZeroDivisionError) as err:
+            raise RangeValueError(data, "data", "is truncated or corrupt") from err
+
+        if position != len(data):
+            raise RangeValueError(data, "data", "has trailing bytes")
+        return result
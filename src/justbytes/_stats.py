@@ -0,0 +1,218 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""RangeStats class, for streaming statistics over Range values."""
+
+# pylint: disable=protected-access
+
+from fractions import Fraction
+
+from ._array import RangeArray
+from ._errors import RangeNonsensicalBinOpError
+from ._size import Range
+
+
+class RangeStats:
+    """
+    Exact count, sum, minimum, maximum, mean and variance of a stream of
+    Range values, computed in one pass using constant memory.
+
+    All statistics are exact. Statistics computed separately over parts
+    of a stream may be combined exactly with :meth:`merge`.
+    """
+
+    __slots__ = ("_count", "_max", "_min", "_sum", "_sum_squares")
+
+    def __init__(self, values=()):
+        """
+        Initializer.
+
+        :param values: initial values to add
+        :type values: iterable of Range, int, or RangeArray
+        :raises RangeNonsensicalBinOpError: if a value is of another type
+        """
+        self._count = 0
+        self._sum = 0
+        self._sum_squares = 0
+        self._min = None
+        self._max = None
+        self.update(values)
+
+    def __repr__(self):
+        return f"RangeStats(count={self._count}, sum={self.sum()!r})"
+
+    def _add_magnitudes(self, count, total, squares, least, greatest):
+        """
+        Add a summary of some magnitudes.
+
+        :param int count: the number of magnitudes, at least 1
+        :param total: the sum of the magnitudes
+        :param squares: the sum of the squares of the magnitudes
+        :param least: the least magnitude
+        :param greatest: the greatest magnitude
+        """
+        self._count += count
+        self._sum += total
+        self._sum_squares += squares
+        if self._min is None or least < self._min:
+            self._min = least
+        if self._max is None or greatest > self._max:
+            self._max = greatest
+
+    def add(self, value):
+        """
+        Add a value.
+
+        :param value: the value, an int is a number of bytes
+        :type value: Range, int, or RangeArray
+        :raises RangeNonsensicalBinOpError: if value is of another type
+        """
+        if isinstance(value, Range):
+            magnitude = value._magnitude
+            self._add_magnitudes(
+                1, magnitude, magnitude * magnitude, magnitude, magnitude
+            )
+        elif isinstance(value, int):
+            self._add_magnitudes(1, value, value * value, value, value)
+        elif isinstance(value, RangeArray):
+            if len(value) != 0:
+                magnitudes = (
+                    value._numerators
+                    if value._denominators is None
+                    else value._magnitudes()
+                )
+                self._add_magnitudes(
+                    len(magnitudes),
+                    sum(magnitudes),
+                    sum(x * x for x in magnitudes),
+                    min(magnitudes),
+                    max(magnitudes),
+                )
+        else:
+            raise RangeNonsensicalBinOpError("+", value)
+
+    def update(self, values):
+        """
+        Add every value in ``values``.
+
+        :param values: the values
+        :type values: iterable of Range, int, or RangeArray
+        :raises RangeNonsensicalBinOpError: if a value is of another type
+        """
+        (count, total, squares, least, greatest) = (0, 0, 0, None, None)
+        try:
+            for value in values:
+                if type(value) is Range:
+                    magnitude = value._magnitude
+                elif type(value) is int:
+                    magnitude = value
+                else:
+                    self.add(value)
+                    continue
+                count += 1
+                total += magnitude
+                squares += magnitude * magnitude
+                if least is None:
+                    (least, greatest) = (magnitude, magnitude)
+                elif magnitude < least:
+                    least = magnitude
+                elif magnitude > greatest:
+                    greatest = magnitude
+        finally:
+            if count != 0:
+                self._add_magnitudes(count, total, squares, least, greatest)
+
+    def merge(self, other):
+        """
+        Add the values summarized by ``other``.
+
+        :param RangeStats other: statistics over other values
+        :returns: this object
+        :rtype: RangeStats
+        :raises RangeNonsensicalBinOpError: if other is not a RangeStats
+        """
+        if not isinstance(other, RangeStats):
+            raise RangeNonsensicalBinOpError("merge", other)
+        if other._count != 0:
+            self._add_magnitudes(
+                other._count, other._sum, other._sum_squares, other._min, other._max
+            )
+        return self
+
+    def count(self):
+        """
+        The number of values.
+
+        :rtype: int
+        """
+        return self._count
+
+    def sum(self):
+        """
+        The sum of the values.
+
+        :rtype: Range
+        :raises RangeFractionalResultError: if fractional and strict
+        """
+        return Range._from_magnitude(self._sum)
+
+    def min(self):
+        """
+        The least value.
+
+        :returns: the least value or None if there are no values
+        :rtype: Range or NoneType
+        """
+        return None if self._min is None else Range._from_magnitude(self._min)
+
+    def max(self):
+        """
+        The greatest value.
+
+        :returns: the greatest value or None if there are no values
+        :rtype: Range or NoneType
+        """
+        return None if self._max is None else Range._from_magnitude(self._max)
+
+    def mean(self):
+        """
+        The mean of the values.
+
+        :returns: the mean or None if there are no values
+        :rtype: Range or NoneType
+        :raises RangeFractionalResultError: if fractional and strict
+        """
+        if self._count == 0:
+            return None
+        return Range._from_magnitude(Fraction(self._sum, self._count))
+
+    def variance(self, sample=False):
+        """
+        The variance of the values, in square bytes.
+
+        :param bool sample: if True, the sample variance, else the population
+        :returns: the variance or None if there are too few values
+        :rtype: Fraction or NoneType
+
+        The result is not a Range, since a Range can not represent a
+        square number of bytes.
+        """
+        count = self._count
+        if count == 0 or (sample and count == 1):
+            return None
+        deviations = self._sum_squares - Fraction(self._sum * self._sum, count)
+        return deviations / (count - 1 if sample else count)
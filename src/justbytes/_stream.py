@@ -0,0 +1,248 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Streaming parsing of Range values from columns of text."""
+
+# pylint: disable=protected-access
+
+from collections import namedtuple
+
+from ._array import RangeArray
+from ._config import Config
+from ._errors import RangeError, RangeFractionalResultError, RangeValueError
+from ._parse import parse, parse_number
+from ._size import Range
+
+LineError = namedtuple("LineError", ["line_number", "line", "error"])
+
+
+def _lines(source, chunk_size):
+    """
+    Yield the lines of ``source``.
+
+    :param source: a text file or an iterable of lines
+    :param int chunk_size: the number of characters to read at once
+    :returns: the lines, possibly with trailing line endings
+    :rtype: generator of str
+    """
+    read = getattr(source, "read", None)
+    if read is None:
+        yield from source
+        return
+
+    tail = ""
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            break
+        lines = (tail + chunk).split("\n")
+        tail = lines.pop()
+        yield from lines
+    if tail:
+        yield tail
+
+
+class ColumnParser:
+    """
+    Parse Range values from one column of lines of text.
+
+    Input is read in chunks, and results are yielded as they are parsed,
+    so memory use does not depend on the size of the input. Lines which
+    can not be parsed are recorded in ``errors`` instead of raising an
+    exception. At most ``max_errors`` errors are recorded, but all are
+    counted in ``error_count``. Blank lines are skipped.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self, column=0, separator=None, units=None, *, chunk_size=2**20, max_errors=1000
+    ):
+        """
+        Initializer.
+
+        :param int column: the index of the column to parse
+        :param separator: the column separator, None for any whitespace
+        :type separator: str or NoneType
+        :param units: the units of plain numbers, see below
+        :type units: any of the publicly defined units constants or a Range
+        :param int chunk_size: the number of characters to read at once
+        :param int max_errors: the maximum number of errors to record
+        :raises RangeValueError: on bad parameters
+
+        If units is None, each value is parsed as by :meth:`._size.Range.parse`
+        and may specify its own unit. Otherwise, each value must be a plain
+        decimal number, which is multiplied by units.
+        """
+        if units is not None:
+            factor = Range._get_unit_value(units)
+            if factor is None:
+                raise RangeValueError(units, "units")
+        else:
+            factor = None
+
+        if chunk_size < 1:
+            raise RangeValueError(chunk_size, "chunk_size", "must be at least 1")
+
+        if max_errors < 0:
+            raise RangeValueError(max_errors, "max_errors", "must be at least 0")
+
+        self._column = column
+        self._separator = separator
+        self._factor = factor
+        self._chunk_size = chunk_size
+        self._max_errors = max_errors
+        self.errors = []
+        self.error_count = 0
+
+    def _error(self, line_number, line, error):
+        """
+        Record an error.
+
+        :param int line_number: the line number, starting at 1
+        :param str line: the line
+        :param RangeError error: the error
+        """
+        self.error_count += 1
+        if len(self.errors) < self._max_errors:
+            self.errors.append(LineError(line_number, line, error))
+
+    def reset(self):
+        """
+        Discard recorded errors before parsing a new input.
+        """
+        self.errors = []
+        self.error_count = 0
+
+    def parse_line(self, line_number, line, encoding="utf-8"):
+        """
+        Parse the Range in a single line, recording any error.
+
+        :param int line_number: the line number, starting at 1
+        :param line: the line
+        :type line: str or bytes
+        :param str encoding: the encoding of a line which is bytes
+        :returns: the Range, or None if the line is blank or has an error
+        :rtype: Range or NoneType
+
+        For parsing input which is not available all at once. Errors
+        accumulate until :meth:`reset` is called.
+        """
+        if isinstance(line, bytes):
+            try:
+                line = line.decode(encoding)
+            except UnicodeDecodeError:
+                self._error(
+                    line_number,
+                    line.decode(encoding, errors="replace"),
+                    RangeValueError(line, "line", f"is not valid {encoding}"),
+                )
+                return None
+
+        magnitude = self._parse_line(line_number, line, Config.get_strict())
+        return None if magnitude is None else Range._from_magnitude(magnitude)
+
+    def _parse_line(self, line_number, line, strict):
+        """
+        Parse the magnitude in ``line``, recording any error.
+
+        :param int line_number: the line number, starting at 1
+        :param str line: the line
+        :param bool strict: whether fractional values are errors
+        :returns: the magnitude, or None if the line is blank or has an error
+        :rtype: int or Fraction or NoneType
+        """
+        fields = line.split(self._separator)
+        if not fields or (len(fields) == 1 and not fields[0].strip()):
+            return None
+
+        try:
+            try:
+                field = fields[self._column]
+            except IndexError:
+                raise RangeValueError(
+                    line, "line", f"has no column {self._column}"
+                ) from None
+
+            factor = self._factor
+            magnitude = parse(field) if factor is None else parse_number(field, factor)
+            if strict is True and type(magnitude) is not int:
+                raise RangeFractionalResultError()
+        except RangeError as err:
+            self._error(line_number, line, err)
+            return None
+
+        return magnitude
+
+    def _magnitudes(self, source):
+        """
+        Yield the magnitudes parsed from ``source``.
+
+        :param source: a text file or an iterable of lines
+        :returns: the magnitudes, int or Fraction
+        :rtype: generator
+        """
+        self.reset()
+        strict = Config.get_strict()
+        parse_line = self._parse_line
+
+        for line_number, line in enumerate(_lines(source, self._chunk_size), 1):
+            magnitude = parse_line(line_number, line, strict)
+            if magnitude is not None:
+                yield magnitude
+
+    def ranges(self, source):
+        """
+        Parse Range values from ``source``.
+
+        :param source: a text file or an iterable of lines
+        :returns: a Range for each line which can be parsed
+        :rtype: generator of Range
+        """
+        from_magnitude = Range._from_magnitude
+        for magnitude in self._magnitudes(source):
+            yield from_magnitude(magnitude)
+
+    def batches(self, source, batch_size=65536):
+        """
+        Parse Range values from ``source`` in columnar batches.
+
+        :param source: a text file or an iterable of lines
+        :param int batch_size: the maximum number of values in a batch
+        :returns: a RangeArray for each batch of lines which can be parsed
+        :rtype: generator of RangeArray
+        :raises RangeValueError: if batch_size is less than 1
+        """
+        if batch_size < 1:
+            raise RangeValueError(batch_size, "batch_size", "must be at least 1")
+        return self._batches(source, batch_size)
+
+    def _batches(self, source, batch_size):
+        """
+        Parse Range values from ``source`` in columnar batches.
+
+        :param source: a text file or an iterable of lines
+        :param int batch_size: the maximum number of values in a batch
+        :returns: a RangeArray for each batch of lines which can be parsed
+        :rtype: generator of RangeArray
+        """
+        batch = []
+        for magnitude in self._magnitudes(source):
+            batch.append(magnitude)
+            if len(batch) == batch_size:
+                yield RangeArray._from_magnitudes(batch)
+                batch = []
+        if batch:
+            yield RangeArray._from_magnitudes(batch)
@@ -0,0 +1,212 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""RangeTopK class, for the largest or smallest of many Range values."""
+
+# pylint: disable=protected-access
+
+import heapq
+from array import array
+from itertools import repeat
+
+from ._array import _INTEGER_TYPECODES, RangeArray
+from ._errors import RangeNonsensicalBinOpError, RangeValueError
+from ._size import Range
+
+
+def _pairs(values, payloads):
+    """
+    Pair each value with its payload.
+
+    :param values: the values
+    :type values: iterable
+    :param payloads: the payloads, or None for no payloads
+    :type payloads: iterable or NoneType
+    :returns: pairs of value and payload
+    :rtype: iterable of (object * object)
+    :raises ValueError: if there are more or fewer payloads than values
+    """
+    if payloads is None:
+        return zip(values, repeat(None))
+    return zip(values, payloads, strict=True)
+
+
+def _payloads_error(payloads):
+    """
+    The error for payloads which are not paired one to one with values.
+
+    :param payloads: the payloads
+    :type payloads: iterable
+    :returns: the error
+    :rtype: RangeValueError
+    """
+    return RangeValueError(
+        payloads, "payloads", "must have exactly one payload for each value"
+    )
+
+
+class RangeTopK:
+    """
+    The k largest, or k smallest, of a stream of Range values, each with
+    an optional payload.
+
+    Values are kept in a heap of size at most k, ordered by magnitude, so
+    processing n values takes O(n log k) time and comparisons are made
+    between numbers rather than Range objects. Among equal values, those
+    added earlier are preferred.
+    """
+
+    __slots__ = ("_heap", "_k", "_largest", "_sequence")
+
+    def __init__(self, k, largest=True):
+        """
+        Initializer.
+
+        :param int k: the number of values to keep, at least 1
+        :param bool largest: keep the largest values if True, else smallest
+        :raises RangeValueError: if k is less than 1
+        """
+        if k < 1:
+            raise RangeValueError(k, "k", "must be at least 1")
+        self._k = k
+        self._largest = largest
+        # Entries are (key, order, payload). The key is the magnitude, or
+        # its negation when keeping the smallest values, so that the root
+        # of the heap is always the entry to be evicted first.
+        self._heap = []
+        self._sequence = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __repr__(self):
+        return (
+            f"RangeTopK({self._k!r}, largest={self._largest!r}, "
+            f"values={[x for (x, _) in self.result()]!r})"
+        )
+
+    def _push(self, key, payload):
+        """
+        Offer an entry to the heap.
+
+        :param key: the key
+        :type key: int or Fraction
+        :param object payload: the payload
+        """
+        heap = self._heap
+        self._sequence += 1
+        if len(heap) < self._k:
+            heapq.heappush(heap, (key, -self._sequence, payload))
+        elif key > heap[0][0]:
+            heapq.heapreplace(heap, (key, -self._sequence, payload))
+
+    def add(self, value, payload=None):
+        """
+        Add a value.
+
+        :param value: the value, an int is a number of bytes
+        :type value: Range or int
+        :param object payload: a payload associated with the value
+        :raises RangeNonsensicalBinOpError: if value is of another type
+        """
+        if isinstance(value, Range):
+            magnitude = value._magnitude
+        elif isinstance(value, int):
+            magnitude = value
+        else:
+            raise RangeNonsensicalBinOpError("+", value)
+        self._push(magnitude if self._largest else -magnitude, payload)
+
+    def add_many(self, values, payloads=None):
+        """
+        Add many values.
+
+        :param values: the values, ints are numbers of bytes
+        :type values: RangeArray, array of int, or iterable of Range or int
+        :param payloads: a payload for each value, default is None for all
+        :type payloads: iterable or NoneType
+        :raises RangeNonsensicalBinOpError: if a value is of another type
+        :raises RangeValueError: if there are more or fewer payloads than
+           values, in which case the values paired with payloads are added
+
+        The values of a RangeArray or of an array of integers are compared
+        without constructing any intermediate objects. A value that can
+        not displace the current k values is discarded after a single
+        comparison.
+        """
+        if isinstance(values, RangeArray):
+            magnitudes = (
+                values._numerators
+                if values._denominators is None
+                else values._magnitudes()
+            )
+        elif isinstance(values, array) and values.typecode in _INTEGER_TYPECODES:
+            magnitudes = values
+        else:
+            try:
+                for value, payload in _pairs(values, payloads):
+                    self.add(value, payload)
+            except ValueError as err:
+                raise _payloads_error(payloads) from err
+            return
+
+        heap = self._heap
+        (k, sign, sequence) = (self._k, 1 if self._largest else -1, self._sequence)
+        try:
+            for magnitude, payload in _pairs(magnitudes, payloads):
+                key = sign * magnitude
+                sequence += 1
+                if len(heap) < k:
+                    heapq.heappush(heap, (key, -sequence, payload))
+                elif key > heap[0][0]:
+                    heapq.heapreplace(heap, (key, -sequence, payload))
+        except ValueError as err:
+            raise _payloads_error(payloads) from err
+        finally:
+            self._sequence = sequence
+
+    def merge(self, other):
+        """
+        Add the values kept by ``other``.
+
+        :param RangeTopK other: a tracker of the same kind
+        :returns: this object
+        :rtype: RangeTopK
+        :raises RangeNonsensicalBinOpError: if other is not a RangeTopK
+        :raises RangeValueError: if other keeps a different kind of values
+        """
+        if not isinstance(other, RangeTopK):
+            raise RangeNonsensicalBinOpError("merge", other)
+        if (other._k, other._largest) != (self._k, self._largest):
+            raise RangeValueError(other, "other", "keeps different values")
+        for key, _, payload in sorted(other._heap, reverse=True):
+            self._push(key, payload)
+        return self
+
+    def result(self):
+        """
+        The values kept, with their payloads.
+
+        :returns: pairs of value and payload, largest first if keeping the
+          largest values, else smallest first
+        :rtype: list of (Range * object)
+        """
+        sign = 1 if self._largest else -1
+        return [
+            (Range._from_magnitude(sign * key), payload)
+            for (key, _, payload) in sorted(self._heap, reverse=True)
+        ]
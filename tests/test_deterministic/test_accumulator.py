@@ -0,0 +1,66 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for RangeAccumulator."""
+
+import unittest
+from fractions import Fraction
+
+from justbytes import Config, KiB, Range, RangeAccumulator, RangeArray
+from justbytes._errors import RangeFractionalResultError, RangeNonsensicalBinOpError
+
+
+class RangeAccumulatorTestCase(unittest.TestCase):
+    """Exercise RangeAccumulator."""
+
+    def test_total(self):
+        """Values of every accepted type are added."""
+        accumulator = RangeAccumulator([Range(1, KiB), 24])
+        accumulator.add(Range(Fraction(1, 2)))
+        accumulator += RangeArray([1, 2])
+        accumulator += RangeArray([Fraction(1, 4), Fraction(1, 4)])
+        self.assertEqual(accumulator.total(), Range(1052))
+        self.assertEqual(repr(accumulator), f"RangeAccumulator({Range(1052)!r})")
+        accumulator.clear()
+        self.assertEqual(accumulator.total(), Range(0))
+
+    def test_sum(self):
+        """Range.sum agrees with sum."""
+        ranges = [Range(x, KiB) for x in range(100)] + [Range(Fraction(1, 3))]
+        self.assertEqual(Range.sum(ranges), sum(ranges, Range(0)))
+        self.assertEqual(Range.sum([]), Range(0))
+
+    def test_strict(self):
+        """A fractional total is an error when strict."""
+        half = Range(Fraction(1, 2))
+        accumulator = RangeAccumulator([half])
+        with Config.using(strict=True):
+            with self.assertRaises(RangeFractionalResultError):
+                accumulator.total()
+            accumulator.add(half)
+            self.assertEqual(accumulator.total(), Range(1))
+
+    def test_exceptions(self):
+        """Test exceptions."""
+        accumulator = RangeAccumulator()
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            accumulator.add(Fraction(1, 2))
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            accumulator.update([Range(2), 3, 1.5])
+        self.assertEqual(accumulator.total(), Range(5))
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            Range.sum(["1"])
@@ -0,0 +1,134 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for allocators."""
+
+import unittest
+
+from justbytes import (
+    BestFitAllocator,
+    BuddyAllocator,
+    KiB,
+    MiB,
+    Range,
+    SegregatedFitAllocator,
+)
+from justbytes._errors import RangeValueError
+
+
+class BestFitAllocatorTestCase(unittest.TestCase):
+    """Exercise BestFitAllocator."""
+
+    def test_best_fit(self):
+        """The smallest sufficient free extent is chosen."""
+        allocator = BestFitAllocator(0, 100)
+        addresses = [allocator.allocate(size) for size in (10, 30, 10, 5, 10)]
+        self.assertEqual(addresses, [Range(x) for x in (0, 10, 40, 50, 55)])
+        allocator.free(10)
+        allocator.free(50)
+        self.assertEqual(allocator.allocate(5), Range(50))
+        self.assertEqual(allocator.allocate(Range(20)), Range(10))
+        self.assertEqual(allocator.stats().free_blocks, 2)
+
+    def test_alignment(self):
+        """Aligned allocations return the padding to the free space."""
+        allocator = BestFitAllocator(Range(1), Range(1, MiB))
+        self.assertEqual(allocator.allocate(10, KiB), Range(1, KiB))
+        self.assertEqual(allocator.allocate(1), Range(1))
+        stats = allocator.stats()
+        self.assertEqual(stats.used, Range(11))
+        self.assertEqual(stats.free_blocks, 2)
+        self.assertEqual(allocator.allocate(4, Range(4)), Range(4))
+
+    def test_coalesce(self):
+        """Freed extents are coalesced with their neighbors."""
+        allocator = BestFitAllocator(0, 30)
+        addresses = [allocator.allocate(10) for _ in range(3)]
+        allocator.free(addresses[0])
+        allocator.free(addresses[2])
+        self.assertEqual(allocator.stats().free_blocks, 2)
+        self.assertEqual(allocator.free(addresses[1]), Range(10))
+        stats = allocator.stats()
+        self.assertEqual((stats.free_blocks, stats.largest_free), (1, Range(30)))
+        self.assertEqual(len(allocator), 0)
+
+
+class SegregatedFitAllocatorTestCase(unittest.TestCase):
+    """Exercise SegregatedFitAllocator."""
+
+    def test_allocate(self):
+        """Requests are satisfied from a sufficient size class."""
+        allocator = SegregatedFitAllocator(0, 64)
+        addresses = [allocator.allocate(8) for _ in range(8)]
+        for address in addresses[::2]:
+            allocator.free(address)
+        self.assertEqual(allocator.allocate(8), Range(48))
+        with self.assertRaises(RangeValueError):
+            allocator.allocate(9)
+        self.assertEqual(allocator.allocate(4, 4), Range(32))
+        self.assertIn(32, allocator)
+        self.assertNotIn(36, allocator)
+
+
+class BuddyAllocatorTestCase(unittest.TestCase):
+    """Exercise BuddyAllocator."""
+
+    def test_allocate(self):
+        """Blocks are split and coalesced."""
+        allocator = BuddyAllocator(Range(64, KiB), KiB)
+        self.assertEqual(allocator.allocate(1), Range(0))
+        self.assertEqual(allocator.allocate(Range(3, KiB)), Range(4, KiB))
+        self.assertEqual(allocator.allocate(1), Range(1, KiB))
+        stats = allocator.stats()
+        self.assertEqual(stats.used, Range(6, KiB))
+        self.assertEqual(stats.largest_free, Range(32, KiB))
+        self.assertEqual(stats.free_blocks, 4)
+        self.assertAlmostEqual(stats.internal_fragmentation, 1 - 3074 / 6144)
+
+        self.assertEqual(allocator.free(Range(4, KiB)), Range(4, KiB))
+        allocator.free(0)
+        allocator.free(Range(1, KiB))
+        stats = allocator.stats()
+        self.assertEqual((stats.free_blocks, stats.fragmentation), (1, 0.0))
+
+    def test_alignment(self):
+        """Aligned requests are satisfied by large enough blocks."""
+        allocator = BuddyAllocator(MiB, start=Range(1, MiB))
+        self.assertEqual(allocator.allocate(1), Range(1, MiB))
+        self.assertEqual(allocator.allocate(1, KiB), Range(1025, KiB))
+        with self.assertRaises(RangeValueError):
+            allocator.allocate(1, 3)
+        with self.assertRaises(RangeValueError):
+            allocator.allocate(1, Range(2, MiB))
+
+    def test_exceptions(self):
+        """Test exceptions."""
+        with self.assertRaises(RangeValueError):
+            BuddyAllocator(1000)
+        with self.assertRaises(RangeValueError):
+            BuddyAllocator(KiB, MiB)
+        allocator = BuddyAllocator(KiB)
+        with self.assertRaises(RangeValueError):
+            allocator.allocate(Range(2, KiB))
+        with self.assertRaises(RangeValueError):
+            allocator.allocate(0)
+        with self.assertRaises(RangeValueError):
+            allocator.free(0)
+        with self.assertRaises(RangeValueError):
+            BestFitAllocator(0, 0)
+        with self.assertRaises(RangeValueError):
+            BestFitAllocator(0, 10).allocate(1, Range("0.5"))
@@ -0,0 +1,293 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Tests for RangeArray objects."""
+
+import pickle
+import unittest
+from decimal import Decimal
+from fractions import Fraction
+
+from justbytes import YB, B, KiB, MiB, Range, RangeArray, YiB
+from justbytes._config import Config
+from justbytes._errors import (
+    RangeFractionalResultError,
+    RangeNonsensicalBinOpError,
+    RangeNonsensicalBinOpValueError,
+    RangePowerResultError,
+    RangeValueError,
+)
+
+
+class ConstructionTestCase(unittest.TestCase):
+    """Test construction of RangeArray objects."""
+
+    def test_values(self):
+        """Values are interpreted as by the Range constructor."""
+        array = RangeArray([1, "2", Fraction(1, 2), Range(1, KiB)])
+        self.assertEqual(
+            array.tolist(), [Range(1), Range(2), Range(Fraction(1, 2)), Range(1024)]
+        )
+        self.assertEqual(
+            RangeArray([1, "0.5"], KiB).tolist(), [Range(1024), Range(512)]
+        )
+        self.assertEqual(RangeArray([1, 2], Range(3)).tolist(), [Range(3), Range(6)])
+        self.assertEqual(len(RangeArray()), 0)
+
+    def test_exceptions(self):
+        """Bad values raise the same errors as the Range constructor."""
+        with self.assertRaises(RangeValueError):
+            RangeArray([1.2])
+        with self.assertRaises(RangeValueError):
+            RangeArray([1], 1.2)
+        with self.assertRaises(RangeValueError):
+            RangeArray([Range(1)], KiB)
+
+    def test_immutable(self):
+        """Attributes can not be set or deleted."""
+        array = RangeArray([1])
+        with self.assertRaises(AttributeError):
+            array._numerators = None  # pylint: disable=protected-access
+        with self.assertRaises(AttributeError):
+            del array._numerators  # pylint: disable=protected-access
+
+    def test_pickle(self):
+        """Pickling preserves the values."""
+        array = RangeArray([1, Fraction(1, 3)])
+        self.assertEqual(pickle.loads(pickle.dumps(array)).tolist(), array.tolist())
+
+    def test_sequence(self):
+        """RangeArray behaves as a sequence of Ranges."""
+        array = RangeArray([1, Fraction(1, 2), 3])
+        self.assertEqual(array[1], Range(Fraction(1, 2)))
+        self.assertEqual(array[-1], Range(3))
+        self.assertEqual(array[1:].tolist(), [Range(Fraction(1, 2)), Range(3)])
+        self.assertEqual(RangeArray([1, 2])[0], Range(1))
+        self.assertIsInstance(repr(array), str)
+
+    def test_strict(self):
+        """Fractional results raise an error when strict."""
+        strict = Config.STRICT
+        Config.STRICT = True
+        try:
+            with self.assertRaises(RangeFractionalResultError):
+                RangeArray([1]) / 2
+        finally:
+            Config.STRICT = strict
+
+
+class OperationsTestCase(unittest.TestCase):
+    """Test arithmetic on RangeArray objects."""
+
+    def setUp(self):
+        self.array = RangeArray([0, 1, Fraction(3, 2), 1024])
+
+    def test_unary(self):
+        """Test unary operations."""
+        self.assertEqual((-self.array).tolist(), [-x for x in self.array])
+        self.assertEqual(abs(-self.array).tolist(), self.array.tolist())
+        self.assertIs(+self.array, self.array)
+
+    def test_add_sub(self):
+        """Addition and subtraction with Range and RangeArray."""
+        self.assertEqual(
+            (self.array + Range(1)).tolist(), [x + Range(1) for x in self.array]
+        )
+        self.assertEqual(
+            (self.array - self.array).tolist(), [Range(0)] * len(self.array)
+        )
+        self.assertEqual(
+            (Range(1) - self.array).tolist(), [Range(1) - x for x in self.array]
+        )
+        self.assertEqual(
+            (Range(1) + self.array).tolist(), [Range(1) + x for x in self.array]
+        )
+        for operand in (1, Fraction(1, 2), 1.2):
+            with self.assertRaises(RangeNonsensicalBinOpError):
+                self.array + operand  # pylint: disable=pointless-statement
+            with self.assertRaises(RangeNonsensicalBinOpError):
+                self.array - operand  # pylint: disable=pointless-statement
+            with self.assertRaises(RangeNonsensicalBinOpError):
+                operand - self.array  # pylint: disable=pointless-statement
+        with self.assertRaises(RangeValueError):
+            self.array + RangeArray([1])  # pylint: disable=pointless-statement
+
+    def test_mul(self):
+        """Multiplication by numbers only."""
+        self.assertEqual((self.array * 2).tolist(), [x * 2 for x in self.array])
+        self.assertEqual(
+            (Fraction(1, 3) * self.array).tolist(),
+            [x * Fraction(1, 3) for x in self.array],
+        )
+        with self.assertRaises(RangePowerResultError):
+            self.array * Range(2)  # pylint: disable=pointless-statement
+        with self.assertRaises(RangePowerResultError):
+            self.array * self.array  # pylint: disable=pointless-statement
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            self.array * Decimal(2)  # pylint: disable=pointless-statement
+
+    def test_div(self):
+        """Division, floor division, modulus and divmod."""
+        size = Range(1, KiB)
+        self.assertEqual(self.array / size, [x / size for x in self.array])
+        self.assertEqual((self.array / 3).tolist(), [x / 3 for x in self.array])
+        self.assertEqual(self.array // size, [x // size for x in self.array])
+        self.assertEqual((self.array // 3).tolist(), [x // 3 for x in self.array])
+        self.assertEqual((self.array % size).tolist(), [x % size for x in self.array])
+        self.assertEqual((self.array % 3).tolist(), [x % 3 for x in self.array])
+
+        (div, rem) = divmod(self.array, size)
+        self.assertEqual(list(zip(div, rem)), [divmod(x, size) for x in self.array])
+        (div, rem) = divmod(self.array, 3)
+        self.assertEqual(list(zip(div, rem)), [divmod(x, 3) for x in self.array])
+
+    def test_div_exceptions(self):
+        """Division by zero and by nonsensical values."""
+        zeros = RangeArray([0] * len(self.array))
+        for operand in (Range(0), zeros, 0):
+            with self.assertRaises(RangeNonsensicalBinOpValueError):
+                self.array / operand  # pylint: disable=pointless-statement
+            with self.assertRaises(RangeNonsensicalBinOpValueError):
+                self.array // operand  # pylint: disable=pointless-statement
+            with self.assertRaises(RangeNonsensicalBinOpValueError):
+                self.array % operand  # pylint: disable=pointless-statement
+            with self.assertRaises(RangeNonsensicalBinOpValueError):
+                divmod(self.array, operand)
+
+        for operand in (1.2, Decimal(1)):
+            with self.assertRaises(RangeNonsensicalBinOpError):
+                self.array / operand  # pylint: disable=pointless-statement
+            with self.assertRaises(RangeNonsensicalBinOpError):
+                self.array // operand  # pylint: disable=pointless-statement
+            with self.assertRaises(RangeNonsensicalBinOpError):
+                self.array % operand  # pylint: disable=pointless-statement
+            with self.assertRaises(RangeNonsensicalBinOpError):
+                divmod(self.array, operand)
+
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            1 / self.array  # pylint: disable=pointless-statement
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            1 // self.array  # pylint: disable=pointless-statement
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            1 % self.array  # pylint: disable=pointless-statement
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            divmod(1, self.array)
+
+    def test_pow(self):
+        """Powers are not representable."""
+        with self.assertRaises(RangePowerResultError):
+            self.array**2  # pylint: disable=pointless-statement
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            self.array ** Range(2)  # pylint: disable=pointless-statement
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            2**self.array  # pylint: disable=pointless-statement
+
+    def test_comparisons(self):
+        """Comparisons are elementwise."""
+        size = Range(1)
+        self.assertEqual(self.array < size, [x < size for x in self.array])
+        self.assertEqual(self.array <= size, [x <= size for x in self.array])
+        self.assertEqual(self.array > size, [x > size for x in self.array])
+        self.assertEqual(self.array >= size, [x >= size for x in self.array])
+        self.assertEqual(size < self.array, [size < x for x in self.array])
+        self.assertEqual(size >= self.array, [size >= x for x in self.array])
+        self.assertEqual(self.array.eq(size), [x == size for x in self.array])
+        self.assertEqual(self.array.ne(size), [x != size for x in self.array])
+        self.assertEqual(self.array.eq(self.array), [True] * len(self.array))
+        self.assertEqual(self.array.eq(1), [False] * len(self.array))
+        self.assertEqual(self.array.ne(1), [True] * len(self.array))
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            self.array < 1  # pylint: disable=pointless-statement
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            1 < self.array  # pylint: disable=pointless-statement
+
+    def test_equality(self):
+        """Equality compares whole arrays."""
+        self.assertTrue(self.array == RangeArray(self.array))
+        self.assertFalse(self.array != RangeArray(self.array))
+        self.assertFalse(RangeArray([1]) == RangeArray([2]))
+        self.assertTrue(RangeArray([1]) != RangeArray([1, 2]))
+        self.assertTrue(RangeArray() == RangeArray())
+        self.assertNotIn(RangeArray([1]), [RangeArray([5])])
+        self.assertFalse(self.array == Range(1))
+        self.assertFalse(Range(1) == self.array)
+        self.assertTrue(Range(1) != self.array)
+        self.assertEqual(hash(RangeArray([1, 2])), hash(RangeArray([1, 2])))
+
+    def test_units(self):
+        """Conversions between units are exact."""
+        array = RangeArray([1, 2], MiB)
+        self.assertEqual((array // Range(1, KiB)), [1024, 2048])
+        self.assertEqual((array / Range(1, B)), [1024**2, 2 * 1024**2])
+
+    def test_convert(self):
+        """Test conversion to units."""
+        array = RangeArray([1, Fraction(3, 2)], MiB)
+        self.assertEqual(array.convertTo(KiB), [1024, 1536])
+        self.assertEqual(array.convertTo(), [x.convertTo() for x in array])
+        self.assertEqual(array.convertTo(Range(3)), [x.convertTo(3) for x in array])
+        with self.assertRaises(RangeValueError):
+            array.convertTo(1.2)
+        with self.assertRaises(RangeValueError):
+            array.convertTo(0)
+
+
+class WideTestCase(unittest.TestCase):
+    """Test RangeArray objects with values that exceed 64 bits."""
+
+    def setUp(self):
+        self.ranges = [Range(1), Range(3, YiB), Range(-2, YB), Range(2**63)]
+        self.array = RangeArray(self.ranges)
+
+    def test_values(self):
+        """Large values are preserved exactly."""
+        self.assertEqual(self.array.tolist(), self.ranges)
+        self.assertEqual(self.array[1], Range(3, YiB))
+        self.assertEqual(
+            RangeArray([Fraction(1, 3), 2**70]).tolist(),
+            [Range(Fraction(1, 3)), Range(2**70)],
+        )
+        self.assertEqual(
+            RangeArray([Fraction(1, 3 * 2**70)]).tolist(),
+            [Range(Fraction(1, 3 * 2**70))],
+        )
+
+    def test_operations(self):
+        """Operations on large values agree with Range."""
+        size = Range(1, YiB)
+        self.assertEqual((self.array + size).tolist(), [x + size for x in self.ranges])
+        self.assertEqual((self.array - size).tolist(), [x - size for x in self.ranges])
+        self.assertEqual(self.array < size, [x < size for x in self.ranges])
+        self.assertEqual(
+            (self.array * 2**70).tolist(), [x * 2**70 for x in self.ranges]
+        )
+        self.assertEqual(
+            self.array.convertTo(YiB), [x.convertTo(YiB) for x in self.ranges]
+        )
+
+    def test_narrowing(self):
+        """Results that fit in 64 bits are stored as 64 bit integers."""
+        result = self.array - self.array
+        self.assertEqual(result.tolist(), [Range(0)] * len(self.ranges))
+        self.assertIsInstance(
+            result._numerators,  # pylint: disable=protected-access
+            type(RangeArray([1])._numerators),  # pylint: disable=protected-access
+        )
+
+    def test_pickle(self):
+        """Arrays of large values may be pickled."""
+        self.assertEqual(pickle.loads(pickle.dumps(self.array)), self.array)
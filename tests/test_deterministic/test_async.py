@@ -0,0 +1,128 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for asyncio stream adapters."""
+
+import asyncio
+import unittest
+
+import justbases
+from justbytes import (
+    ColumnParser,
+    DisplayConfig,
+    KiB,
+    Range,
+    StringConfig,
+    ValueConfig,
+    read_ranges,
+    write_ranges,
+)
+from justbytes._errors import RangeValueError
+
+
+class _Writer:
+    """A minimal stream writer, which records writes and drains."""
+
+    def __init__(self):
+        self.data = b""
+        self.drains = 0
+
+    def write(self, data):
+        """Record data."""
+        self.data += data
+
+    async def drain(self):
+        """Record a drain."""
+        self.drains += 1
+
+
+def _reader(data):
+    """A stream reader which reads ``data``."""
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class ReadRangesTestCase(unittest.TestCase):
+    """Exercise read_ranges."""
+
+    def test_read(self):
+        """Ranges are read from lines, with errors recorded."""
+        parser = ColumnParser(1)
+
+        async def main():
+            reader = _reader(b"a 1KiB\nb bogus\n\nc 2kibibytes")
+            return [x async for x in read_ranges(reader, parser)]
+
+        self.assertEqual(asyncio.run(main()), [Range(1, KiB), Range(2, KiB)])
+        (error,) = parser.errors
+        self.assertEqual(error[:2], (2, "b bogus\n"))
+
+    def test_undecodable(self):
+        """Lines which can not be decoded are recorded as errors."""
+        parser = ColumnParser()
+
+        async def main():
+            reader = _reader(b"1KiB\n\xff\xfe\n2\n")
+            return [x async for x in read_ranges(reader, parser)]
+
+        self.assertEqual(asyncio.run(main()), [Range(1, KiB), Range(2)])
+        (error,) = parser.errors
+        self.assertEqual(error.line_number, 2)
+        self.assertIsInstance(error.error, RangeValueError)
+
+    def test_default(self):
+        """The default parser parses the first column."""
+
+        async def main():
+            return [x async for x in read_ranges(_reader(b"1KiB\n2\n"))]
+
+        self.assertEqual(asyncio.run(main()), [Range(1, KiB), Range(2)])
+
+
+class WriteRangesTestCase(unittest.TestCase):
+    """Exercise write_ranges."""
+
+    def test_write(self):
+        """Ranges are written in batches, draining after each."""
+        writer = _Writer()
+        ranges = [Range(x, KiB) for x in range(1, 6)]
+        count = asyncio.run(write_ranges(writer, ranges, batch_size=2))
+        self.assertEqual(count, 5)
+        self.assertEqual(writer.drains, 3)
+        self.assertEqual(writer.data.decode(), "".join(f"{str(x)}\n" for x in ranges))
+
+    def test_async_iterable(self):
+        """Ranges may come from an async iterable, with a given config."""
+        writer = _Writer()
+        config = StringConfig(
+            ValueConfig(binary_units=False), DisplayConfig(), justbases.String
+        )
+
+        async def ranges():
+            for x in (1000, 2000):
+                yield Range(x)
+
+        count = asyncio.run(write_ranges(writer, ranges(), config, separator=","))
+        self.assertEqual(count, 2)
+        self.assertEqual(writer.data, b"1 kB,2 kB,")
+
+    def test_exceptions(self):
+        """Test exceptions."""
+        with self.assertRaises(RangeValueError):
+            asyncio.run(write_ranges(_Writer(), [], batch_size=0))
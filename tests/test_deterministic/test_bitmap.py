@@ -0,0 +1,76 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for ChunkBitmap."""
+
+# pylint: disable=protected-access
+
+import unittest
+
+from justbytes import ChunkBitmap, KiB, MiB, PiB, Range
+from justbytes._errors import RangeValueError
+
+
+class ChunkBitmapTestCase(unittest.TestCase):
+    """Exercise ChunkBitmap."""
+
+    def test_runs(self):
+        """Runs are coalesced across containers."""
+        bitmap = ChunkBitmap(Range(1, PiB), Range(64, KiB))
+        bitmap.set(0, Range(1, PiB))
+        bitmap.clear(Range(4, MiB), Range(64, KiB))
+        self.assertEqual(bitmap.available(), Range(64, KiB))
+        self.assertEqual(list(bitmap.free_runs()), [(Range(4, MiB), Range(64, KiB))])
+        self.assertEqual(len(list(bitmap.allocated_runs())), 2)
+        self.assertNotIn(Range(4, MiB), bitmap)
+        self.assertIn(Range(4, MiB) - Range(1), bitmap)
+
+        bitmap.clear(0, Range(1, PiB))
+        self.assertEqual(bitmap.allocated(), Range(0))
+        self.assertEqual(bitmap._containers, {})
+        self.assertEqual(list(bitmap.free_runs()), [(Range(0), Range(1, PiB))])
+
+    def test_bitmap_containers(self):
+        """Containers with many runs are stored as bitmaps."""
+        bitmap = ChunkBitmap(Range(1, MiB), 1)
+        for chunk in range(0, 4096, 2):
+            bitmap.set(chunk, 1)
+        self.assertIsInstance(bitmap._containers[0], int)
+        self.assertEqual(bitmap.allocated(), Range(2048))
+        self.assertIn(2, bitmap)
+        self.assertNotIn(3, bitmap)
+        runs = list(bitmap.allocated_runs())
+        self.assertEqual(len(runs), 2048)
+        self.assertEqual(runs[-1], (Range(4094), Range(1)))
+
+        bitmap.set(0, 3074)
+        self.assertIsInstance(bitmap._containers[0], tuple)
+        self.assertEqual(bitmap.allocated(), Range(3585))
+        self.assertEqual(next(bitmap.free_runs()), (Range(3075), Range(1)))
+
+    def test_exceptions(self):
+        """Test exceptions."""
+        with self.assertRaises(RangeValueError):
+            ChunkBitmap(Range(100, KiB), Range(64, KiB))
+        with self.assertRaises(RangeValueError):
+            ChunkBitmap(MiB, 0)
+        bitmap = ChunkBitmap(MiB, KiB)
+        with self.assertRaises(RangeValueError):
+            bitmap.set(1, KiB)
+        with self.assertRaises(RangeValueError):
+            bitmap.clear(0, Range(2, MiB))
+        self.assertEqual(bitmap.chunk_size, Range(1, KiB))
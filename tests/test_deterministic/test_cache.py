@@ -0,0 +1,102 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for caching of formatted Range output."""
+
+import threading
+import unittest
+
+from justbytes import Config, FormatCache, KiB, Range, ValueConfig
+from justbytes._errors import RangeValueError
+
+
+class FormatCacheTestCase(unittest.TestCase):
+    """Exercise the format cache."""
+
+    def setUp(self):
+        """Install a fresh format cache."""
+        self.cache = FormatCache(maxsize=2)
+        self.value_config = Config.STRING_CONFIG.VALUE_CONFIG
+        Config.set_format_cache(self.cache)
+
+    def tearDown(self):
+        """Disable caching and restore configuration."""
+        Config.set_format_cache(None)
+        Config.set_value_config(self.value_config)
+
+    def test_hits(self):
+        """Equal Ranges share cached results."""
+        self.assertEqual(str(Range(1, KiB)), "1 KiB")
+        self.assertEqual(str(Range(1024)), "1 KiB")
+        info = Range(1, KiB).getStringInfo(self.value_config)
+        self.assertIs(Range(1024).getStringInfo(self.value_config), info)
+        stats = self.cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (2, 2, 2))
+        self.assertEqual(stats.hit_rate, 0.5)
+
+    def test_eviction(self):
+        """The least recently used entry is evicted."""
+        str(Range(1))
+        str(Range(2))
+        str(Range(1))
+        str(Range(3))
+        self.assertEqual(self.cache.stats().evictions, 1)
+        str(Range(1))
+        self.assertEqual(self.cache.stats().hits, 2)
+        str(Range(2))
+        self.assertEqual(self.cache.stats().hits, 2)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_invalidation(self):
+        """Changing the global configuration clears the cache."""
+        self.assertEqual(str(Range(1536)), "1.50 KiB")
+        Config.set_value_config(ValueConfig(max_places=0))
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(str(Range(1536)), "> 1 KiB")
+
+    def test_clear(self):
+        """Clearing the cache resets the statistics."""
+        str(Range(1))
+        str(Range(1))
+        self.cache.clear()
+        self.assertEqual(self.cache.stats(), (0, 0, 0, 0, 2))
+        self.assertEqual(self.cache.stats().hit_rate, 0)
+
+    def test_threads(self):
+        """Threads may share the cache."""
+        Config.set_format_cache(FormatCache(maxsize=16))
+        results = []
+
+        def work():
+            results.append([str(Range(x, KiB)) for x in range(64)])
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        expected = [f"{x} KiB" if x != 0 else "0 B" for x in range(64)]
+        self.assertEqual(results, [expected] * 4)
+        stats = Config.FORMAT_CACHE.stats()
+        self.assertEqual(stats.hits + stats.misses, 256)
+        self.assertLessEqual(stats.size, 16)
+
+    def test_exception(self):
+        """Test exceptions."""
+        with self.assertRaises(RangeValueError):
+            FormatCache(maxsize=0)
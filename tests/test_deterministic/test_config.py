@@ -17,10 +17,14 @@
 
 """Test for configuration classes."""
 
+import asyncio
+import threading
 import unittest
+from fractions import Fraction
 
+from justbytes import KiB, NativeString, Range
 from justbytes._config import Config, ValueConfig
-from justbytes._errors import RangeValueError
+from justbytes._errors import RangeFractionalResultError, RangeValueError
 
 
 class ConfigTestCase(unittest.TestCase):
@@ -42,3 +46,92 @@ class ConfigTestCase(unittest.TestCase):
             ValueConfig(base=1)
         with self.assertRaises(RangeValueError):
             ValueConfig(max_places=-1)
+
+
+class ContextTestCase(unittest.TestCase):
+    """Exercise context-local configuration."""
+
+    def test_using(self):
+        """Overrides apply only within the with statement."""
+        with Config.using(value_config=ValueConfig(binary_units=False)) as config:
+            self.assertIs(Config.get_string_config(), config)
+            self.assertEqual(str(Range(2000)), "2 kB")
+            with Config.using(display_impl=NativeString) as inner:
+                self.assertIs(inner.VALUE_CONFIG, config.VALUE_CONFIG)
+                self.assertIs(inner.DISPLAY_IMPL_CLASS, NativeString)
+                self.assertEqual(str(Range(2000)), "2 kB")
+            self.assertIs(Config.get_string_config(), config)
+            with Config.using(Config.STRING_CONFIG):
+                self.assertEqual(str(Range(1, KiB)), "1 KiB")
+        self.assertIs(Config.get_string_config(), Config.STRING_CONFIG)
+        self.assertEqual(str(Range(1, KiB)), "1 KiB")
+
+    def test_using_shares(self):
+        """The same overrides yield the same derived configuration."""
+        value_config = ValueConfig(binary_units=False)
+        with Config.using(value_config=value_config) as config:
+            pass
+        with Config.using(value_config=value_config) as again:
+            self.assertIs(again, config)
+        with Config.using(value_config=ValueConfig(binary_units=False)) as other:
+            self.assertIsNot(other, config)
+
+    def test_global(self):
+        """Settings not overridden follow the global configuration."""
+        value_config = Config.STRING_CONFIG.VALUE_CONFIG
+        with Config.using(strict=True):
+            self.assertIs(Config.get_string_config(), Config.STRING_CONFIG)
+            Config.set_value_config(ValueConfig(max_places=0))
+            try:
+                self.assertEqual(str(Range(1536)), "> 1 KiB")
+            finally:
+                Config.set_value_config(value_config)
+
+    def test_strict(self):
+        """Strictness may be overridden in either direction."""
+        with Config.using(strict=True):
+            self.assertTrue(Config.get_strict())
+            with self.assertRaises(RangeFractionalResultError):
+                Range(1) / 2
+            with Config.using(strict=False):
+                self.assertEqual(Range(1) / 2, Range(Fraction(1, 2)))
+            with Config.using(display_impl=NativeString):
+                self.assertTrue(Config.get_strict())
+        self.assertFalse(Config.get_strict())
+
+    def test_threads(self):
+        """Threads may use different configurations at the same time."""
+        barrier = threading.Barrier(2)
+        results = {}
+
+        def work(binary_units):
+            with Config.using(value_config=ValueConfig(binary_units=binary_units)):
+                barrier.wait()
+                results[binary_units] = str(Range(4096))
+
+        threads = [threading.Thread(target=work, args=(x,)) for x in (True, False)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, {True: "4 KiB", False: "< 4.10 kB"})
+
+    def test_tasks(self):
+        """Asyncio tasks may use different configurations at the same time."""
+
+        async def work(binary_units):
+            with Config.using(value_config=ValueConfig(binary_units=binary_units)):
+                await asyncio.sleep(0)
+                return str(Range(4096))
+
+        async def main():
+            return await asyncio.gather(work(True), work(False))
+
+        self.assertEqual(asyncio.run(main()), ["4 KiB", "< 4.10 kB"])
+
+    def test_exception(self):
+        """Test exceptions."""
+        with self.assertRaises(RangeValueError):
+            with Config.using(value_config=ValueConfig(base=100)):
+                pass  # pragma: no cover
+        self.assertIs(Config.get_string_config(), Config.STRING_CONFIG)
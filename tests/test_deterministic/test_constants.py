@@ -17,6 +17,8 @@
 
 """Test for constants classes."""
 
+import pickle
+import sys
 import unittest
 
 from justbytes._constants import UNITS, B, BinaryUnits, DecimalUnits, RoundingMethods
@@ -35,6 +37,17 @@ class ConstantsTestCase(unittest.TestCase):
         self.assertIsInstance(str(DecimalUnits.KB), str)
         self.assertIsNotNone(DecimalUnits.KB.prefix)
 
+    def test_units_layout(self):
+        """Units are compact and immutable."""
+        unit = BinaryUnits.KiB
+        self.assertFalse(hasattr(unit, "__dict__"))
+        self.assertLessEqual(sys.getsizeof(unit), 56)
+        with self.assertRaises(AttributeError):
+            unit._factor = 2  # pylint: disable=protected-access
+        with self.assertRaises(AttributeError):
+            del unit._abbr  # pylint: disable=protected-access
+        self.assertEqual(int(pickle.loads(pickle.dumps(unit))), int(unit))
+
     def test_units_method(self):
         """Test that all units constants are in UNITS()."""
         self.assertTrue(set(DecimalUnits.UNITS()).issubset(set(UNITS())))
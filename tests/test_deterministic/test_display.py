@@ -0,0 +1,61 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for display implementations."""
+
+import unittest
+from fractions import Fraction
+
+from justbytes import (
+    Config,
+    DisplayConfig,
+    KiB,
+    NativeString,
+    Range,
+    StringConfig,
+    TiB,
+    ValueConfig,
+)
+
+
+class NativeStringTestCase(unittest.TestCase):
+    """Test NativeString display implementation."""
+
+    def setUp(self):
+        """Use NativeString."""
+        self.impl = Config.STRING_CONFIG.DISPLAY_IMPL_CLASS
+        Config.set_display_impl(NativeString)
+
+    def tearDown(self):
+        """Restore display implementation."""
+        Config.set_display_impl(self.impl)
+
+    def test_str(self):
+        """Test str with the default configuration."""
+        self.assertIs(Config.STRING_CONFIG.DISPLAY_IMPL_CLASS, NativeString)
+        self.assertEqual(str(Range("12.68", TiB)), "12.68 TiB")
+        self.assertEqual(str(Range("12.687", TiB)), "< 12.69 TiB")
+        self.assertEqual(str(Range(-1, KiB)), "-1 KiB")
+        self.assertEqual(str(Range(0)), "0 B")
+        self.assertEqual(str(Range(16384 - 1)), "< 16.00 KiB")
+
+    def test_fallback(self):
+        """Values without a terminating representation use justbases."""
+        config = StringConfig(ValueConfig(base=3), DisplayConfig(), NativeString)
+        self.assertEqual(Range(Fraction(1, 2)).getString(config), "> 0.11 B")
+        config = StringConfig(ValueConfig(max_places=3), DisplayConfig(), NativeString)
+        self.assertEqual(Range(Fraction(1, 3)).getString(config), "> 0.333 B")
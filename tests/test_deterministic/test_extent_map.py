@@ -0,0 +1,100 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for ExtentMap."""
+
+# pylint: disable=protected-access
+
+import pickle
+import unittest
+
+from justbytes import ExtentMap, KiB, Range
+from justbytes._errors import RangeNonsensicalBinOpError, RangeValueError
+
+
+class ExtentMapTestCase(unittest.TestCase):
+    """Exercise ExtentMap."""
+
+    def setUp(self):
+        """A map of a few extents."""
+        self.extents = ExtentMap([(0, 10, "a"), (Range(1, KiB), Range(1, KiB), "b")])
+
+    def test_lookup(self):
+        """Extents are found by start address or by contained address."""
+        self.assertEqual(self.extents.get(0), (Range(10), "a"))
+        self.assertIsNone(self.extents.get(1))
+        self.assertEqual(self.extents.get(1, ()), ())
+        self.assertIn(Range(1, KiB), self.extents)
+        self.assertEqual(self.extents.find(9), (Range(0), Range(10), "a"))
+        self.assertIsNone(self.extents.find(10))
+        self.assertIsNone(self.extents.find(-1))
+        self.assertEqual(
+            self.extents.find(Range(2, KiB) - Range(1)),
+            (Range(1, KiB), Range(1, KiB), "b"),
+        )
+
+    def test_versions(self):
+        """Updates leave earlier versions unchanged."""
+        updated = self.extents.set(20, 5, "c").remove(0)
+        self.assertEqual(len(self.extents), 2)
+        self.assertEqual(len(updated), 2)
+        self.assertEqual(repr(self.extents), "ExtentMap([(0, 10), (1024, 1024)])")
+        self.assertEqual(repr(updated), "ExtentMap([(20, 5), (1024, 1024)])")
+        self.assertIs(updated.set(20, 5, "c"), updated)
+        self.assertEqual(updated.set(20, 6, "c").get(20), (Range(6), "c"))
+
+    def test_sharing(self):
+        """Versions share every node not on the updated path."""
+        extents = ExtentMap((x, 1, None) for x in range(1023))
+        updated = extents.set(0, 2)
+        (nodes, updated_nodes) = (
+            set(map(id, extents._nodes())),
+            set(map(id, updated._nodes())),
+        )
+        self.assertEqual(len(updated_nodes - nodes), extents._root.height)
+
+    def test_diff(self):
+        """Differences are found in order."""
+        updated = self.extents.set(20, 5, "c").remove(0).set(1024, 1024, "d")
+        self.assertEqual(
+            list(self.extents.diff(updated)),
+            [
+                (Range(0), (Range(10), "a"), None),
+                (Range(20), None, (Range(5), "c")),
+                (Range(1, KiB), (Range(1, KiB), "b"), (Range(1, KiB), "d")),
+            ],
+        )
+        self.assertEqual(list(updated.diff(updated)), [])
+        self.assertEqual(len(list(ExtentMap().diff(updated))), 2)
+
+    def test_pickle(self):
+        """Maps can be pickled."""
+        restored = pickle.loads(pickle.dumps(self.extents))
+        self.assertEqual(list(restored), list(self.extents))
+
+    def test_exceptions(self):
+        """Test exceptions."""
+        with self.assertRaises(RangeValueError):
+            self.extents.set(0, 0)
+        with self.assertRaises(RangeValueError):
+            self.extents.remove(1)
+        with self.assertRaises(RangeValueError):
+            ExtentMap([(Range("0.5"), 1, None)])
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            list(self.extents.diff({}))
+        with self.assertRaises(AttributeError):
+            self.extents._size = 0
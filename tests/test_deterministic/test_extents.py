@@ -0,0 +1,89 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for ExtentSet."""
+
+import copy
+import pickle
+import unittest
+from fractions import Fraction
+
+from justbytes import ExtentSet, KiB, Range, YiB
+from justbytes._errors import RangeNonsensicalBinOpError, RangeValueError
+
+
+class ExtentSetTestCase(unittest.TestCase):
+    """Exercise ExtentSet."""
+
+    def test_coalescing(self):
+        """Overlapping and adjacent extents are coalesced."""
+        extents = ExtentSet([(10, 5), (0, 5), (5, 2), (12, 10), (30, 0)])
+        self.assertEqual(list(extents), [(Range(0), Range(7)), (Range(10), Range(12))])
+        self.assertEqual(len(extents), 2)
+        self.assertEqual(extents.size(), Range(19))
+        self.assertEqual(repr(extents), "ExtentSet([(0, 7), (10, 12)])")
+        self.assertIn(6, extents)
+        self.assertIn(Range(21), extents)
+        self.assertNotIn(7, extents)
+        self.assertNotIn(-1, extents)
+        self.assertEqual(ExtentSet().size(), Range(0))
+
+    def test_operations(self):
+        """Set operations."""
+        first = ExtentSet([(0, 10), (20, 10)])
+        second = ExtentSet([(5, 20), (40, 5)])
+        self.assertEqual(first | second, ExtentSet([(0, 30), (40, 5)]))
+        self.assertEqual(first & second, ExtentSet([(5, 5), (20, 5)]))
+        self.assertEqual(first - second, ExtentSet([(0, 5), (25, 5)]))
+        self.assertEqual(second - first, ExtentSet([(10, 10), (40, 5)]))
+        self.assertEqual(
+            first.complement(Range(0), Range(1, KiB)), ExtentSet([(10, 10), (30, 994)])
+        )
+        self.assertEqual(first.complement(0, 0), ExtentSet())
+
+    def test_large(self):
+        """Addresses may be of any magnitude."""
+        extents = ExtentSet([(Range(1, YiB), Range(1, KiB)), (0, 1)])
+        self.assertEqual(extents.size(), Range(1025))
+        self.assertIn(Range(1, YiB), extents)
+        self.assertEqual(extents - extents, ExtentSet())
+
+    def test_immutable(self):
+        """ExtentSets are immutable, hashable and picklable."""
+        extents = ExtentSet([(0, 10)])
+        with self.assertRaises(AttributeError):
+            extents._starts = []  # pylint: disable=protected-access
+        with self.assertRaises(AttributeError):
+            del extents._starts  # pylint: disable=protected-access
+        self.assertEqual(pickle.loads(pickle.dumps(extents)), extents)
+        self.assertEqual(copy.deepcopy(extents), extents)
+        self.assertEqual(hash(extents), hash(ExtentSet([(0, 5), (5, 5)])))
+        self.assertNotEqual(extents, [(0, 10)])
+
+    def test_exceptions(self):
+        """Test exceptions."""
+        with self.assertRaises(RangeValueError):
+            ExtentSet([(Range(Fraction(1, 2)), 1)])
+        with self.assertRaises(RangeValueError):
+            ExtentSet([(0, -1)])
+        with self.assertRaises(RangeValueError):
+            ExtentSet([(0, "1")])
+        with self.assertRaises(RangeValueError):
+            ExtentSet().__contains__(1.5)
+        for method in ("union", "intersection", "difference"):
+            with self.assertRaises(RangeNonsensicalBinOpError):
+                getattr(ExtentSet(), method)([(0, 1)])
@@ -0,0 +1,87 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for compiled formatters."""
+
+import copy
+import unittest
+
+import justbases
+from justbytes import (
+    Config,
+    DisplayConfig,
+    Formatter,
+    KiB,
+    NativeString,
+    Range,
+    StringConfig,
+    ValueConfig,
+)
+
+
+class FormatterTestCase(unittest.TestCase):
+    """Exercise Formatter objects."""
+
+    def test_call(self):
+        """A formatter formats like getString."""
+        formatter = Config.STRING_CONFIG.compile()
+        self.assertIsInstance(formatter, Formatter)
+        for value in (Range(0), Range(-1, KiB), Range(16383), Range(2**100)):
+            self.assertEqual(formatter(value), str(value))
+            self.assertEqual(
+                formatter.components(value),
+                value.components(Config.STRING_CONFIG.VALUE_CONFIG),
+            )
+
+    def test_equality(self):
+        """Formatters for equivalent configurations are equal."""
+        config = StringConfig(ValueConfig(), DisplayConfig(), justbases.String)
+        formatter = config.compile()
+        self.assertEqual(formatter, Config.STRING_CONFIG.compile())
+        self.assertEqual(hash(formatter), hash(Config.STRING_CONFIG.compile()))
+        self.assertNotEqual(formatter, None)
+        self.assertNotEqual(
+            formatter,
+            StringConfig(ValueConfig(), DisplayConfig(), NativeString).compile(),
+        )
+        self.assertNotEqual(
+            formatter,
+            StringConfig(
+                ValueConfig(max_places=3), DisplayConfig(), justbases.String
+            ).compile(),
+        )
+        self.assertIsInstance(repr(formatter), str)
+
+    def test_immutable(self):
+        """Formatters are not affected by changes to their configuration."""
+        value_config = ValueConfig()
+        display_config = DisplayConfig()
+        config = StringConfig(value_config, display_config, justbases.String)
+        formatter = config.compile()
+        self.assertIs(copy.copy(formatter), formatter)
+        key = config.compile()
+
+        value_config.max_places = 0
+        display_config.show_approx_str = False
+        self.assertEqual(formatter(Range(1536)), "1.50 KiB")
+        self.assertEqual(formatter, key)
+        self.assertNotEqual(formatter, config.compile())
+
+        with self.assertRaises(AttributeError):
+            formatter._units = ()  # pylint: disable=protected-access
+        with self.assertRaises(AttributeError):
+            del formatter._units  # pylint: disable=protected-access
@@ -0,0 +1,118 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for RangeHistogram."""
+
+import unittest
+from array import array
+from fractions import Fraction
+
+from justbytes import (
+    Config,
+    DisplayConfig,
+    KiB,
+    MiB,
+    NativeString,
+    Range,
+    RangeArray,
+    RangeHistogram,
+    StringConfig,
+    ValueConfig,
+)
+from justbytes._errors import RangeNonsensicalBinOpError, RangeValueError
+
+
+class RangeHistogramTestCase(unittest.TestCase):
+    """Exercise RangeHistogram."""
+
+    def test_log2(self):
+        """Values are bucketed by power of two."""
+        histogram = RangeHistogram.log2(4)
+        self.assertEqual(len(histogram), 6)
+        histogram.add_many(array("q", [-1, 0, 1, 2, 3, 4, 15, 16, 1000]))
+        histogram.add(Range(Fraction(1, 2)))
+        histogram.add(7, count=2)
+        self.assertEqual(histogram.counts(), [3, 1, 2, 3, 1, 2])
+        self.assertEqual(histogram.total(), 12)
+        self.assertEqual(histogram.edges()[-1], Range(16))
+
+    def test_units(self):
+        """Values are bucketed by the unit used to display them."""
+        histogram = RangeHistogram.units()
+        values = RangeArray([-2048, 1023, 1024, Fraction(3, 2), 5 * 2**20])
+        histogram.add_many(values)
+        histogram.add_many(list(values))
+        self.assertEqual(histogram.counts()[:4], [4, 4, 2, 0])
+        self.assertEqual(
+            RangeHistogram.units(binary_units=False, min_value=10).edges()[0],
+            Range(10000),
+        )
+
+    def test_units_min_value(self):
+        """Any min_value accepted by ValueConfig may be used."""
+        histogram = RangeHistogram.units(min_value=0)
+        histogram.add_many([0, 1, 2**70])
+        self.assertEqual(histogram.counts()[-1], 3)
+        with Config.using(strict=True):
+            histogram = RangeHistogram.units(min_value=Fraction(1, 3))
+            histogram.add(Range(400))
+        self.assertEqual(histogram.counts()[:3], [0, 1, 0])
+
+    def test_labels(self):
+        """Labels are rendered with getString."""
+        histogram = RangeHistogram([Range(1, KiB), Range(1, MiB)])
+        histogram.add(Range(2, KiB))
+        self.assertEqual(
+            histogram.items(), [("< 1 KiB", 0), ("[1 KiB, 1 MiB)", 1), (">= 1 MiB", 0)]
+        )
+        config = StringConfig(
+            ValueConfig(binary_units=False),
+            DisplayConfig(show_approx_str=False),
+            NativeString,
+        )
+        self.assertEqual(histogram.labels(config)[1], "[1.02 kB, 1.05 MB)")
+        self.assertEqual(repr(histogram), "RangeHistogram([0, 1, 0])")
+
+    def test_merge(self):
+        """Merging adds counts."""
+        first = RangeHistogram.log2(2)
+        second = RangeHistogram.log2(2)
+        first.add_many([1, 2])
+        second.add_many([2, 8])
+        self.assertEqual(first.merge(second).counts(), [0, 1, 2, 1])
+
+    def test_exceptions(self):
+        """Test exceptions."""
+        with self.assertRaises(RangeValueError):
+            RangeHistogram([])
+        with self.assertRaises(RangeValueError):
+            RangeHistogram([1, 2])
+        with self.assertRaises(RangeValueError):
+            RangeHistogram([Range(2), Range(2)])
+        with self.assertRaises(RangeValueError):
+            RangeHistogram.log2(-1)
+        with self.assertRaises(RangeValueError):
+            RangeHistogram.units(min_value=-1)
+        histogram = RangeHistogram.log2()
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            histogram.add("1")
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            histogram.add_many(array("d", [1.5]))
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            histogram.merge(Range(1))
+        with self.assertRaises(RangeValueError):
+            histogram.merge(RangeHistogram.log2(2))
@@ -0,0 +1,80 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for interning of Range objects."""
+
+import unittest
+from fractions import Fraction
+
+from justbytes import Config, InternTable, KiB, MiB, Range
+from justbytes._errors import RangeValueError
+
+
+class InternTableTestCase(unittest.TestCase):
+    """Exercise the intern table."""
+
+    def setUp(self):
+        """Install a fresh intern table."""
+        self.table = InternTable(maxsize=4)
+        Config.set_intern_table(self.table)
+
+    def tearDown(self):
+        """Disable interning."""
+        Config.set_intern_table(None)
+
+    def test_constructor(self):
+        """Equal Ranges constructed independently are identical."""
+        self.assertIs(Range(1, MiB), Range(1024, KiB))
+        self.assertIs(Range(Fraction(1, 2)), Range("0.5"))
+        self.assertEqual(self.table.stats().hits, 2)
+        self.assertEqual(self.table.stats().misses, 2)
+
+    def test_arithmetic(self):
+        """Results of arithmetic are interned."""
+        self.assertIs(Range(2, KiB) + Range(2, KiB), Range(4, KiB))
+        self.assertIs(Range(4, KiB) % Range(3, KiB), Range(1, KiB))
+        self.assertIs(Range(1, KiB) * 4, Range(4, KiB))
+
+    def test_bounded(self):
+        """The table never grows beyond its maximum size."""
+        ranges = [Range(x) for x in range(10)]
+        self.assertEqual(len(self.table), 4)
+        self.assertEqual(self.table.stats().size, 4)
+        self.assertIs(Range(9), ranges[9])
+        self.assertIsNot(Range(0), ranges[0])
+        self.assertEqual(Range(0), ranges[0])
+
+    def test_clear(self):
+        """Clearing the table resets the statistics."""
+        Range(1)
+        Range(1)
+        self.table.clear()
+        self.assertEqual(self.table.stats(), (0, 0, 0, 4))
+
+    def test_exception(self):
+        """Test exceptions."""
+        with self.assertRaises(RangeValueError):
+            InternTable(maxsize=0)
+
+
+class NoInternTestCase(unittest.TestCase):
+    """Interning is disabled by default."""
+
+    def test_default(self):
+        """Equal Ranges constructed independently are distinct."""
+        self.assertIsNone(Config.INTERN_TABLE)
+        self.assertIsNot(Range(1, KiB), Range(1, KiB))
@@ -0,0 +1,87 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for IntervalTree."""
+
+import unittest
+
+from justbytes import IntervalTree, KiB, Range
+from justbytes._errors import RangeValueError
+
+
+class IntervalTreeTestCase(unittest.TestCase):
+    """Exercise IntervalTree."""
+
+    def setUp(self):
+        """A tree of extents, some overlapping."""
+        self.tree = IntervalTree()
+        self.tree.insert(0, 10, "a")
+        self.tree.insert(Range(5), Range(10), "b")
+        self.tree.insert(20, 5, "c")
+        self.tree.insert(Range(1, KiB), Range(1, KiB), "d")
+
+    def test_overlap(self):
+        """Overlapping extents are found in order."""
+        self.assertEqual([p for (_, _, p) in self.tree.overlap(8, 13)], ["a", "b", "c"])
+        self.assertEqual(list(self.tree.overlap(15, 5)), [])
+        self.assertEqual(
+            list(self.tree.overlap(Range(2, KiB) - Range(1), 100)),
+            [(Range(1, KiB), Range(1, KiB), "d")],
+        )
+        self.assertEqual([p for (_, _, p) in self.tree.stab(9)], ["a", "b"])
+        self.assertEqual([p for (_, _, p) in self.tree.stab(10)], ["b"])
+
+    def test_lazy(self):
+        """Results are produced lazily."""
+        tree = IntervalTree((x, 2) for x in range(1000))
+        results = tree.overlap(0, 10**6)
+        self.assertEqual(next(results)[0], Range(0))
+        self.assertEqual(next(results)[0], Range(1))
+
+    def test_find_gap(self):
+        """Gaps are found at or after the start."""
+        self.assertEqual(self.tree.find_gap(5), Range(15))
+        self.assertEqual(self.tree.find_gap(6), Range(25))
+        self.assertEqual(self.tree.find_gap(Range(1, KiB)), Range(2, KiB))
+        self.assertEqual(self.tree.find_gap(1, start=22), Range(25))
+        self.assertEqual(self.tree.find_gap(1, start=-5), Range(-5))
+        self.assertEqual(IntervalTree().find_gap(1), Range(0))
+
+    def test_remove(self):
+        """Extents are removed, earliest inserted first."""
+        self.tree.insert(0, 10, "e")
+        self.assertEqual(len(self.tree), 5)
+        self.assertEqual(self.tree.remove(0, 10), "a")
+        self.assertEqual(self.tree.remove(Range(20), 5), "c")
+        self.assertEqual([p for (_, _, p) in self.tree], ["e", "b", "d"])
+        self.assertEqual(len(self.tree), 3)
+        self.assertEqual(
+            repr(self.tree), "IntervalTree([(0, 10), (5, 10), (1024, 1024)])"
+        )
+
+    def test_exceptions(self):
+        """Test exceptions."""
+        with self.assertRaises(RangeValueError):
+            self.tree.insert(0, 0)
+        with self.assertRaises(RangeValueError):
+            self.tree.insert(0.5, 1)
+        with self.assertRaises(RangeValueError):
+            self.tree.remove(0, 11)
+        with self.assertRaises(RangeValueError):
+            self.tree.overlap(0, -1)
+        with self.assertRaises(RangeValueError):
+            self.tree.find_gap(0)
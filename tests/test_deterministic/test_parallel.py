@@ -0,0 +1,72 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for formatting many Ranges in parallel."""
+
+import unittest
+from fractions import Fraction
+
+from justbytes import (
+    KB,
+    ROUND_UP,
+    DisplayConfig,
+    NativeString,
+    Range,
+    RangeArray,
+    StringConfig,
+    ValueConfig,
+    format_many,
+)
+from justbytes._errors import RangeValueError
+
+
+class FormatManyTestCase(unittest.TestCase):
+    """Exercise format_many."""
+
+    def setUp(self):
+        """Ranges, including fractional and very large ones."""
+        self.ranges = [Range(x * 1000003) for x in range(-50, 50)]
+        self.ranges.extend([Range(Fraction(1, 3)), Range(2**70), Range(3, KB)])
+
+    def test_default(self):
+        """Results are in order and agree with str."""
+        expected = [str(x) for x in self.ranges]
+        self.assertEqual(format_many(self.ranges, workers=2, chunk_size=7), expected)
+        self.assertEqual(format_many(self.ranges, workers=1), expected)
+
+    def test_config(self):
+        """Workers reconstruct the configuration."""
+        config = StringConfig(
+            ValueConfig(max_places=1, unit=KB, rounding_method=ROUND_UP),
+            DisplayConfig(show_approx_str=False),
+            NativeString,
+        )
+        self.assertEqual(
+            format_many(RangeArray(self.ranges), config, workers=2, chunk_size=10),
+            [x.getString(config) for x in self.ranges],
+        )
+
+    def test_empty(self):
+        """No Ranges, no results."""
+        self.assertEqual(format_many([], workers=2), [])
+
+    def test_exceptions(self):
+        """Test exceptions."""
+        with self.assertRaises(RangeValueError):
+            format_many([], workers=0)
+        with self.assertRaises(RangeValueError):
+            format_many([], chunk_size=0)
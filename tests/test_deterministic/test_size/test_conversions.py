@@ -48,9 +48,9 @@ class ConversionTestCase(unittest.TestCase):
             float(Range(0))
 
     def test_deep_copy(self):
-        """Test that deepcopy is different but equal."""
+        """Test that deepcopy is equal and can not be modified."""
         size_1 = Range(0)
         size_2 = copy.deepcopy(size_1)
         self.assertEqual(size_1, size_2)
-        size_1._magnitude += 1
-        self.assertNotEqual(size_1, size_2)
+        with self.assertRaises(AttributeError):
+            size_2._magnitude += 1
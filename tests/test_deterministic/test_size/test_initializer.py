@@ -19,9 +19,10 @@
 
 import unittest
 from decimal import Decimal
+from fractions import Fraction
 
-from justbytes import B, Range
-from justbytes._errors import RangeValueError
+from justbytes import MB, UNITS, B, Config, GiB, KiB, Range
+from justbytes._errors import RangeFractionalResultError, RangeValueError
 
 
 class InitializerTestCase(unittest.TestCase):
@@ -45,3 +46,46 @@ class InitializerTestCase(unittest.TestCase):
 
         with self.assertRaises(RangeValueError):
             Range(1, Decimal("NaN"))
+
+
+class ParseTestCase(unittest.TestCase):
+    """Test parsing of strings."""
+
+    def test_units(self):
+        """Every unit may be specified by abbreviation or by prefix."""
+        for unit in UNITS():
+            for text in (
+                f"2{unit.abbr}",
+                f"2 {unit.abbr}B",
+                f"2 {unit.prefix}bytes",
+                f"2 {unit.prefix.upper()}BYTES",
+            ):
+                if text != "2":
+                    self.assertEqual(Range.parse(text), Range(2, unit), text)
+
+    def test_values(self):
+        """Test values of various forms."""
+        self.assertEqual(Range.parse("1.5 GiB"), Range("1.5", GiB))
+        self.assertEqual(Range.parse("512k"), Range(512000))
+        self.assertEqual(Range.parse("512K"), Range(512000))
+        self.assertEqual(Range.parse("4 MB"), Range(4, MB))
+        self.assertEqual(Range.parse(" -2.5e3KiB "), Range(-2500, KiB))
+        self.assertEqual(Range.parse("+.5"), Range(Fraction(1, 2)))
+        self.assertEqual(Range.parse("1e-3 kB"), Range(1))
+        self.assertEqual(Range.parse("3."), Range(3))
+        self.assertEqual(Range.parse("1 byte"), Range(1))
+
+    def test_strict(self):
+        """Fractional results are errors when strict."""
+        with Config.using(strict=True):
+            with self.assertRaises(RangeFractionalResultError):
+                Range.parse("0.5")
+            self.assertEqual(Range.parse("0.5 KiB"), Range(512))
+
+    def test_exceptions(self):
+        """Test exceptions."""
+        for text in ("", "GiB", "1 2", "1..2", "1 mib", "1 KiBB", "1 bits", "0x10"):
+            with self.assertRaises(RangeValueError):
+                Range.parse(text)
+        with self.assertRaises(RangeValueError):
+            Range.parse(2)
@@ -17,6 +17,9 @@
 
 """Tests for behavior of Range objects."""
 
+import copy
+import pickle
+import sys
 import unittest
 from fractions import Fraction
 
@@ -69,6 +72,65 @@ class ConstructionTestCase(unittest.TestCase):
         self.assertEqual(Range(Fraction(1024, 2), KiB), Range(Fraction(1, 2), MiB))
 
 
+class RepresentationTestCase(unittest.TestCase):
+    """Test internal representation of Range magnitudes."""
+
+    def test_integral(self):
+        """Integral magnitudes are stored as int."""
+        # pylint: disable=protected-access
+        self.assertIs(type(Range(3, KiB)._magnitude), int)
+        self.assertIs(type(Range("1024")._magnitude), int)
+        self.assertIs(type(Range(Fraction(1, 2), KiB)._magnitude), int)
+        self.assertIs(type((Range(Fraction(1, 2)) * 2)._magnitude), int)
+        self.assertIs(type((Range(1) + Range(Fraction(1, 2)))._magnitude), Fraction)
+
+    def test_magnitude(self):
+        """The magnitude property is always a Fraction."""
+        self.assertIsInstance(Range(3).magnitude, Fraction)
+        self.assertEqual(Range(3).magnitude, Fraction(3))
+        self.assertEqual(Range(Fraction(3, 2)).magnitude, Fraction(3, 2))
+
+    def test_division(self):
+        """Division of integral Ranges yields precise results."""
+        self.assertEqual(Range(1) / Range(3), Fraction(1, 3))
+        self.assertIsInstance(Range(1) / Range(3), Fraction)
+        self.assertEqual(Range(1) / 3, Range(Fraction(1, 3)))
+        self.assertEqual(Range(1).convertTo(KiB), Fraction(1, 1024))
+
+    def test_hash(self):
+        """Hash is independent of representation."""
+        self.assertEqual(hash(Range(Fraction(4, 2))), hash(Range(2)))
+        self.assertEqual(hash(Range(2)), hash(Fraction(2)))
+
+
+class LayoutTestCase(unittest.TestCase):
+    """Test memory layout and immutability of Range objects."""
+
+    def test_footprint(self):
+        """A Range holds one reference and no instance dict."""
+        size = Range(4, KiB)
+        self.assertFalse(hasattr(size, "__dict__"))
+        self.assertLessEqual(sys.getsizeof(size), 40)
+        self.assertLessEqual(sys.getsizeof(size) + sys.getsizeof(4 * 1024), 72)
+
+    def test_immutable(self):
+        """Attributes can not be set or deleted."""
+        size = Range(4, KiB)
+        with self.assertRaises(AttributeError):
+            size._magnitude = 2  # pylint: disable=protected-access
+        with self.assertRaises(AttributeError):
+            del size._magnitude  # pylint: disable=protected-access
+        with self.assertRaises(AttributeError):
+            size.other = 2  # pylint: disable=attribute-defined-outside-init
+
+    def test_copy(self):
+        """Copying and pickling preserve the value."""
+        size = Range(Fraction(1, 2), KiB)
+        self.assertIs(copy.copy(size), size)
+        self.assertIs(copy.deepcopy(size), size)
+        self.assertEqual(pickle.loads(pickle.dumps(size)), size)
+
+
 class DisplayTestCase(unittest.TestCase):
     """Test formatting Range for display."""
 
@@ -0,0 +1,157 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for QuantileSketch."""
+
+import unittest
+from fractions import Fraction
+
+from justbytes import KB, ROUND_UP, GiB, KiB, MiB, QuantileSketch, Range, RangeArray
+from justbytes._config import Config
+from justbytes._errors import RangeNonsensicalBinOpError, RangeValueError
+
+
+class QuantileSketchTestCase(unittest.TestCase):
+    """Exercise QuantileSketch."""
+
+    def test_accuracy(self):
+        """Quantiles are within the relative accuracy."""
+        values = [Range(x * x * 37) for x in range(1, 1001)]
+        sketch = QuantileSketch(relative_accuracy=0.02)
+        sketch.update(values)
+        self.assertLessEqual(sketch.relative_accuracy(), 0.02)
+        self.assertEqual(sketch.count(), 1000)
+        for q in (0, Fraction(1, 4), 0.5, 0.99, 1):
+            actual = values[int(q * 999)].magnitude
+            estimate = sketch.quantile(q).magnitude
+            self.assertLessEqual(
+                abs(estimate - actual), actual * sketch.relative_accuracy() + 1
+            )
+        self.assertEqual(sketch.quantile(0), values[0])
+        self.assertEqual(sketch.quantile(1), values[-1])
+
+    def test_extremes(self):
+        """Values far beyond the range of floats are accepted."""
+        for magnitude in (2**1100, 3**700, Fraction(1, 10**400), Fraction(7, 3**900)):
+            sketch = QuantileSketch()
+            sketch.update([Range(magnitude), Range(magnitude * 2)])
+            # pylint: disable=protected-access
+            estimate = sketch._estimate(sketch._index(magnitude))
+            self.assertLessEqual(
+                abs(estimate - magnitude) / magnitude,
+                sketch.relative_accuracy() * (1 + 1e-12),
+            )
+            for q in (0, 1):
+                self.assertLessEqual(Range(magnitude), sketch.quantile(q))
+                self.assertLessEqual(sketch.quantile(q), Range(magnitude * 2))
+
+    def test_unit_boundaries(self):
+        """Unit boundaries are bucket boundaries."""
+        for binary_units, unit in ((True, KiB), (False, KB)):
+            sketch = QuantileSketch(binary_units=binary_units)
+            # pylint: disable=protected-access
+            for exponent in range(-2, 4):
+                boundary = Fraction(unit.factor) ** exponent
+                index = sketch._index(boundary)
+                self.assertEqual(index, exponent * sketch._steps)
+                self.assertEqual(
+                    sketch._index(boundary * Fraction(1001, 1000)), index + 1
+                )
+
+    def test_rounding(self):
+        """Estimates are rounded with roundTo, within the bounds of the values."""
+        sketch = QuantileSketch()
+        sketch.add(Range(3, GiB) + Range(1), count=10)
+        self.assertEqual(sketch.quantile(0.5, MiB), Range(3, GiB) + Range(1))
+        sketch.add(Range(5, GiB))
+        self.assertEqual(sketch.quantile(0.5, MiB, ROUND_UP), Range(3073, MiB))
+
+    def test_strict(self):
+        """Integral estimates are available in strict mode."""
+        sketch = QuantileSketch()
+        sketch.update([Range(1000), Range(3000), Range(5000)])
+        with Config.using(strict=True):
+            self.assertEqual(sketch.quantile(0.5, KiB), Range(3, KiB))
+            self.assertEqual(sketch.quantile(1), Range(5000))
+
+    def test_signs(self):
+        """Negative, zero and positive values are all counted."""
+        sketch = QuantileSketch()
+        sketch.add(RangeArray([-4096, 0, 0, 4096, Fraction(1, 2)]))
+        self.assertEqual(sketch.quantile(0), Range(-4096))
+        self.assertEqual(sketch.quantile(0.5), Range(0))
+        self.assertEqual(sketch.quantile(1), Range(4096))
+        self.assertIsNone(QuantileSketch().quantile(0.5))
+
+    def test_merge(self):
+        """Merging sketches is the same as sketching all the values."""
+        whole = QuantileSketch()
+        parts = [QuantileSketch(), QuantileSketch()]
+        for x in range(-500, 2000, 7):
+            whole.add(x)
+            parts[x % 2].add(x)
+        merged = parts[0].merge(parts[1]).merge(QuantileSketch())
+        self.assertEqual(merged.to_bytes(), whole.to_bytes())
+        empty = QuantileSketch().merge(whole)
+        self.assertEqual(empty.to_bytes(), whole.to_bytes())
+
+    def test_serialization(self):
+        """Sketches survive serialization."""
+        sketch = QuantileSketch(binary_units=False, max_buckets=100)
+        sketch.update(
+            [Range(x, KB) for x in range(1, 500)] + [-1, Range(Fraction(-1, 3))]
+        )
+        data = sketch.to_bytes()
+        restored = QuantileSketch.from_bytes(data)
+        self.assertEqual(restored.to_bytes(), data)
+        self.assertEqual(restored.count(), sketch.count())
+        for q in (0, 0.1, 0.5, 0.9, 1):
+            self.assertEqual(restored.quantile(q), sketch.quantile(q))
+        self.assertEqual(
+            QuantileSketch.from_bytes(QuantileSketch().to_bytes()).count(), 0
+        )
+        self.assertIsInstance(repr(restored), str)
+
+    def test_collapse(self):
+        """The number of buckets is bounded."""
+        sketch = QuantileSketch(max_buckets=10)
+        sketch.update(range(1, 10000, 3))
+        # pylint: disable=protected-access
+        self.assertEqual(len(sketch._positive), 10)
+        self.assertEqual(sketch.quantile(1), Range(9997))
+
+    def test_exceptions(self):
+        """Test exceptions."""
+        with self.assertRaises(RangeValueError):
+            QuantileSketch(relative_accuracy=0)
+        with self.assertRaises(RangeValueError):
+            QuantileSketch(max_buckets=0)
+        sketch = QuantileSketch()
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            sketch.add("1")
+        with self.assertRaises(RangeValueError):
+            sketch.add(1, count=0)
+        with self.assertRaises(RangeValueError):
+            sketch.quantile(2)
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            sketch.merge(Range(1))
+        with self.assertRaises(RangeValueError):
+            sketch.merge(QuantileSketch(binary_units=False))
+        data = QuantileSketch().to_bytes()
+        for bad in (b"", b"\x02", data[:-1], data + b"\x00", b"\x01\x05\x01\x01"):
+            with self.assertRaises(RangeValueError):
+                QuantileSketch.from_bytes(bad)
@@ -0,0 +1,88 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for RangeStats."""
+
+import pickle
+import unittest
+from fractions import Fraction
+
+from justbytes import Config, KiB, Range, RangeArray, RangeStats
+from justbytes._errors import RangeFractionalResultError, RangeNonsensicalBinOpError
+
+
+class RangeStatsTestCase(unittest.TestCase):
+    """Exercise RangeStats."""
+
+    def test_statistics(self):
+        """Values of every accepted type are summarized."""
+        stats = RangeStats([Range(1, KiB), 2])
+        stats.add(RangeArray([3, Fraction(1, 2)]))
+        stats.add(4)
+        stats.add(RangeArray([]))
+        self.assertEqual(stats.count(), 5)
+        self.assertEqual(stats.sum(), Range(Fraction(2067, 2)))
+        self.assertEqual(stats.min(), Range(Fraction(1, 2)))
+        self.assertEqual(stats.max(), Range(1, KiB))
+        self.assertEqual(stats.mean(), Range(Fraction(2067, 10)))
+        magnitudes = [Fraction(x) for x in (1024, 2, 3, Fraction(1, 2), 4)]
+        mean = sum(magnitudes) / 5
+        squares = sum((x - mean) ** 2 for x in magnitudes)
+        self.assertEqual(stats.variance(), squares / 5)
+        self.assertEqual(stats.variance(sample=True), squares / 4)
+        self.assertIsInstance(repr(stats), str)
+
+    def test_empty(self):
+        """There are no statistics for no values."""
+        stats = RangeStats()
+        self.assertEqual(stats.count(), 0)
+        self.assertEqual(stats.sum(), Range(0))
+        self.assertIsNone(stats.min())
+        self.assertIsNone(stats.max())
+        self.assertIsNone(stats.mean())
+        self.assertIsNone(stats.variance())
+        stats.add(Range(1))
+        self.assertEqual(stats.variance(), 0)
+        self.assertIsNone(stats.variance(sample=True))
+
+    def test_merge(self):
+        """Merging statistics over parts gives statistics over the whole."""
+        values = [Range(x * x - 50, KiB) for x in range(20)]
+        whole = RangeStats(values)
+        parts = [RangeStats(values[i : i + 7]) for i in range(0, 20, 7)]
+        merged = RangeStats()
+        for part in parts:
+            merged.merge(pickle.loads(pickle.dumps(part)))
+        merged.merge(RangeStats())
+        for method in ("count", "sum", "min", "max", "mean", "variance"):
+            self.assertEqual(getattr(merged, method)(), getattr(whole, method)())
+
+    def test_strict(self):
+        """A fractional mean is an error when strict."""
+        stats = RangeStats([1, 2])
+        with Config.using(strict=True):
+            with self.assertRaises(RangeFractionalResultError):
+                stats.mean()
+
+    def test_exceptions(self):
+        """Test exceptions."""
+        stats = RangeStats()
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            stats.update([1, 2, "3"])
+        self.assertEqual(stats.count(), 2)
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            stats.merge(Range(0))
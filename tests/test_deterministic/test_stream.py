@@ -0,0 +1,116 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for streaming parsing of Range values."""
+
+import io
+import unittest
+from fractions import Fraction
+
+from justbytes import ColumnParser, Config, KiB, MiB, Range, RangeArray
+from justbytes._errors import RangeFractionalResultError, RangeValueError
+
+TEXT = """\
+/dev/sda 1.5GiB 512k
+/dev/sdb 4MB
+
+/dev/sdc bogus 2
+/dev/sdd 0.5 1
+"""
+
+
+class ColumnParserTestCase(unittest.TestCase):
+    """Exercise the column parser."""
+
+    def test_ranges(self):
+        """Parse a column, recording errors."""
+        parser = ColumnParser(1, chunk_size=7)
+        self.assertEqual(
+            list(parser.ranges(io.StringIO(TEXT))),
+            [Range("1.5", MiB) * 1024, Range(4000000), Range(Fraction(1, 2))],
+        )
+        self.assertEqual(parser.error_count, 1)
+        (error,) = parser.errors
+        self.assertEqual(error.line_number, 4)
+        self.assertEqual(error.line, "/dev/sdc bogus 2")
+        self.assertIsInstance(error.error, RangeValueError)
+
+    def test_units(self):
+        """Plain numbers are multiplied by units."""
+        parser = ColumnParser(2, units=KiB)
+        self.assertEqual(
+            list(parser.ranges(TEXT.splitlines(keepends=True))),
+            [Range(2, KiB), Range(1, KiB)],
+        )
+        self.assertEqual([e.line_number for e in parser.errors], [1, 2])
+
+    def test_separator(self):
+        """Columns may be separated by any string."""
+        parser = ColumnParser(1, separator=",")
+        self.assertEqual(
+            list(parser.ranges(["a,1 KiB\n", "b, 2 kibibytes \n"])),
+            [Range(1, KiB), Range(2, KiB)],
+        )
+
+    def test_batches(self):
+        """Batches contain at most batch_size values."""
+        parser = ColumnParser()
+        lines = [f"{x}\n" for x in range(10)]
+        batches = list(parser.batches(lines, batch_size=4))
+        self.assertEqual([len(b) for b in batches], [4, 4, 2])
+        self.assertTrue(all(isinstance(b, RangeArray) for b in batches))
+        self.assertEqual([x for b in batches for x in b], [Range(x) for x in range(10)])
+
+    def test_bounded_errors(self):
+        """Only max_errors errors are recorded, but all are counted."""
+        parser = ColumnParser(max_errors=2)
+        self.assertEqual(list(parser.ranges(["x"] * 5 + ["1"])), [Range(1)])
+        self.assertEqual(len(parser.errors), 2)
+        self.assertEqual(parser.error_count, 5)
+        self.assertEqual(list(parser.ranges(["2"])), [Range(2)])
+        self.assertEqual(parser.error_count, 0)
+
+    def test_parse_line(self):
+        """Single lines are parsed, with errors recorded until reset."""
+        parser = ColumnParser(1)
+        self.assertEqual(parser.parse_line(1, "a 1KiB"), Range(1, KiB))
+        self.assertEqual(parser.parse_line(2, b"b 2KiB"), Range(2, KiB))
+        self.assertIsNone(parser.parse_line(3, ""))
+        self.assertIsNone(parser.parse_line(4, b"c \xff"))
+        (error,) = parser.errors
+        self.assertEqual(error[:2], (4, "c \ufffd"))
+        self.assertIsInstance(error.error, RangeValueError)
+        parser.reset()
+        self.assertEqual((parser.errors, parser.error_count), ([], 0))
+
+    def test_strict(self):
+        """Fractional values are errors when strict."""
+        parser = ColumnParser(1)
+        with Config.using(strict=True):
+            self.assertEqual(len(list(parser.batches(io.StringIO(TEXT)))[0]), 2)
+        self.assertIsInstance(parser.errors[-1].error, RangeFractionalResultError)
+
+    def test_exceptions(self):
+        """Test exceptions."""
+        with self.assertRaises(RangeValueError):
+            ColumnParser(units=1.2)
+        with self.assertRaises(RangeValueError):
+            ColumnParser(chunk_size=0)
+        with self.assertRaises(RangeValueError):
+            ColumnParser(max_errors=-1)
+        with self.assertRaises(RangeValueError):
+            ColumnParser().batches([], batch_size=0)
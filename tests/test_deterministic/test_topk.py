@@ -0,0 +1,82 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for RangeTopK."""
+
+import unittest
+from array import array
+from fractions import Fraction
+
+from justbytes import KiB, Range, RangeArray, RangeTopK
+from justbytes._errors import RangeNonsensicalBinOpError, RangeValueError
+
+
+class RangeTopKTestCase(unittest.TestCase):
+    """Exercise RangeTopK."""
+
+    def test_largest(self):
+        """The largest values are kept, earlier values first among equals."""
+        top = RangeTopK(3)
+        for name, value in (("a", 5), ("b", Range(1, KiB)), ("c", 7), ("d", 7)):
+            top.add(value, name)
+        top.add_many(array("q", [1, 7, 2]), "xyz")
+        self.assertEqual(len(top), 3)
+        self.assertEqual(
+            top.result(), [(Range(1, KiB), "b"), (Range(7), "c"), (Range(7), "d")]
+        )
+        self.assertIsInstance(repr(top), str)
+
+    def test_smallest(self):
+        """The smallest values are kept."""
+        bottom = RangeTopK(2, largest=False)
+        bottom.add_many(RangeArray([5, Fraction(1, 2), -3, 9]))
+        bottom.add_many([Range(-3), 0], ["p", "q"])
+        self.assertEqual(bottom.result(), [(Range(-3), None), (Range(-3), "p")])
+
+    def test_merge(self):
+        """Merging partial trackers gives the overall result."""
+        values = [(x * 7919) % 1000 for x in range(100)]
+        whole = RangeTopK(5)
+        whole.add_many(array("q", values))
+        parts = [RangeTopK(5), RangeTopK(5)]
+        parts[0].add_many(values[:50])
+        parts[1].add_many(values[50:])
+        merged = parts[0].merge(parts[1])
+        self.assertEqual(merged.result(), whole.result())
+        self.assertEqual(
+            [x for (x, _) in merged.result()],
+            [Range(x) for x in sorted(values, reverse=True)[:5]],
+        )
+
+    def test_exceptions(self):
+        """Test exceptions."""
+        with self.assertRaises(RangeValueError):
+            RangeTopK(0)
+        top = RangeTopK(2)
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            top.add(1.5)
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            top.add_many(array("d", [1.5]))
+        with self.assertRaises(RangeNonsensicalBinOpError):
+            top.merge([])
+        with self.assertRaises(RangeValueError):
+            top.merge(RangeTopK(2, largest=False))
+        with self.assertRaises(RangeValueError):
+            top.add_many(RangeArray([1, 2, 3]), ["a", "b"])
+        with self.assertRaises(RangeValueError):
+            top.add_many([Range(1)], ["a", "b"])
+        self.assertEqual(top.result(), [(Range(2), "b"), (Range(1), "a")])
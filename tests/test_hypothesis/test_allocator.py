@@ -0,0 +1,148 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for allocators."""
+
+# pylint: disable=protected-access
+
+import unittest
+
+from hypothesis import given, settings, strategies
+
+from justbytes import (
+    BestFitAllocator,
+    BuddyAllocator,
+    ExtentSet,
+    Range,
+    SegregatedFitAllocator,
+)
+from justbytes._allocator import _ascending, _insert, _Node, _remove
+from justbytes._errors import RangeValueError
+
+ARENA = 1 << 12
+
+OPERATIONS_STRATEGY = strategies.lists(
+    strategies.one_of(
+        strategies.tuples(
+            strategies.integers(1, 600), strategies.sampled_from([None, 1, 2, 8, 64])
+        ),
+        strategies.integers(0, 100),
+    ),
+    max_size=100,
+)
+
+
+class AllocatorTestCase(unittest.TestCase):
+    """Test allocators."""
+
+    def _check(self, allocator, operations):
+        """
+        Allocated extents are aligned, lie in the arena and never overlap,
+        and freeing everything restores a single free block.
+        """
+        live = {}
+        for operation in operations:
+            if isinstance(operation, int):
+                if live:
+                    address = sorted(live)[operation % len(live)]
+                    self.assertEqual(allocator.free(address), live.pop(address))
+                continue
+
+            (size, alignment) = operation
+            try:
+                address = allocator.allocate(size, alignment)
+            except RangeValueError:
+                continue
+            self.assertEqual(int(address) % (alignment or 1), 0)
+            live[address] = Range(allocator._allocated[int(address)][0])
+            self.assertGreaterEqual(live[address], Range(size))
+
+            extents = ExtentSet(live.items())
+            self.assertEqual(extents.size(), sum(live.values(), Range(0)))
+            self.assertTrue(
+                extents.difference(ExtentSet([(0, ARENA)])).size() == Range(0)
+            )
+            stats = allocator.stats()
+            self.assertEqual(stats.free + stats.used, Range(ARENA))
+            self.assertLessEqual(stats.largest_free, stats.free)
+
+        for address in live:
+            allocator.free(address)
+        stats = allocator.stats()
+        self.assertEqual((stats.free_blocks, stats.largest_free), (1, Range(ARENA)))
+
+    @given(OPERATIONS_STRATEGY)
+    @settings(max_examples=50)
+    def test_best_fit(self, operations):
+        """Test BestFitAllocator."""
+        self._check(BestFitAllocator(0, ARENA), operations)
+
+    @given(OPERATIONS_STRATEGY)
+    @settings(max_examples=50)
+    def test_segregated_fit(self, operations):
+        """Test SegregatedFitAllocator."""
+        self._check(SegregatedFitAllocator(0, ARENA), operations)
+
+    @given(OPERATIONS_STRATEGY)
+    @settings(max_examples=50)
+    def test_buddy(self, operations):
+        """Test BuddyAllocator."""
+        self._check(BuddyAllocator(ARENA, 8), operations)
+
+
+class IndexTestCase(unittest.TestCase):
+    """Test the AVL tree which indexes free extents."""
+
+    def _height(self, node):
+        """
+        Check that the subtree at node is ordered and balanced.
+
+        :returns: the height of the subtree
+        """
+        if node is None:
+            return 0
+        (left, right) = (self._height(node.left), self._height(node.right))
+        self.assertLessEqual(abs(left - right), 1)
+        self.assertEqual(node.height, max(left, right) + 1)
+        if node.left is not None:
+            self.assertLess(node.left.key, node.key)
+        if node.right is not None:
+            self.assertGreater(node.right.key, node.key)
+        return node.height
+
+    @given(
+        strategies.lists(
+            strategies.tuples(strategies.integers(0, 50), strategies.integers(0, 50)),
+            unique=True,
+        ),
+        strategies.data(),
+    )
+    @settings(max_examples=50)
+    def test_insert_remove(self, keys, data):
+        """The tree stays ordered and balanced."""
+        root = None
+        for key in keys:
+            root = _insert(root, _Node(key))
+            self._height(root)
+
+        removed = data.draw(strategies.permutations(keys))[: len(keys) // 2]
+        for key in removed:
+            root = _remove(root, key)
+            self._height(root)
+
+        remaining = sorted(set(keys) - set(removed))
+        self.assertEqual([node.key for node in _ascending(root, (0,))], remaining)
@@ -0,0 +1,131 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Tests for RangeArray objects."""
+
+import unittest
+
+from hypothesis import given, settings, strategies
+
+from justbytes import Range, RangeArray
+
+RANGES_STRATEGY = strategies.lists(
+    strategies.builds(
+        Range,
+        strategies.one_of(
+            strategies.integers(min_value=-(2**40), max_value=2**40),
+            strategies.fractions(max_denominator=100).filter(lambda x: abs(x) < 2**40),
+        ),
+    ),
+    max_size=20,
+)
+
+
+class ArithmeticTestCase(unittest.TestCase):
+    """Test that RangeArray arithmetic agrees with Range arithmetic."""
+
+    @given(RANGES_STRATEGY, strategies.data())
+    @settings(max_examples=50)
+    def test_binary(self, ranges, data):
+        """Test binary operations with a RangeArray operand."""
+        others = data.draw(
+            strategies.lists(
+                strategies.builds(
+                    Range, strategies.integers(min_value=1, max_value=2**20)
+                ),
+                min_size=len(ranges),
+                max_size=len(ranges),
+            )
+        )
+        (array, other_array) = (RangeArray(ranges), RangeArray(others))
+
+        self.assertEqual(
+            (array + other_array).tolist(), [x + y for (x, y) in zip(ranges, others)]
+        )
+        self.assertEqual(
+            (array - other_array).tolist(), [x - y for (x, y) in zip(ranges, others)]
+        )
+        self.assertEqual(
+            array // other_array, [x // y for (x, y) in zip(ranges, others)]
+        )
+        self.assertEqual(
+            (array % other_array).tolist(), [x % y for (x, y) in zip(ranges, others)]
+        )
+        self.assertEqual(array < other_array, [x < y for (x, y) in zip(ranges, others)])
+
+    @given(
+        RANGES_STRATEGY,
+        strategies.one_of(
+            strategies.integers(min_value=1, max_value=2**10),
+            strategies.fractions(min_value=1, max_value=2**10, max_denominator=10),
+        ),
+    )
+    @settings(max_examples=50)
+    def test_scalar(self, ranges, scalar):
+        """Test binary operations with a numeric operand."""
+        array = RangeArray(ranges)
+        self.assertEqual((array * scalar).tolist(), [x * scalar for x in ranges])
+        self.assertEqual((array / scalar).tolist(), [x / scalar for x in ranges])
+        self.assertEqual((array // scalar).tolist(), [x // scalar for x in ranges])
+        self.assertEqual((array % scalar).tolist(), [x % scalar for x in ranges])
+
+    @given(
+        strategies.lists(strategies.builds(Range, strategies.integers()), max_size=20),
+        strategies.builds(Range, strategies.integers()),
+    )
+    @settings(max_examples=50)
+    def test_unbounded(self, ranges, size):
+        """Test operations on values of any magnitude."""
+        array = RangeArray(ranges)
+        self.assertEqual(array.tolist(), ranges)
+        self.assertEqual((array + size).tolist(), [x + size for x in ranges])
+        self.assertEqual((array - size).tolist(), [x - size for x in ranges])
+        self.assertEqual(array <= size, [x <= size for x in ranges])
+
+    @given(strategies.data())
+    @settings(max_examples=100)
+    def test_wide(self, data):
+        """Test elementwise operations on columns of any width."""
+        values = strategies.one_of(
+            strategies.integers(min_value=-(2**64), max_value=2**64),
+            strategies.integers(min_value=-(2**300), max_value=2**300),
+        )
+        ranges = data.draw(strategies.lists(strategies.builds(Range, values)))
+        others = data.draw(
+            strategies.lists(
+                strategies.builds(Range, values),
+                min_size=len(ranges),
+                max_size=len(ranges),
+            )
+        )
+        factor = data.draw(values)
+        (array, other_array) = (RangeArray(ranges), RangeArray(others))
+        pairs = list(zip(ranges, others))
+
+        self.assertEqual((array + other_array).tolist(), [x + y for (x, y) in pairs])
+        self.assertEqual((other_array - array).tolist(), [y - x for (x, y) in pairs])
+        self.assertEqual((-array).tolist(), [-x for x in ranges])
+        self.assertEqual(abs(array).tolist(), [abs(x) for x in ranges])
+        self.assertEqual((array * factor).tolist(), [x * factor for x in ranges])
+        self.assertEqual(array.eq(other_array), [x == y for (x, y) in pairs])
+        self.assertEqual(array.ne(other_array), [x != y for (x, y) in pairs])
+        self.assertEqual(array < other_array, [x < y for (x, y) in pairs])
+        self.assertEqual(array <= other_array, [x <= y for (x, y) in pairs])
+        self.assertEqual(array > other_array, [x > y for (x, y) in pairs])
+        self.assertEqual(array >= other_array, [x >= y for (x, y) in pairs])
+        self.assertEqual(array == other_array, ranges == others)
+        self.assertEqual(array == RangeArray(ranges), True)
@@ -0,0 +1,61 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for ChunkBitmap."""
+
+import unittest
+
+from hypothesis import given, settings, strategies
+
+from justbytes import ChunkBitmap, ExtentSet, Range
+
+LENGTH = 3 << 16
+
+OPERATIONS_STRATEGY = strategies.lists(
+    strategies.tuples(
+        strategies.booleans(),
+        strategies.integers(0, LENGTH - 1),
+        strategies.integers(0, 1 << 17),
+    ),
+    max_size=30,
+)
+
+
+class ChunkBitmapTestCase(unittest.TestCase):
+    """Test ChunkBitmap."""
+
+    @given(OPERATIONS_STRATEGY)
+    @settings(max_examples=100)
+    def test_operations(self, operations):
+        """ChunkBitmap agrees with ExtentSet."""
+        bitmap = ChunkBitmap(LENGTH, 1)
+        extents = ExtentSet()
+        for allocate, start, maximum in operations:
+            length = min(maximum, LENGTH - start)
+            if allocate:
+                bitmap.set(start, length)
+                extents = extents | ExtentSet([(start, length)])
+            else:
+                bitmap.clear(start, length)
+                extents = extents - ExtentSet([(start, length)])
+
+        self.assertEqual(list(bitmap.allocated_runs()), list(extents))
+        self.assertEqual(list(bitmap.free_runs()), list(extents.complement(0, LENGTH)))
+        self.assertEqual(bitmap.allocated(), extents.size())
+        self.assertEqual(bitmap.allocated() + bitmap.available(), Range(LENGTH))
+        for _, start, _ in operations:
+            self.assertEqual(start in bitmap, start in extents)
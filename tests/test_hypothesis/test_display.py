@@ -0,0 +1,99 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for display implementations."""
+
+import unittest
+
+from hypothesis import given, settings, strategies
+
+import justbases
+from justbytes import (
+    ROUNDING_METHODS,
+    UNITS,
+    BaseConfig,
+    DigitsConfig,
+    DisplayConfig,
+    NativeString,
+    Range,
+    StringConfig,
+    StripConfig,
+    ValueConfig,
+)
+from tests.test_hypothesis.test_size.utils import SIZE_STRATEGY
+
+DISPLAY_CONFIG_STRATEGY = strategies.builds(
+    DisplayConfig,
+    show_approx_str=strategies.booleans(),
+    base_config=strategies.builds(
+        BaseConfig, strategies.booleans(), strategies.booleans()
+    ),
+    digits_config=strategies.builds(
+        DigitsConfig,
+        separator=strategies.sampled_from(["~", ":"]),
+        use_caps=strategies.booleans(),
+        use_letters=strategies.booleans(),
+    ),
+    strip_config=strategies.builds(
+        StripConfig, strategies.booleans(), strategies.booleans(), strategies.booleans()
+    ),
+)
+
+VALUE_CONFIG_STRATEGY = strategies.builds(
+    ValueConfig,
+    max_places=strategies.integers(0, 5),
+    binary_units=strategies.booleans(),
+    unit=strategies.one_of(strategies.none(), strategies.sampled_from(UNITS())),
+    base=strategies.sampled_from([2, 8, 10, 16]),
+    rounding_method=strategies.sampled_from(ROUNDING_METHODS()),
+)
+
+
+class NativeStringTestCase(unittest.TestCase):
+    """Test that NativeString agrees with justbases.String."""
+
+    @given(SIZE_STRATEGY, VALUE_CONFIG_STRATEGY, DISPLAY_CONFIG_STRATEGY)
+    @settings(max_examples=300)
+    def test_identical(self, size, value_config, display_config):
+        """Strings are identical for every configuration."""
+        self.assertEqual(
+            size.getString(StringConfig(value_config, display_config, NativeString)),
+            size.getString(
+                StringConfig(value_config, display_config, justbases.String)
+            ),
+        )
+
+    @given(
+        strategies.builds(
+            Range, strategies.integers(), strategies.sampled_from(UNITS())
+        ),
+        strategies.builds(
+            ValueConfig,
+            max_places=strategies.none(),
+            base=strategies.sampled_from([10, 16]),
+        ),
+        DISPLAY_CONFIG_STRATEGY,
+    )
+    @settings(max_examples=100)
+    def test_identical_exact(self, size, value_config, display_config):
+        """Strings are identical when all digits are displayed."""
+        self.assertEqual(
+            size.getString(StringConfig(value_config, display_config, NativeString)),
+            size.getString(
+                StringConfig(value_config, display_config, justbases.String)
+            ),
+        )
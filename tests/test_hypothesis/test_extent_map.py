@@ -0,0 +1,94 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for ExtentMap."""
+
+# pylint: disable=protected-access
+
+import unittest
+
+from hypothesis import given, settings, strategies
+
+from justbytes import ExtentMap, Range
+
+OPERATIONS_STRATEGY = strategies.lists(
+    strategies.tuples(
+        strategies.integers(0, 40),
+        strategies.one_of(strategies.none(), strategies.integers(1, 3)),
+    ),
+    max_size=60,
+)
+
+
+def _height(node):
+    """
+    Check the AVL invariant of a subtree.
+
+    :returns: the height of the subtree
+    :rtype: int
+    """
+    if node is None:
+        return 0
+    (left, right) = (_height(node.left), _height(node.right))
+    assert abs(left - right) <= 1
+    assert node.height == 1 + max(left, right)
+    return node.height
+
+
+class ExtentMapTestCase(unittest.TestCase):
+    """Test ExtentMap."""
+
+    @given(OPERATIONS_STRATEGY, OPERATIONS_STRATEGY)
+    @settings(max_examples=100)
+    def test_operations(self, operations, more_operations):
+        """ExtentMap agrees with a dict, and diff with a comparison."""
+
+        def apply(extents, table, operations):
+            for start, length in operations:
+                if length is None:
+                    if start in table:
+                        extents = extents.remove(start)
+                        del table[start]
+                else:
+                    extents = extents.set(start, length, length % 2)
+                    table[start] = (length, length % 2)
+            return extents
+
+        table = {}
+        extents = apply(ExtentMap(), table, operations)
+        first_table = dict(table)
+        updated = apply(extents, table, more_operations)
+
+        for version, expected in ((extents, first_table), (updated, table)):
+            _height(version._root)
+            self.assertEqual(len(version), len(expected))
+            self.assertEqual(
+                list(version),
+                [(Range(s), Range(n), p) for (s, (n, p)) in sorted(expected.items())],
+            )
+
+        def entry(value):
+            return None if value is None else (Range(value[0]), value[1])
+
+        self.assertEqual(
+            list(extents.diff(updated)),
+            [
+                (Range(s), entry(first_table.get(s)), entry(table.get(s)))
+                for s in sorted(set(first_table) | set(table))
+                if first_table.get(s) != table.get(s)
+            ],
+        )
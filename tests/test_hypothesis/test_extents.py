@@ -0,0 +1,63 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for ExtentSet."""
+
+import unittest
+
+from hypothesis import given, settings, strategies
+
+from justbytes import ExtentSet, Range
+
+EXTENTS_STRATEGY = strategies.lists(
+    strategies.tuples(strategies.integers(-50, 50), strategies.integers(0, 20))
+)
+
+
+def _addresses(extents):
+    """The set of addresses in ``extents``."""
+    return {
+        address
+        for (start, length) in extents
+        for address in range(int(start), int(start + length))
+    }
+
+
+class ExtentSetTestCase(unittest.TestCase):
+    """Test ExtentSet."""
+
+    @given(EXTENTS_STRATEGY, EXTENTS_STRATEGY)
+    @settings(max_examples=100)
+    def test_operations(self, first, second):
+        """Set operations agree with sets of addresses."""
+        (mine, theirs) = (ExtentSet(first), ExtentSet(second))
+        (my_addresses, their_addresses) = (_addresses(first), _addresses(second))
+        self.assertEqual(_addresses(mine), my_addresses)
+        self.assertEqual(mine.size(), Range(len(my_addresses)))
+        self.assertEqual(_addresses(mine | theirs), my_addresses | their_addresses)
+        self.assertEqual(_addresses(mine & theirs), my_addresses & their_addresses)
+        self.assertEqual(_addresses(mine - theirs), my_addresses - their_addresses)
+        self.assertEqual(
+            _addresses(mine.complement(-20, 40)), set(range(-20, 20)) - my_addresses
+        )
+        extents = list(mine | theirs) + list(mine & theirs) + list(mine - theirs)
+        self.assertEqual(
+            ExtentSet(extents) | ExtentSet(), ExtentSet(first) | ExtentSet(second)
+        )
+        for start, length in mine:
+            self.assertNotIn(int(start) - 1, mine)
+            self.assertNotIn(start + length, mine)
@@ -0,0 +1,58 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for compiled formatters."""
+
+import unittest
+from fractions import Fraction
+
+from hypothesis import given, settings, strategies
+
+import justbases
+from justbytes import ROUNDING_METHODS, UNITS, NativeString, StringConfig, ValueConfig
+
+from .test_display import DISPLAY_CONFIG_STRATEGY
+from .test_size.utils import SIZE_STRATEGY
+
+VALUE_CONFIG_STRATEGY = strategies.builds(
+    ValueConfig,
+    max_places=strategies.integers(0, 5),
+    min_value=strategies.sampled_from([0, 1, 10, Fraction(1, 10)]),
+    binary_units=strategies.booleans(),
+    exact_value=strategies.booleans(),
+    unit=strategies.one_of(strategies.none(), strategies.sampled_from(UNITS())),
+    base=strategies.sampled_from([2, 10, 16]),
+    rounding_method=strategies.sampled_from(ROUNDING_METHODS()),
+)
+
+
+class FormatterTestCase(unittest.TestCase):
+    """Test that a compiled formatter agrees with getString."""
+
+    @given(
+        SIZE_STRATEGY,
+        VALUE_CONFIG_STRATEGY,
+        DISPLAY_CONFIG_STRATEGY,
+        strategies.sampled_from([justbases.String, NativeString]),
+    )
+    @settings(max_examples=300)
+    def test_identical(self, size, value_config, display_config, display_impl):
+        """Strings and components are identical for every configuration."""
+        config = StringConfig(value_config, display_config, display_impl)
+        formatter = config.compile()
+        self.assertEqual(formatter(size), size.getString(config))
+        self.assertEqual(formatter.components(size), size.components(value_config))
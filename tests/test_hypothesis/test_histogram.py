@@ -0,0 +1,50 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for RangeHistogram."""
+
+import unittest
+from fractions import Fraction
+
+from hypothesis import given, settings, strategies
+
+from justbytes import UNITS, RangeArray, RangeHistogram, ValueConfig
+
+from .test_size.utils import SIZE_STRATEGY
+
+
+class RangeHistogramTestCase(unittest.TestCase):
+    """Test RangeHistogram."""
+
+    @given(
+        strategies.lists(SIZE_STRATEGY),
+        strategies.booleans(),
+        strategies.sampled_from([0, 1, 10, Fraction(1, 10), Fraction(1, 3)]),
+    )
+    @settings(max_examples=30)
+    def test_units(self, sizes, binary_units, min_value):
+        """Buckets agree with the units chosen by components."""
+        histogram = RangeHistogram.units(binary_units, min_value)
+        histogram.add_many(RangeArray(sizes))
+        config = ValueConfig(binary_units=binary_units, min_value=min_value)
+        units = [UNITS()[0]] + [
+            x for x in UNITS()[1:] if (x.abbr[-1:] == "i") == binary_units
+        ]
+        expected = [0] * len(units)
+        for size in sizes:
+            expected[units.index(size.components(config)[1])] += 1
+        self.assertEqual(histogram.counts(), expected)
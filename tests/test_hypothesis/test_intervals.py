@@ -0,0 +1,66 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for IntervalTree."""
+
+import unittest
+
+from hypothesis import given, settings, strategies
+
+from justbytes import IntervalTree, Range
+
+EXTENT_STRATEGY = strategies.tuples(
+    strategies.integers(-50, 50), strategies.integers(1, 20)
+)
+
+
+class IntervalTreeTestCase(unittest.TestCase):
+    """Test IntervalTree."""
+
+    @given(
+        strategies.lists(EXTENT_STRATEGY),
+        strategies.lists(strategies.integers(0, 100)),
+        EXTENT_STRATEGY,
+    )
+    @settings(max_examples=100)
+    def test_queries(self, extents, removals, query):
+        """Queries agree with a linear scan."""
+        tree = IntervalTree()
+        for index, (start, length) in enumerate(extents):
+            tree.insert(start, length, index)
+        present = list(enumerate(extents))
+        for removal in removals:
+            if present:
+                (index, (start, length)) = present.pop(removal % len(present))
+                tree.remove(start, length)
+                present = [x for x in present if x[0] != index]
+                present.sort(key=lambda x: (x[1][0], x[1][0] + x[1][1], x[0]))
+                self.assertEqual(len(tree), len(present))
+
+        present.sort(key=lambda x: (x[1][0], x[1][0] + x[1][1], x[0]))
+        (start, length) = query
+        expected = [
+            (s, n) for (_, (s, n)) in present if s < start + length and s + n > start
+        ]
+        self.assertEqual(
+            [(int(s), int(n)) for (s, n, _) in tree.overlap(start, length)], expected
+        )
+
+        gap = start
+        while any(s < gap + length and s + n > gap for (_, (s, n)) in present):
+            gap += 1
+        self.assertEqual(tree.find_gap(length, start), Range(gap))
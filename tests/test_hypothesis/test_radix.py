@@ -0,0 +1,81 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for conversion of rationals to Radix objects."""
+
+import unittest
+from fractions import Fraction
+
+from hypothesis import example, given, settings, strategies
+
+import justbases
+from justbytes import ROUNDING_METHODS
+from justbytes._radix import digits, from_rational
+
+
+class FromRationalTestCase(unittest.TestCase):
+    """Test that results agree with justbases."""
+
+    @given(
+        strategies.builds(
+            Fraction,
+            strategies.integers(),
+            strategies.builds(lambda x: 2**x, strategies.integers(0, 80)),
+        ),
+        strategies.sampled_from([10, 16]),
+        strategies.one_of(strategies.none(), strategies.integers(0, 8)),
+        strategies.sampled_from(ROUNDING_METHODS()),
+    )
+    @settings(max_examples=500)
+    @example(Fraction(0), 10, None, ROUNDING_METHODS()[0])
+    @example(Fraction(0), 16, 3, ROUNDING_METHODS()[0])
+    @example(Fraction(-1, 1000), 10, 2, ROUNDING_METHODS()[3])
+    @example(Fraction(5, 8), 10, 2, ROUNDING_METHODS()[1])
+    @example(Fraction(-5, 8), 10, 2, ROUNDING_METHODS()[2])
+    @example(Fraction(999, 2), 10, 0, ROUNDING_METHODS()[5])
+    def test_power_of_two(self, value, base, precision, method):
+        """Values converted directly agree with justbases."""
+        self.assertEqual(
+            from_rational(value, base, precision, method),
+            justbases.Radices.from_rational(value, base, precision, method),
+        )
+
+    @given(
+        strategies.fractions(max_denominator=1000),
+        strategies.integers(2, 16),
+        strategies.integers(0, 5),
+        strategies.sampled_from(ROUNDING_METHODS()),
+    )
+    @settings(max_examples=100)
+    def test_other(self, value, base, precision, method):
+        """Other values agree with justbases."""
+        self.assertEqual(
+            from_rational(value, base, precision, method),
+            justbases.Radices.from_rational(value, base, precision, method),
+        )
+
+
+class DigitsTestCase(unittest.TestCase):
+    """Test conversion of ints to digits."""
+
+    @given(strategies.integers(min_value=0), strategies.sampled_from([10, 16]))
+    @settings(max_examples=50)
+    def test_digits(self, value, base):
+        """Digits agree with justbases."""
+        self.assertEqual(
+            digits(value, base), justbases.Nats.convert_from_int(value, base)
+        )
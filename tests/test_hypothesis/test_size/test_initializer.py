@@ -49,3 +49,15 @@ class InitializerTestCase(unittest.TestCase):
         if factor is None:
             factor = Fraction(unit)
         self.assertEqual(Range(size, unit).magnitude, Fraction(size) * factor)
+
+    @given(
+        strategies.decimals(allow_nan=False, allow_infinity=False),
+        strategies.sampled_from(UNITS()),
+        strategies.sampled_from(["", " "]),
+    )
+    @settings(max_examples=50)
+    def test_parse(self, size, unit, space):
+        """Test parsing agrees with the initializer."""
+        self.assertEqual(
+            Range.parse(f"{size}{space}{unit}"), Range(Fraction(size), unit)
+        )
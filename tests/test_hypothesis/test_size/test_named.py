@@ -41,6 +41,7 @@ from justbytes import (
     ValueConfig,
 )
 from justbytes._constants import UNITS, BinaryUnits, DecimalUnits
+from justbytes._generators import next_or_last, takeuntil
 from tests.test_hypothesis.test_size.utils import SIZE_STRATEGY
 
 
@@ -92,6 +93,48 @@ class ComponentsTestCase(unittest.TestCase):
         else:
             self.assertEqual(unit, config.unit)
 
+    @given(
+        SIZE_STRATEGY,
+        strategies.builds(
+            ValueConfig,
+            min_value=strategies.fractions().filter(lambda x: x >= 0),
+            binary_units=strategies.booleans(),
+            exact_value=strategies.booleans(),
+            max_places=strategies.integers(min_value=0, max_value=5),
+        ),
+    )
+    @settings(max_examples=200)
+    @example(Range(1023), ValueConfig())
+    @example(Range(1024), ValueConfig())
+    @example(Range(-1024), ValueConfig())
+    @example(Range(999), ValueConfig(binary_units=False))
+    @example(Range(1000), ValueConfig(binary_units=False))
+    @example(Range(1024**9), ValueConfig(min_value=0))
+    def test_selection(self, size, config):
+        """Test that the selected unit is the one found by a linear search."""
+        limit = (
+            BinaryUnits.FACTOR if config.binary_units else DecimalUnits.FACTOR
+        ) * Fraction(config.min_value)
+        candidates = list(
+            takeuntil(
+                lambda x: abs(x[0]) < limit,
+                size.componentsList(binary_units=config.binary_units),
+            )
+        )
+        if config.exact_value:
+            expected = next_or_last(
+                lambda x: (
+                    size.getStringInfo(
+                        ValueConfig(max_places=config.max_places, unit=x[1])
+                    )[1]
+                    == 0
+                ),
+                reversed(candidates),
+            )
+        else:
+            expected = candidates[-1]
+        self.assertEqual(size.components(config), expected)
+
 
 class DisplayConfigTestCase(unittest.TestCase):
     """
@@ -22,7 +22,7 @@ import unittest
 from decimal import Decimal
 from fractions import Fraction
 
-from hypothesis import given, settings
+from hypothesis import given, settings, strategies
 
 from justbytes import Range
 from tests.test_hypothesis.test_size.utils import NUMBERS_STRATEGY, SIZE_STRATEGY
@@ -37,6 +37,12 @@ class AdditionTestCase(unittest.TestCase):
         """Test addition."""
         self.assertEqual(size_1 + size_2, Range(size_1.magnitude + size_2.magnitude))
 
+    @given(strategies.lists(SIZE_STRATEGY))
+    @settings(max_examples=10)
+    def test_sum(self, sizes):
+        """Test sum."""
+        self.assertEqual(Range.sum(sizes), sum(sizes, Range(0)))
+
 
 class DivmodTestCase(unittest.TestCase):
     """Test divmod."""
@@ -0,0 +1,47 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for QuantileSketch."""
+
+import unittest
+
+from hypothesis import given, settings, strategies
+
+from justbytes import QuantileSketch, Range
+
+
+class QuantileSketchTestCase(unittest.TestCase):
+    """Test QuantileSketch."""
+
+    @given(
+        strategies.lists(strategies.integers(-(2**90), 2**90), min_size=1),
+        strategies.fractions(0, 1),
+        strategies.booleans(),
+    )
+    @settings(max_examples=50)
+    def test_accuracy(self, values, q, binary_units):
+        """Quantiles are within the relative accuracy."""
+        sketch = QuantileSketch(binary_units=binary_units)
+        sketch.update(values)
+        restored = QuantileSketch.from_bytes(sketch.to_bytes())
+        actual = sorted(values)[int(q * (len(values) - 1))]
+        estimate = restored.quantile(q)
+        self.assertLessEqual(
+            abs(estimate - Range(actual)).magnitude,
+            # The bound holds up to floating point rounding.
+            abs(actual) * (sketch.relative_accuracy() + 1e-14) + 1,
+        )
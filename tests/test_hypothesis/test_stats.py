@@ -0,0 +1,45 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for RangeStats."""
+
+import unittest
+
+from hypothesis import given, settings, strategies
+
+from justbytes import Range, RangeStats
+
+from .test_size.utils import SIZE_STRATEGY
+
+
+class RangeStatsTestCase(unittest.TestCase):
+    """Test RangeStats."""
+
+    @given(strategies.lists(SIZE_STRATEGY, min_size=1), strategies.integers(0, 10))
+    @settings(max_examples=20)
+    def test_merge(self, sizes, split):
+        """Merged statistics agree with direct computation."""
+        stats = RangeStats(sizes[:split]).merge(RangeStats(sizes[split:]))
+        self.assertEqual(stats.count(), len(sizes))
+        self.assertEqual(stats.sum(), sum(sizes, Range(0)))
+        self.assertEqual(stats.min(), min(sizes))
+        self.assertEqual(stats.max(), max(sizes))
+        self.assertEqual(stats.mean(), sum(sizes, Range(0)) / len(sizes))
+        mean = stats.mean().magnitude
+        self.assertEqual(
+            stats.variance(), sum((x.magnitude - mean) ** 2 for x in sizes) / len(sizes)
+        )
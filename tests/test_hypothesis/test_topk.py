@@ -0,0 +1,44 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+
+"""Test for RangeTopK."""
+
+import unittest
+
+from hypothesis import given, settings, strategies
+
+from justbytes import RangeArray, RangeTopK
+
+from .test_size.utils import SIZE_STRATEGY
+
+
+class RangeTopKTestCase(unittest.TestCase):
+    """Test RangeTopK."""
+
+    @given(
+        strategies.lists(SIZE_STRATEGY),
+        strategies.integers(1, 10),
+        strategies.booleans(),
+    )
+    @settings(max_examples=30)
+    def test_result(self, sizes, k, largest):
+        """Results agree with sorting."""
+        top = RangeTopK(k, largest)
+        top.add_many(RangeArray(sizes))
+        self.assertEqual(
+            [x for (x, _) in top.result()], sorted(sizes, reverse=largest)[:k]
+        )